@@ -0,0 +1,91 @@
+"""
+DTO 를 반환하는 handler 의 응답 직렬화 비교 (req/s, 1,000 행 페이지)
+ - before: APIRoute (response_model 로 DTO 재검증 + jsonable_encoder + json.dumps)
+ - after : DtoJsonRoute (build 된 DTO 를 pydantic-core serializer 로 한 번에 JSON bytes 로)
+
+DB 비용을 빼기 위해 UserService / ProductService 는 고정된 행을 반환하는 객체로 대체한다.
+
+실행: (homework/src 에서) python -m benchmarks.bench_dto_json_response
+"""
+
+import asyncio
+import time
+from datetime import datetime, timedelta
+
+import httpx
+from fastapi import FastAPI
+
+from core.http.dto_route import use_dto_json_routes
+from products.domains.product import ProductReadRow
+from products.routers import router as product_router
+from products.services.product_service import ProductService
+from users.domains.user import UserReadRow
+from users.routers.router import router as user_router
+from users.services.user_service import UserService
+
+ROWS = 1_000
+REQUESTS = 300
+NOW = datetime(2026, 1, 1)
+
+USERS = [
+    UserReadRow(id=i, username=f"user_{i:06d}", created_at=NOW + timedelta(seconds=i))
+    for i in range(1, ROWS + 1)
+]
+PRODUCTS = [
+    ProductReadRow(
+        id=i,
+        name=f"상품 {i:06d}",
+        price=100 + i,
+        image_name=f"{i:064x}" if i % 2 else None,
+        updated_at=NOW + timedelta(seconds=i),
+    )
+    for i in range(1, ROWS + 1)
+]
+
+
+class StubUserService:
+    def get_users_page(self, limit, cursor):
+        return USERS, "next"
+
+
+class StubProductService:
+    def get_products_page(self, **kwargs):
+        return PRODUCTS, "next"
+
+
+def build_app(fast: bool) -> FastAPI:
+    app = FastAPI()
+    app.include_router(router=user_router)
+    app.include_router(router=product_router)
+    app.dependency_overrides[UserService] = StubUserService
+    app.dependency_overrides[ProductService] = StubProductService
+    if fast:
+        use_dto_json_routes(app)
+    return app
+
+
+async def measure(app: FastAPI, path: str) -> tuple[float, bytes]:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as c:
+        for _ in range(20):  # warm up
+            body = (await c.get(path)).content
+
+        started = time.perf_counter()
+        for _ in range(REQUESTS):
+            response = await c.get(path)
+            assert response.status_code == 200
+        return REQUESTS / (time.perf_counter() - started), body
+
+
+async def main() -> None:
+    for path in ("/users/", "/products"):
+        before, expected = await measure(build_app(fast=False), path)
+        after, body = await measure(build_app(fast=True), path)
+        assert body == expected
+
+        print(f"{path:10} APIRoute     : {before:8.1f} req/s")
+        print(f"{path:10} DtoJsonRoute : {after:8.1f} req/s ({after / before:.2f}x)")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
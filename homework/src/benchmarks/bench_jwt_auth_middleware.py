@@ -0,0 +1,75 @@
+"""
+/users/me/ 요청 1건당 인증 계층 오버헤드 비교
+ - before: BaseHTTPMiddleware 기반 미들웨어 + get_username 에서 토큰 재검증
+ - after : 순수 ASGI JWTAuthMiddleware + scope["state"] 의 claims 재사용
+
+DB 비용을 빼기 위해 /users/me/ 는 username 만 반환하는 라우트로 대체한다.
+
+실행: (homework/src 에서) python -m benchmarks.bench_jwt_auth_middleware
+"""
+
+import asyncio
+import time
+
+import httpx
+from fastapi import Depends, FastAPI
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from core.authenticate.services.authenticate_service import AuthenticateService
+from core.authenticate.services.token_verifier import token_verifier
+from core.middlewares.middlewares.jwt_auth_middleware import JWTAuthMiddleware
+
+REQUESTS = 3_000
+
+
+class LegacyJWTAuthMiddleware(BaseHTTPMiddleware):
+    # 교체 전 구현과 같은 경로: 검증 후 결과를 버리고 call_next
+    async def dispatch(self, request, call_next):
+        auth_header = request.headers.get("Authorization")
+        if auth_header is not None and auth_header.startswith("Bearer "):
+            payload = token_verifier.decode_access_token(auth_header.split(" ")[1])
+            token_verifier.is_valid_access_token(payload)
+        return await call_next(request)
+
+
+def build_app(middleware_class) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/users/me/")
+    async def get_me_handler(
+        username: str = Depends(AuthenticateService.get_username),
+    ):
+        return {"username": username}
+
+    app.add_middleware(middleware_class)
+    return app
+
+
+async def measure(app: FastAPI, headers: dict) -> float:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as c:
+        for _ in range(200):  # warm up
+            await c.get("/users/me/", headers=headers)
+
+        started = time.perf_counter()
+        for _ in range(REQUESTS):
+            response = await c.get("/users/me/", headers=headers)
+            assert response.status_code == 200
+        return (time.perf_counter() - started) / REQUESTS * 1_000_000
+
+
+async def main() -> None:
+    access_token = AuthenticateService.create_access_token("bench_user")
+    headers = {"Authorization": f"Bearer {access_token}"}
+
+    before = await measure(build_app(LegacyJWTAuthMiddleware), headers)
+    after = await measure(build_app(JWTAuthMiddleware), headers)
+
+    print(f"BaseHTTPMiddleware : {before:8.1f} us/request")
+    print(f"pure ASGI          : {after:8.1f} us/request")
+    print(f"saved              : {before - after:8.1f} us/request")
+    print(f"token cache        : {token_verifier.stats()}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,184 @@
+"""
+제품 목록 필터 / 이름 검색 지연 시간 비교 (1M 제품)
+ - sql   : select_products_page (ix_products_price_id / ix_products_name 사용)
+ - index : ProductCatalogIndex.query (메모리 정렬 배열 이진 탐색)
+ - search: ProductCatalogIndex.search (trigram inverted index, 오타 / 접두어 / 부분 검색)
+           (비교용 LIKE '%q%' 는 full scan 이라 SEARCH_SQL_QUERIES 개만 잰다)
+
+DB 왕복 비용이 아닌 조회 자체의 비용을 보기 위해 임시 SQLite 파일을 사용한다.
+(MySQL 에서는 네트워크 왕복이 더해지므로 sql 쪽 차이는 더 커진다)
+
+실행: (homework/src 에서) python -m benchmarks.bench_product_catalog_index
+"""
+
+import os
+import random
+import statistics
+import tempfile
+import time
+from datetime import datetime
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+
+from core.database.orm import Base
+from products.domains.product import Product
+from products.repositorys.product_catalog_index import ProductCatalogIndex
+from products.repositorys.product_repository import (
+    select_products_containing,
+    select_products_page,
+)
+
+PRODUCTS = 1_000_000
+SEED_BATCH = 50_000
+QUERIES = 2_000
+PAGE_SIZE = 20
+SEARCH_SQL_QUERIES = 20
+MAX_PRICE = 1_000_000
+ADJECTIVES = ["red", "blue", "green", "black", "white", "oak", "wooden", "steel"]
+ADJECTIVES += ["soft", "mini", "smart", "retro", "cozy", "tall", "round", "slim"]
+NOUNS = ["chair", "desk", "lamp", "sofa", "table", "shelf", "stool", "bench", "rug"]
+NOUNS += ["mirror", "clock", "vase", "bed", "mug", "kettle", "pan", "bowl", "fan"]
+NOUNS += ["cabinet", "drawer", "pillow", "blanket", "curtain", "basket", "tray"]
+TYPOS = {"chair": "chiar", "table": "tabel", "mirror": "miror", "kettle": "ketle"}
+
+
+def product_name(rng: random.Random) -> str:
+    name = f"{rng.choice(ADJECTIVES)} {rng.choice(NOUNS)} {rng.randint(1, 999)}"
+    return name[:16]
+
+
+def seed(session_factory: sessionmaker) -> None:
+    updated_at = datetime(2024, 1, 1)
+    rng = random.Random(0)
+    with session_factory() as session:
+        for start in range(0, PRODUCTS, SEED_BATCH):
+            session.execute(
+                insert(Product),
+                [
+                    {
+                        "name": product_name(rng),
+                        "price": rng.randint(100, MAX_PRICE),
+                        "updated_at": updated_at,
+                    }
+                    for i in range(start, start + SEED_BATCH)
+                ],
+            )
+        session.commit()
+
+
+def make_queries() -> list[dict]:
+    rng = random.Random(1)
+    queries = []
+    for _ in range(QUERIES):
+        kind = rng.choice(("max_price", "cursor", "name", "name_prefix"))
+        if kind == "max_price":
+            queries.append({"max_price": rng.randint(100, MAX_PRICE)})
+        elif kind == "cursor":
+            queries.append(
+                {"after": (rng.randint(100, MAX_PRICE), rng.randint(1, PRODUCTS))}
+            )
+        elif kind == "name":
+            queries.append({"name": product_name(rng)})
+        else:
+            queries.append(
+                {
+                    "name_prefix": f"{rng.choice(ADJECTIVES)} {rng.choice(NOUNS)}",
+                    "max_price": rng.randint(100, MAX_PRICE),
+                }
+            )
+    return queries
+
+
+def make_search_queries() -> list[dict]:
+    rng = random.Random(2)
+    queries = []
+    for _ in range(QUERIES):
+        noun = rng.choice(NOUNS)
+        kind = rng.choice(("exact", "typo", "prefix", "model"))
+        if kind == "exact":
+            query = f"{rng.choice(ADJECTIVES)} {noun}"
+        elif kind == "typo":
+            query = f"{rng.choice(ADJECTIVES)} {TYPOS.get(noun, noun[::-1])}"
+        elif kind == "prefix":
+            query = noun[:3]
+        else:
+            query = f"{noun} {rng.randint(1, 999)}"
+        queries.append(
+            {"query": query, "max_price": rng.choice((None, MAX_PRICE // 10))}
+        )
+    return queries
+
+
+def measure(run, queries: list[dict]) -> list[float]:
+    latencies = []
+    for query in queries:
+        started = time.perf_counter()
+        run(query)
+        latencies.append(time.perf_counter() - started)
+    return latencies
+
+
+def report(name: str, latencies: list[float]) -> None:
+    latencies = sorted(latencies)
+    p99 = latencies[int(len(latencies) * 0.99) - 1]
+    print(
+        f"{name:6} p50: {statistics.median(latencies) * 1e6:9.1f} us  "
+        f"p99: {p99 * 1e6:9.1f} us  "
+        f"mean: {statistics.fmean(latencies) * 1e6:9.1f} us"
+    )
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{os.path.join(tmp, 'bench.db')}")
+        Base.metadata.create_all(engine)
+        session_factory = sessionmaker(bind=engine)
+
+        started = time.perf_counter()
+        seed(session_factory)
+        print(f"seed   {PRODUCTS} products: {time.perf_counter() - started:.1f} s")
+
+        index = ProductCatalogIndex()
+        started = time.perf_counter()
+        index.rebuild(session_factory)
+        print(f"build  {len(index)} products: {time.perf_counter() - started:.1f} s")
+
+        queries = make_queries()
+        with session_factory() as session:
+
+            def run_sql(query: dict) -> None:
+                session.execute(
+                    select_products_page(limit=PAGE_SIZE + 1, **query)
+                ).all()
+
+            report("sql", measure(run_sql, queries))
+
+        report(
+            "index",
+            measure(lambda query: index.query(limit=PAGE_SIZE + 1, **query), queries),
+        )
+
+        search_queries = make_search_queries()
+        with session_factory() as session:
+
+            def run_sql_search(query: dict) -> None:
+                session.execute(
+                    select_products_containing(
+                        query=query["query"], max_price=query["max_price"]
+                    )
+                ).all()
+
+            report("like", measure(run_sql_search, search_queries[:SEARCH_SQL_QUERIES]))
+
+        report(
+            "search",
+            measure(
+                lambda query: index.search(limit=PAGE_SIZE, **query), search_queries
+            ),
+        )
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+유저 조회 경로 비교 (rows/sec)
+ - entity    : User ORM 엔티티 로드 (identity map 등록) -> UserResponseDto.build
+ - projection: id, username, created_at 컬럼만 Row 로 조회 -> UserResponseDto.build
+
+DB 왕복 비용이 아닌 ORM 오버헤드를 보기 위해 임시 SQLite 파일을 사용한다.
+
+실행: (homework/src 에서) python -m benchmarks.bench_user_read_path
+"""
+
+import os
+import random
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+
+from core.database.orm import Base
+from users.domains.user import User
+from users.dtos.responses import UserResponseDto
+from users.repositorys.user_repository import UserRepository
+
+USERS = 20_000
+PAGE_SIZE = 100
+PAGES = 300
+LOOKUPS = 5_000
+PASSWORD_HASH = "$2b$12$" + "a" * 53
+
+
+def seed(session_factory: sessionmaker) -> None:
+    started_at = datetime(2024, 1, 1)
+    with session_factory() as session:
+        session.execute(
+            insert(User),
+            [
+                {
+                    "username": f"bench_{i}",
+                    "password": PASSWORD_HASH,
+                    "created_at": started_at + timedelta(seconds=i),
+                }
+                for i in range(USERS)
+            ],
+        )
+        session.commit()
+
+
+def bench_list(session_factory: sessionmaker, projected: bool) -> float:
+    started = time.perf_counter()
+    for page in range(PAGES):
+        with session_factory() as session:
+            repo = UserRepository(db=session)
+            if projected:
+                users = repo.get_user_rows_page(limit=PAGE_SIZE)
+            else:
+                users = (
+                    session.query(User)
+                    .order_by(User.created_at, User.id)
+                    .limit(PAGE_SIZE)
+                    .all()
+                )
+            [UserResponseDto.build(user=user) for user in users]
+    return PAGES * PAGE_SIZE / (time.perf_counter() - started)
+
+
+def bench_single(session_factory: sessionmaker, projected: bool) -> float:
+    user_ids = [random.randint(1, USERS) for _ in range(LOOKUPS)]
+    started = time.perf_counter()
+    for user_id in user_ids:
+        with session_factory() as session:
+            repo = UserRepository(db=session)
+            if projected:
+                user = repo.get_user_row_by_id(user_id=user_id)
+            else:
+                user = repo.get_user_by_id(user_id=user_id)
+            UserResponseDto.build(user=user)
+    return LOOKUPS / (time.perf_counter() - started)
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{os.path.join(tmp, 'bench.db')}")
+        Base.metadata.create_all(engine)
+        session_factory = sessionmaker(bind=engine, expire_on_commit=False)
+        seed(session_factory)
+
+        for name, bench in (("list", bench_list), ("single", bench_single)):
+            entity = bench(session_factory, projected=False)
+            projection = bench(session_factory, projected=True)
+            print(
+                f"{name:6} entity: {entity:10.0f} rows/s  "
+                f"projection: {projection:10.0f} rows/s  "
+                f"(x{projection / entity:.2f})"
+            )
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,24 @@
+import math
+
 from fastapi.exceptions import RequestValidationError
 from fastapi.responses import PlainTextResponse, JSONResponse
 from fastapi import status
+from sqlalchemy.orm.exc import StaleDataError
 
+from core.authenticate.exceptions.custom_exceptions import (
+    PasswordHashPoolBusyException,
+    PasswordHashTimeoutException,
+)
+from core.database.exceptions.custom_exceptions import InvalidCursorException
 from core.middlewares.exceptions.custom_exceptions import InvalidRefreshTokenException
+from core.storage.exceptions.custom_exceptions import ContentTooLargeException
+from products.exceptions.custom_exceptions import ProductNotFoundException
 from users.exceptions.custom_exceptions import (
     UserNotFoundException,
     InvalidPasswordException,
+    InvalidOtpException,
+    OtpAttemptLimitException,
+    OtpRequestLimitException,
 )
 
 
@@ -14,6 +27,21 @@ def attach_exception_handlers(app):
     async def validation_exception_handler(request, exc):
         return PlainTextResponse(str(exc), status_code=status.HTTP_400_BAD_REQUEST)
 
+    @app.exception_handler(InvalidCursorException)
+    async def invalid_cursor_exception_handler(request, exc):
+        return JSONResponse(
+            content=str(exc),
+            status_code=status.HTTP_400_BAD_REQUEST,
+        )
+
+    # 다른 요청이 먼저 같은 row 를 고쳤다 (version_id_col 낙관적 잠금)
+    @app.exception_handler(StaleDataError)
+    async def stale_data_exception_handler(request, exc):
+        return JSONResponse(
+            content="The resource was modified by another request",
+            status_code=status.HTTP_409_CONFLICT,
+        )
+
     # User API Exception
     @app.exception_handler(UserNotFoundException)
     async def user_not_found_exception_handler(request, exc):
@@ -22,6 +50,43 @@ def attach_exception_handlers(app):
             status_code=status.HTTP_404_NOT_FOUND,
         )
 
+    @app.exception_handler(InvalidOtpException)
+    async def invalid_otp_exception_handler(request, exc):
+        return JSONResponse(
+            content=str(exc),
+            status_code=status.HTTP_400_BAD_REQUEST,
+        )
+
+    @app.exception_handler(OtpAttemptLimitException)
+    async def otp_attempt_limit_exception_handler(request, exc):
+        return JSONResponse(
+            content=str(exc),
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+        )
+
+    @app.exception_handler(OtpRequestLimitException)
+    async def otp_request_limit_exception_handler(request, exc):
+        return JSONResponse(
+            content=str(exc),
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            headers={"Retry-After": str(math.ceil(exc.retry_after))},
+        )
+
+    # Product API Exception
+    @app.exception_handler(ProductNotFoundException)
+    async def product_not_found_exception_handler(request, exc):
+        return JSONResponse(
+            content=str(exc),
+            status_code=status.HTTP_404_NOT_FOUND,
+        )
+
+    @app.exception_handler(ContentTooLargeException)
+    async def content_too_large_exception_handler(request, exc):
+        return JSONResponse(
+            content=str(exc),
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+        )
+
     # JWT Middleware Exception
     @app.exception_handler(InvalidPasswordException)
     async def user_not_found_exception_handler(request, exc):
@@ -36,3 +101,19 @@ def attach_exception_handlers(app):
             content=str(exc),
             status_code=status.HTTP_403_FORBIDDEN,
         )
+
+    # Password Hash Pool Exception
+    @app.exception_handler(PasswordHashPoolBusyException)
+    async def password_hash_pool_busy_exception_handler(request, exc):
+        return JSONResponse(
+            content=str(exc),
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            headers={"Retry-After": "1"},
+        )
+
+    @app.exception_handler(PasswordHashTimeoutException)
+    async def password_hash_timeout_exception_handler(request, exc):
+        return JSONResponse(
+            content=str(exc),
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        )
@@ -0,0 +1,85 @@
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
+
+from core.authenticate.services.password_hash_pool import password_hash_pool
+from core.config import settings
+from core.database.connection import SessionFactory
+from core.email.services.email_outbox_dispatcher import email_outbox_dispatcher
+from products.repositorys.product_catalog_index import (
+    product_catalog_index,
+    prune_product_tombstones,
+)
+from products.repositorys.product_image_storage import product_image_storage
+from users.repositorys.user_availability_filter import user_availability_filter
+
+logger = logging.getLogger(__name__)
+
+
+async def rebuild_user_availability_filter_periodically():
+    # 시작 시 한 번 만들고, 다른 워커의 쓰기를 반영하기 위해 주기적으로 다시 만든다
+    while True:
+        try:
+            await asyncio.to_thread(user_availability_filter.rebuild, SessionFactory)
+        except Exception:
+            logger.exception("user availability filter rebuild failed")
+        await asyncio.sleep(settings.user_bloom_rebuild_seconds)
+
+
+async def refresh_product_catalog_index_periodically():
+    # 시작 시 전체를 읽고 이후에는 바뀐 / 삭제된 제품만 읽는다 (가끔 전체를 다시 읽는다)
+    rebuilt_at = None
+    while True:
+        try:
+            now = time.monotonic()
+            if (
+                rebuilt_at is None
+                or now - rebuilt_at >= settings.product_catalog_rebuild_seconds
+            ):
+                await asyncio.to_thread(product_catalog_index.rebuild, SessionFactory)
+                rebuilt_at = now
+                await asyncio.to_thread(
+                    prune_product_tombstones,
+                    SessionFactory,
+                    settings.product_catalog_tombstone_retention_seconds,
+                )
+            else:
+                await asyncio.to_thread(product_catalog_index.refresh, SessionFactory)
+        except Exception:
+            logger.exception("product catalog index refresh failed")
+        await asyncio.sleep(settings.product_catalog_refresh_seconds)
+
+
+async def apply_product_catalog_writes():
+    # 이 워커의 쓰기를 잠깐 모았다가 한 번에 반영한다 (쓰기마다 색인을 복사하지 않는다)
+    while True:
+        if await product_catalog_index.wait_for_changes(
+            timeout=settings.product_catalog_refresh_seconds
+        ):
+            await asyncio.sleep(settings.product_catalog_apply_delay_seconds)
+            try:
+                await asyncio.to_thread(product_catalog_index.apply_pending)
+            except Exception:
+                logger.exception("product catalog index apply failed")
+
+
+@asynccontextmanager
+async def lifespan(app):
+    tasks = [asyncio.create_task(rebuild_user_availability_filter_periodically())]
+    if settings.product_catalog_index_enabled:
+        tasks.append(asyncio.create_task(refresh_product_catalog_index_periodically()))
+        tasks.append(asyncio.create_task(apply_product_catalog_writes()))
+    if settings.email_outbox_enabled:
+        for _ in range(settings.email_outbox_workers):
+            tasks.append(asyncio.create_task(email_outbox_dispatcher.run_worker()))
+    yield
+    for task in tasks:
+        task.cancel()
+    password_hash_pool.shutdown()
+    product_image_storage.thumbnails.shutdown()
+    email_outbox_dispatcher.smtp_pool.close()
+
+
+def attach_lifespan_handlers(app):
+    app.router.lifespan_context = lifespan
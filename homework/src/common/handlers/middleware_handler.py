@@ -1,5 +1,37 @@
+from core.cache.response_cache import response_cache
+from core.config import settings
+from core.http.compression import compression_stats
+from core.middlewares.middlewares.compression_middleware import CompressionMiddleware
 from core.middlewares.middlewares.jwt_auth_middleware import JWTAuthMiddleware
+from core.middlewares.middlewares.response_cache_middleware import (
+    ResponseCacheMiddleware,
+)
+from core.middlewares.middlewares.upload_limit_middleware import (
+    UploadLimitMiddleware,
+)
 
 
 def attach_middleware_handlers(app):
+    # 나중에 추가한 미들웨어가 바깥쪽이다: 응답 캐시 -> 압축 -> 인증 -> 업로드 제한 -> app
+    # (캐시 hit 은 압축된 bytes 를 그대로 보내고 압축 / 인증 미들웨어를 거치지 않는다)
+    product_image_body_bytes = (
+        settings.product_image_max_bytes + settings.upload_form_overhead_bytes
+    )
+    app.add_middleware(
+        UploadLimitMiddleware,
+        limits={
+            "/products/file/": product_image_body_bytes,
+            "/async/products/file/": product_image_body_bytes,
+        },
+    )
     app.add_middleware(JWTAuthMiddleware)
+    if settings.compression_enabled:
+        app.add_middleware(
+            CompressionMiddleware,
+            minimum_size=settings.compression_minimum_size,
+            levels=settings.compression_levels,
+            route_levels=settings.compression_route_levels,
+            stats=compression_stats,
+        )
+    if settings.response_cache_enabled:
+        app.add_middleware(ResponseCacheMiddleware, cache=response_cache)
@@ -0,0 +1,6 @@
+from core.http.dto_route import use_dto_json_routes
+
+
+def attach_response_handlers(app):
+    # DTO 를 반환하는 handler 는 재검증 없이 한 번에 JSON 으로 만든다 (router 를 붙인 뒤에 호출)
+    use_dto_json_routes(app)
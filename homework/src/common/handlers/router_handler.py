@@ -1,9 +1,13 @@
 from users.routers.router import router as user_router
 from products.routers import router as product_router
+from products.routers_async import router as product_router_async
 from users.routers.router_async import router as user_router_async
+from core.metrics.routers import router as metrics_router
 
 
 def attach_router_handlers(app):
     app.include_router(router=user_router)
     app.include_router(router=product_router)
     app.include_router(router=user_router_async)
+    app.include_router(router=product_router_async)
+    app.include_router(router=metrics_router)
@@ -0,0 +1,8 @@
+class PasswordHashPoolBusyException(Exception):
+    def __init__(self):
+        super().__init__("Password hashing queue is full")
+
+
+class PasswordHashTimeoutException(Exception):
+    def __init__(self):
+        super().__init__("Password hashing timed out")
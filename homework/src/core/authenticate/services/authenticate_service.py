@@ -1,5 +1,4 @@
-import bcrypt
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import (
     HTTPBasic,
     HTTPAuthorizationCredentials,
@@ -9,29 +8,45 @@ from fastapi.security import (
 import time
 import jwt
 
-from core.authenticate.constants import (
-    JWT_ALGORITHM,
-    JWT_SECRET_KEY,
-    JWT_EXPIRY_SECONDS,
-    JWT_REFRESH_EXPIRY_SECONDS,
-)
+from core.authenticate.constants import JWT_ALGORITHM, JWT_SECRET_KEY
 from core.authenticate.dtos.responses import JwtPayloadTypedDict
+from core.authenticate.services import password_hash_pool as hashing
+from core.authenticate.services.password_hash_pool import password_hash_pool
+from core.authenticate.services.token_verifier import token_verifier
+from core.middlewares.constants.jwt_middleware_constants import (
+    JWT_CLAIMS_STATE_KEY,
+    JWT_AUTH_ERROR_STATE_KEY,
+)
 
 basic_auth = HTTPBasic()
 
 
 class AuthenticateService:
     @staticmethod
-    def hash_password(plain_password: str):
-        plain_password_bytes = plain_password.encode("UTF-8")
-        hashed_password = bcrypt.hashpw(plain_password_bytes, bcrypt.gensalt())
-        return hashed_password.decode("UTF-8")
+    def hash_password(plain_password: str) -> str:
+        return password_hash_pool.run(hashing.hash_password, plain_password)
 
     @staticmethod
     def check_password(input_password: str, hashed_password: str) -> bool:
-        return bcrypt.checkpw(
-            input_password.encode("UTF-8"),
-            hashed_password.encode("UTF-8"),
+        return password_hash_pool.run(
+            hashing.check_password, input_password, hashed_password
+        )
+
+    @staticmethod
+    def hash_passwords(plain_passwords: list[str]) -> list[str]:
+        return password_hash_pool.map(
+            hashing.hash_password, [(password,) for password in plain_passwords]
+        )
+
+    # async 라우터에서는 이벤트 루프를 막지 않도록 아래 메서드를 사용한다
+    @staticmethod
+    async def hash_password_async(plain_password: str) -> str:
+        return await password_hash_pool.run_async(hashing.hash_password, plain_password)
+
+    @staticmethod
+    async def check_password_async(input_password: str, hashed_password: str) -> bool:
+        return await password_hash_pool.run_async(
+            hashing.check_password, input_password, hashed_password
         )
 
     @staticmethod
@@ -60,21 +75,13 @@ class AuthenticateService:
             algorithm=JWT_ALGORITHM,
         )
 
-    @staticmethod
-    def _decode_token(token: JwtPayloadTypedDict) -> dict:
-        return jwt.decode(
-            jwt=token,
-            key=JWT_SECRET_KEY,
-            algorithms=[JWT_ALGORITHM],
-        )
-
     @staticmethod
     def is_valid_access_token(payload: JwtPayloadTypedDict) -> bool:
-        return time.time() < payload["isa"] + JWT_EXPIRY_SECONDS
+        return token_verifier.is_valid_access_token(payload)
 
     @staticmethod
     def is_valid_refresh_token(payload: JwtPayloadTypedDict) -> bool:
-        return time.time() < payload["isa"] + JWT_REFRESH_EXPIRY_SECONDS
+        return token_verifier.is_valid_refresh_token(payload)
 
     @staticmethod
     def _get_access_jwt(
@@ -100,8 +107,10 @@ class AuthenticateService:
             )
         return auth_header
 
+    # 스레드풀을 거치지 않도록 async 로 선언 (블로킹 I/O 없음)
     @staticmethod
-    def get_username(
+    async def get_username(
+        request: Request,
         access_token_in_header: HTTPAuthorizationCredentials = Depends(
             HTTPBearer(auto_error=False)
         ),
@@ -109,17 +118,28 @@ class AuthenticateService:
             APIKeyHeader(name="X-Refresh-Token", auto_error=False)
         ),
     ):
-        access_token = AuthenticateService._get_access_jwt(access_token_in_header)
-        access_token_payload = AuthenticateService._decode_token(access_token)
-
-        refresh_token = AuthenticateService._get_refresh_jwt(refresh_token_in_header)
-        refresh_token_payload = AuthenticateService._decode_token(refresh_token)
+        # JWTAuthMiddleware 가 검증해 둔 결과가 있으면 다시 decode 하지 않는다
+        state = request.scope.get("state", {})
+        if JWT_CLAIMS_STATE_KEY in state:
+            return state[JWT_CLAIMS_STATE_KEY].get("username")
+        if JWT_AUTH_ERROR_STATE_KEY in state:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail=state[JWT_AUTH_ERROR_STATE_KEY],
+            )
 
-        if not AuthenticateService.is_valid_access_token(
-            access_token_payload
-        ) and not AuthenticateService.is_valid_refresh_token(refresh_token_payload):
+        access_token = AuthenticateService._get_access_jwt(access_token_in_header)
+        access_token_payload = token_verifier.decode_access_token(access_token)
 
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED, detail="Token Expired"
+        # access 토큰이 유효하면 refresh 토큰은 검증하지 않는다
+        if not AuthenticateService.is_valid_access_token(access_token_payload):
+            refresh_token = AuthenticateService._get_refresh_jwt(
+                refresh_token_in_header
             )
+            refresh_token_payload = token_verifier.decode_refresh_token(refresh_token)
+
+            if not AuthenticateService.is_valid_refresh_token(refresh_token_payload):
+                raise HTTPException(
+                    status_code=status.HTTP_401_UNAUTHORIZED, detail="Token Expired"
+                )
         return access_token_payload.get("username")
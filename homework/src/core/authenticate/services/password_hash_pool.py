@@ -0,0 +1,138 @@
+import asyncio
+import threading
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable
+
+import bcrypt
+
+from core.authenticate.exceptions.custom_exceptions import (
+    PasswordHashPoolBusyException,
+    PasswordHashTimeoutException,
+)
+from core.config import settings
+
+
+# 프로세스 풀에서 실행되는 함수 (pickle 가능해야 하므로 모듈 최상단에 정의)
+def hash_password(plain_password: str) -> str:
+    hashed_password = bcrypt.hashpw(plain_password.encode("UTF-8"), bcrypt.gensalt())
+    return hashed_password.decode("UTF-8")
+
+
+def check_password(input_password: str, hashed_password: str) -> bool:
+    return bcrypt.checkpw(
+        input_password.encode("UTF-8"),
+        hashed_password.encode("UTF-8"),
+    )
+
+
+def _apply_chunk(fn: Callable[..., Any], chunk: list[tuple]) -> list[Any]:
+    return [fn(*args) for args in chunk]
+
+
+class PasswordHashPool:
+    """
+    bcrypt 연산을 이벤트 루프/스레드풀 밖의 프로세스 풀에서 실행한다.
+     - 실행 중 + 대기 중인 작업 수를 max_workers + max_pending 으로 제한한다
+     - 자리가 없으면 기다리지 않고 PasswordHashPoolBusyException 을 던진다
+    """
+
+    def __init__(self, max_workers: int, max_pending: int, timeout: float):
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self._slots = threading.BoundedSemaphore(max_workers + max_pending)
+        self._executor: ProcessPoolExecutor | None = None
+        self._lock = threading.Lock()
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        # import 시점이 아닌 첫 사용 시점에 워커 프로세스를 띄운다
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+        return self._executor
+
+    def submit(
+        self, fn: Callable[..., Any], *args: Any, blocking: bool = False
+    ) -> Future:
+        # blocking=True 는 대량 작업용: 자리가 날 때까지 timeout 만큼 기다린다
+        acquired = (
+            self._slots.acquire(timeout=self.timeout)
+            if blocking
+            else self._slots.acquire(blocking=False)
+        )
+        if not acquired:
+            raise PasswordHashPoolBusyException()
+
+        try:
+            future = self._get_executor().submit(fn, *args)
+        except BrokenProcessPool:
+            # 워커가 비정상 종료된 풀은 버리고 다음 요청에서 새로 만든다
+            self._executor = None
+            self._slots.release()
+            raise
+        except BaseException:
+            self._slots.release()
+            raise
+
+        future.add_done_callback(lambda _: self._slots.release())
+        return future
+
+    def run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        future = self.submit(fn, *args)
+        try:
+            return future.result(timeout=self.timeout)
+        except TimeoutError:
+            future.cancel()
+            raise PasswordHashTimeoutException()
+
+    async def run_async(self, fn: Callable[..., Any], *args: Any) -> Any:
+        future = self.submit(fn, *args)
+        try:
+            return await asyncio.wait_for(
+                asyncio.wrap_future(future), timeout=self.timeout
+            )
+        except TimeoutError:
+            raise PasswordHashTimeoutException()
+
+    def map(
+        self, fn: Callable[..., Any], args_list: list[tuple], chunksize: int = 16
+    ) -> list[Any]:
+        """
+        대량 작업(bulk import 등)을 chunk 단위로 나눠 모든 워커에 분산한다.
+        동시에 최대 max_workers 개의 chunk 만 올리므로 대기열 자리는 로그인 요청용으로 남는다.
+        """
+        results = []
+        in_flight: deque[Future] = deque()
+        try:
+            for start in range(0, len(args_list), chunksize):
+                if len(in_flight) >= self.max_workers:
+                    results.extend(
+                        in_flight.popleft().result(timeout=self.timeout * chunksize)
+                    )
+                chunk = args_list[start : start + chunksize]
+                in_flight.append(self.submit(_apply_chunk, fn, chunk, blocking=True))
+
+            while in_flight:
+                results.extend(
+                    in_flight.popleft().result(timeout=self.timeout * chunksize)
+                )
+        except TimeoutError:
+            for future in in_flight:
+                future.cancel()
+            raise PasswordHashTimeoutException()
+        return results
+
+    def shutdown(self) -> None:
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True, cancel_futures=True)
+                self._executor = None
+
+
+password_hash_pool = PasswordHashPool(
+    max_workers=settings.password_hash_pool_size,
+    max_pending=settings.password_hash_queue_size,
+    timeout=settings.password_hash_timeout_seconds,
+)
@@ -0,0 +1,109 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+
+import jwt
+
+from core.authenticate.constants import (
+    JWT_ALGORITHM,
+    JWT_SECRET_KEY,
+    JWT_EXPIRY_SECONDS,
+    JWT_REFRESH_EXPIRY_SECONDS,
+)
+from core.authenticate.dtos.responses import JwtPayloadTypedDict
+from core.config import settings
+from core.metrics.registry import metrics_registry
+
+
+class TokenVerifier:
+    """
+    서명 검증이 끝난 JWT payload 를 LRU + TTL 캐시에 보관한다.
+     - key: 토큰 원문이 아닌 sha256 digest
+     - 만료: min(캐시 TTL, isa + 토큰 유효기간) -> 만료된 토큰은 캐시에 남지 않는다
+     - JWTAuthMiddleware 와 AuthenticateService.get_username 이 같은 인스턴스를 사용한다
+    """
+
+    def __init__(self, maxsize: int, ttl_seconds: float):
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._cache: OrderedDict[bytes, tuple[float, JwtPayloadTypedDict]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def decode_access_token(self, token: str) -> JwtPayloadTypedDict:
+        return self._decode(token, expiry_seconds=JWT_EXPIRY_SECONDS)
+
+    def decode_refresh_token(self, token: str) -> JwtPayloadTypedDict:
+        return self._decode(token, expiry_seconds=JWT_REFRESH_EXPIRY_SECONDS)
+
+    @staticmethod
+    def is_valid_access_token(payload: JwtPayloadTypedDict) -> bool:
+        return time.time() < payload["isa"] + JWT_EXPIRY_SECONDS
+
+    @staticmethod
+    def is_valid_refresh_token(payload: JwtPayloadTypedDict) -> bool:
+        return time.time() < payload["isa"] + JWT_REFRESH_EXPIRY_SECONDS
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._cache),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+
+    def _decode(self, token: str, expiry_seconds: int) -> JwtPayloadTypedDict:
+        key = hashlib.sha256(token.encode("UTF-8")).digest()
+        now = time.time()
+
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is not None:
+                expires_at, payload = entry
+                if now < expires_at:
+                    self._cache.move_to_end(key)
+                    self.hits += 1
+                    return payload
+                del self._cache[key]
+            self.misses += 1
+
+        # 서명 검증은 lock 밖에서 수행한다
+        payload: JwtPayloadTypedDict = jwt.decode(
+            jwt=token,
+            key=JWT_SECRET_KEY,
+            algorithms=[JWT_ALGORITHM],
+        )
+
+        expires_at = min(now + self.ttl_seconds, payload["isa"] + expiry_seconds)
+        if expires_at <= now:
+            return payload
+
+        with self._lock:
+            self._cache[key] = (expires_at, payload)
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.maxsize:
+                self._cache.popitem(last=False)
+                self.evictions += 1
+
+        return payload
+
+
+token_verifier = TokenVerifier(
+    maxsize=settings.jwt_cache_maxsize,
+    ttl_seconds=settings.jwt_cache_ttl_seconds,
+)
+metrics_registry.register("jwt.token_cache", token_verifier.stats)
@@ -0,0 +1,227 @@
+import threading
+import time
+from collections import OrderedDict
+
+from core.config import settings
+
+# DECR 은 ttl 을 유지한다
+_DECR_IF_EXISTS = """
+if redis.call('EXISTS', KEYS[1]) == 1 then
+    return redis.call('DECR', KEYS[1])
+end
+return 0
+"""
+
+
+class InMemoryCacheBackend:
+    """
+    프로세스 내부 LRU + TTL 캐시 (Redis 가 없는 로컬/테스트 환경용)
+    async 메서드는 같은 동작을 그대로 감싼다 (I/O 가 없으므로 루프를 막지 않는다)
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._entries: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> bytes | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: bytes, ttl_seconds: float) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def delete(self, *keys: str) -> None:
+        with self._lock:
+            for key in keys:
+                self._entries.pop(key, None)
+
+    # 없을 때만 저장한다 (저장했으면 True). 읽고 쓰는 사이에 다른 쓰기가 끼어들지 않는다
+    def add(self, key: str, value: bytes, ttl_seconds: float) -> bool:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > now:
+                return False
+            self._entries[key] = (now + ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+            return True
+
+    # 있는 key 의 만료 시각만 늘린다 (없거나 만료됐으면 False)
+    def expire(self, key: str, ttl_seconds: float) -> bool:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= now:
+                return False
+            self._entries[key] = (now + ttl_seconds, entry[1])
+            self._entries.move_to_end(key)
+            return True
+
+    # 남은 ttl (초). 없거나 만료됐으면 None
+    def ttl(self, key: str) -> float | None:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= now:
+                return None
+            return entry[0] - now
+
+    # 카운터 +1 (없거나 만료됐으면 1 부터 시작하고 ttl 을 건다, 이후에는 만료 시각을 유지한다)
+    def incr(self, key: str, ttl_seconds: float) -> int:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= now:
+                expires_at, count = now + ttl_seconds, 1
+            else:
+                expires_at, count = entry[0], int(entry[1]) + 1
+            self._entries[key] = (expires_at, str(count).encode())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+            return count
+
+    # 카운터 -1 (만료 시각은 그대로, 없거나 만료됐으면 아무것도 하지 않고 0)
+    def decr(self, key: str) -> int:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= now:
+                return 0
+            count = int(entry[1]) - 1
+            self._entries[key] = (entry[0], str(count).encode())
+            return count
+
+    async def aget(self, key: str) -> bytes | None:
+        return self.get(key)
+
+    async def aset(self, key: str, value: bytes, ttl_seconds: float) -> None:
+        self.set(key, value, ttl_seconds)
+
+    async def adelete(self, *keys: str) -> None:
+        self.delete(*keys)
+
+    async def aadd(self, key: str, value: bytes, ttl_seconds: float) -> bool:
+        return self.add(key, value, ttl_seconds)
+
+    async def aexpire(self, key: str, ttl_seconds: float) -> bool:
+        return self.expire(key, ttl_seconds)
+
+    async def attl(self, key: str) -> float | None:
+        return self.ttl(key)
+
+    async def aincr(self, key: str, ttl_seconds: float) -> int:
+        return self.incr(key, ttl_seconds)
+
+    async def adecr(self, key: str) -> int:
+        return self.decr(key)
+
+
+class RedisCacheBackend:
+    """
+    Redis 캐시 (docker-compose 의 redis 서비스)
+    sync 라우터는 redis.Redis, async 라우터는 redis.asyncio.Redis 를 사용한다
+    """
+
+    def __init__(self, url: str):
+        try:
+            import redis
+            import redis.asyncio
+        except ImportError as exc:  # pragma: no cover - 선택 의존성
+            raise RuntimeError(
+                "cache_backend=redis 를 사용하려면 redis 패키지를 설치해야 한다"
+            ) from exc
+
+        self._client = redis.Redis.from_url(url)
+        self._async_client = redis.asyncio.Redis.from_url(url)
+        # 없는 key 를 DECR 하면 ttl 없는 -1 이 생기므로 있을 때만 줄인다
+        self._decr = self._client.register_script(_DECR_IF_EXISTS)
+        self._adecr = self._async_client.register_script(_DECR_IF_EXISTS)
+
+    def get(self, key: str) -> bytes | None:
+        return self._client.get(key)
+
+    def set(self, key: str, value: bytes, ttl_seconds: float) -> None:
+        self._client.set(key, value, px=int(ttl_seconds * 1000))
+
+    def delete(self, *keys: str) -> None:
+        if keys:
+            self._client.delete(*keys)
+
+    def add(self, key: str, value: bytes, ttl_seconds: float) -> bool:
+        return bool(self._client.set(key, value, nx=True, px=int(ttl_seconds * 1000)))
+
+    def expire(self, key: str, ttl_seconds: float) -> bool:
+        return bool(self._client.pexpire(key, int(ttl_seconds * 1000)))
+
+    def ttl(self, key: str) -> float | None:
+        # PTTL: 없으면 -2, 만료가 없으면 -1
+        remaining = self._client.pttl(key)
+        return remaining / 1000 if remaining >= 0 else None
+
+    # SET NX 로 ttl 을 처음 한 번만 걸고 INCR 한다 (MULTI 로 묶어서 원자적으로)
+    def incr(self, key: str, ttl_seconds: float) -> int:
+        pipe = self._client.pipeline()
+        pipe.set(key, 0, nx=True, px=int(ttl_seconds * 1000))
+        pipe.incr(key)
+        return pipe.execute()[1]
+
+    def decr(self, key: str) -> int:
+        return self._decr(keys=[key])
+
+    async def aget(self, key: str) -> bytes | None:
+        return await self._async_client.get(key)
+
+    async def aset(self, key: str, value: bytes, ttl_seconds: float) -> None:
+        await self._async_client.set(key, value, px=int(ttl_seconds * 1000))
+
+    async def adelete(self, *keys: str) -> None:
+        if keys:
+            await self._async_client.delete(*keys)
+
+    async def aadd(self, key: str, value: bytes, ttl_seconds: float) -> bool:
+        return bool(
+            await self._async_client.set(
+                key, value, nx=True, px=int(ttl_seconds * 1000)
+            )
+        )
+
+    async def aexpire(self, key: str, ttl_seconds: float) -> bool:
+        return bool(await self._async_client.pexpire(key, int(ttl_seconds * 1000)))
+
+    async def attl(self, key: str) -> float | None:
+        remaining = await self._async_client.pttl(key)
+        return remaining / 1000 if remaining >= 0 else None
+
+    async def aincr(self, key: str, ttl_seconds: float) -> int:
+        pipe = self._async_client.pipeline()
+        pipe.set(key, 0, nx=True, px=int(ttl_seconds * 1000))
+        pipe.incr(key)
+        return (await pipe.execute())[1]
+
+    async def adecr(self, key: str) -> int:
+        return await self._adecr(keys=[key])
+
+
+CacheBackend = InMemoryCacheBackend | RedisCacheBackend
+
+
+def create_cache_backend(maxsize: int | None = None) -> CacheBackend:
+    if settings.cache_backend == "redis":
+        return RedisCacheBackend(url=settings.redis_url)
+    return InMemoryCacheBackend(maxsize=maxsize or settings.cache_maxsize)
@@ -0,0 +1,33 @@
+import hashlib
+import math
+
+
+class BloomFilter:
+    """
+    확률적 집합: might_contain 이 False 면 "확실히 없음", True 면 "있을 수도 있음"
+     - capacity 개를 넣었을 때 오탐률이 error_rate 가 되도록 비트 수(m)와 해시 수(k)를 정한다
+     - 해시는 blake2b 하나로 두 값을 뽑아 double hashing (h1 + i * h2) 한다
+    """
+
+    def __init__(self, capacity: int, error_rate: float):
+        self.size = max(
+            8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        )
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def add(self, value: str) -> None:
+        for position in self._positions(value):
+            self._bits[position >> 3] |= 1 << (position & 7)
+
+    def might_contain(self, value: str) -> bool:
+        return all(
+            self._bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(value)
+        )
+
+    def _positions(self, value: str):
+        digest = hashlib.blake2b(value.encode("UTF-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return ((h1 + i * h2) % self.size for i in range(self.hash_count))
@@ -0,0 +1,130 @@
+import asyncio
+import threading
+import weakref
+from contextlib import contextmanager
+from typing import Any, Awaitable, Callable, Iterator
+
+from core.cache.backends import CacheBackend
+
+# 조회 결과가 없다는 것(negative cache)을 나타내는 값
+_MISSING = b"\x00"
+# 먼저 조회하던 요청이 취소됐음을 기다리는 요청에게 알리는 값
+_LEADER_CANCELLED = object()
+
+
+class ReadThroughCache:
+    """
+    read-through 캐시 + stampede 방지
+     - hit: backend 값을 역직렬화해서 반환
+     - miss: key 별로 한 번만 loader 를 실행하고 (동시 miss 는 그 결과를 기다린다) 저장
+     - loader 가 None 을 반환하면 negative_ttl 동안 "없음" 을 캐시한다
+    """
+
+    def __init__(
+        self,
+        backend: CacheBackend,
+        namespace: str,
+        ttl_seconds: float,
+        negative_ttl_seconds: float,
+        dumps: Callable[[Any], bytes],
+        loads: Callable[[bytes], Any],
+    ):
+        self.backend = backend
+        self.namespace = namespace
+        self.ttl_seconds = ttl_seconds
+        self.negative_ttl_seconds = negative_ttl_seconds
+        self._dumps = dumps
+        self._loads = loads
+
+        self._key_locks: dict[str, list] = {}
+        self._key_locks_guard = threading.Lock()
+        self._inflight: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, dict[str, asyncio.Future]
+        ] = weakref.WeakKeyDictionary()
+
+    def key(self, *parts: Any) -> str:
+        return ":".join([self.namespace, *map(str, parts)])
+
+    def get_or_load(self, key: str, loader: Callable[[], Any]) -> Any:
+        cached = self.backend.get(key)
+        if cached is not None:
+            return self._decode(cached)
+
+        with self._hold_key_lock(key):
+            # 기다리는 동안 다른 스레드가 채웠을 수 있다
+            cached = self.backend.get(key)
+            if cached is not None:
+                return self._decode(cached)
+
+            value = loader()
+            self._store(key, value)
+            return value
+
+    async def aget_or_load(self, key: str, loader: Callable[[], Awaitable[Any]]) -> Any:
+        while True:
+            cached = await self.backend.aget(key)
+            if cached is not None:
+                return self._decode(cached)
+
+            inflight = self._inflight.setdefault(asyncio.get_running_loop(), {})
+            future = inflight.get(key)
+            if future is None:
+                break
+            value = await asyncio.shield(future)
+            if value is not _LEADER_CANCELLED:
+                return value
+            # 먼저 조회하던 요청이 취소됐다: 기다리던 요청 중 하나가 자기 loader 로 다시 조회한다
+            # (loader 는 요청의 세션을 쓰므로 취소된 요청의 조회를 이어서 쓰지 않는다)
+
+        future = asyncio.get_running_loop().create_future()
+        inflight[key] = future
+        try:
+            value = await loader()
+            await self._astore(key, value)
+            future.set_result(value)
+            return value
+        except asyncio.CancelledError:
+            # future 를 취소하면 기다리던 요청까지 모두 실패하므로 다시 시도하라고 알린다
+            future.set_result(_LEADER_CANCELLED)
+            raise
+        except Exception as exc:
+            future.set_exception(exc)
+            future.exception()  # 기다리는 요청이 없어도 경고가 남지 않도록 소비
+            raise
+        finally:
+            del inflight[key]
+
+    def invalidate(self, *keys: str) -> None:
+        self.backend.delete(*keys)
+
+    async def ainvalidate(self, *keys: str) -> None:
+        await self.backend.adelete(*keys)
+
+    def _decode(self, cached: bytes) -> Any:
+        return None if cached == _MISSING else self._loads(cached)
+
+    def _store(self, key: str, value: Any) -> None:
+        if value is None:
+            self.backend.set(key, _MISSING, self.negative_ttl_seconds)
+        else:
+            self.backend.set(key, self._dumps(value), self.ttl_seconds)
+
+    async def _astore(self, key: str, value: Any) -> None:
+        if value is None:
+            await self.backend.aset(key, _MISSING, self.negative_ttl_seconds)
+        else:
+            await self.backend.aset(key, self._dumps(value), self.ttl_seconds)
+
+    @contextmanager
+    def _hold_key_lock(self, key: str) -> Iterator[None]:
+        with self._key_locks_guard:
+            entry = self._key_locks.setdefault(key, [threading.Lock(), 0])
+            entry[1] += 1
+        try:
+            with entry[0]:
+                yield
+        finally:
+            with self._key_locks_guard:
+                entry[1] -= 1
+                if entry[1] == 0:
+                    del self._key_locks[key]
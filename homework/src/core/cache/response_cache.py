@@ -0,0 +1,171 @@
+import json
+import threading
+import time
+from typing import NamedTuple
+from urllib.parse import parse_qsl, urlencode
+
+from starlette.responses import Response
+
+from core.cache.backends import CacheBackend, create_cache_backend
+from core.config import settings
+from core.metrics.registry import metrics_registry
+
+# handler 가 응답에 다는 tag 헤더 (공백으로 구분, 클라이언트에는 보내지 않는다)
+SURROGATE_KEY_HEADER = "Surrogate-Key"
+
+
+def set_surrogate_keys(response: Response, *tags: str) -> None:
+    # 익명 GET 응답을 응답 캐시에 저장하고, 같은 tag 를 purge 하면 지워진다
+    # 헤더는 ResponseCacheMiddleware 가 떼므로 미들웨어가 없으면 달지 않는다
+    if settings.response_cache_enabled:
+        response.headers[SURROGATE_KEY_HEADER] = " ".join(tags)
+
+
+class CachedResponse(NamedTuple):
+    status: int
+    headers: list[tuple[bytes, bytes]]
+    body: bytes
+    started_at: (
+        float  # 응답을 만들기 시작한 시각 (이후의 purge 는 이 항목을 무효로 한다)
+    )
+    tags: tuple[str, ...]
+
+    def age(self, now: float) -> float:
+        return now - self.started_at
+
+
+class ResponseCache:
+    """
+    HTTP 응답 캐시 (status + headers + body 를 그대로 저장한다)
+     - 항목은 surrogate key(tag) 로 묶인다. purge(tag) 는 tag 의 purge 시각만 기록하고,
+       그보다 먼저 만들기 시작한 항목은 조회 시 무효가 된다 (O(1), redis 면 워커 간 공유)
+     - purge 시각이 없는(만료된) tag 의 항목은 안전하게 miss 로 본다
+     - 저장할 때 tag key 가 없으면 SET NX 로 만들고 (동시에 들어온 purge 를 덮어쓰지 않는다),
+       있으면 만료를 늘린다 (쓰이는 tag 가 만료되어 그 tag 의 항목이 한꺼번에 miss 되지 않도록)
+     - 항목은 ttl + stale 동안 남는다. ttl 이 지났는지는 is_fresh 로 본다 (재생성은 middleware 의 몫)
+    """
+
+    def __init__(
+        self,
+        backend: CacheBackend,
+        namespace: str,
+        ttl_seconds: float,
+        stale_seconds: float,
+        max_body_bytes: int,
+    ):
+        self.backend = backend
+        self.namespace = namespace
+        self.ttl_seconds = ttl_seconds
+        self.stale_seconds = stale_seconds
+        self.max_body_bytes = max_body_bytes
+        # purge 시각은 그 tag 의 어떤 항목보다 오래 남아야 한다
+        self._tag_ttl_seconds = 2 * (ttl_seconds + stale_seconds)
+
+        self._stats_lock = threading.Lock()
+        self._stats = dict.fromkeys(
+            ("hits", "stale_hits", "misses", "stores", "purges", "revalidations"), 0
+        )
+
+    def key(self, path: str, query_string: bytes, encoding: str | None = None) -> str:
+        # 같은 파라미터를 다른 순서로 보내도 같은 항목을 쓴다
+        # Content-Encoding 별로 따로 저장한다 (압축된 body 를 그대로 보내기 위해)
+        query = sorted(
+            parse_qsl(query_string.decode("latin-1"), keep_blank_values=True)
+        )
+        return (
+            f"{self.namespace}:GET:{encoding or 'identity'}:{path}?{urlencode(query)}"
+        )
+
+    def is_fresh(self, entry: CachedResponse, now: float) -> bool:
+        return entry.age(now) < self.ttl_seconds
+
+    async def aget(self, key: str) -> CachedResponse | None:
+        raw = await self.backend.aget(key)
+        if raw is None:
+            return None
+
+        entry = _decode(raw)
+        for tag in entry.tags:
+            purged_at = await self.backend.aget(self._tag_key(tag))
+            if purged_at is None or float(purged_at) >= entry.started_at:
+                return None
+        return entry
+
+    async def astore(self, key: str, entry: CachedResponse) -> None:
+        for tag in entry.tags:
+            tag_key = self._tag_key(tag)
+            if not await self.backend.aadd(tag_key, b"0", self._tag_ttl_seconds):
+                if not await self.backend.aexpire(tag_key, self._tag_ttl_seconds):
+                    # 그 사이에 만료됐다
+                    await self.backend.aadd(tag_key, b"0", self._tag_ttl_seconds)
+        await self.backend.aset(
+            key, _encode(entry), self.ttl_seconds + self.stale_seconds
+        )
+        self.record("stores")
+
+    # 커밋 뒤에 호출한다 (커밋 전이면 그 사이의 요청이 이전 값을 다시 캐시할 수 있다)
+    def purge(self, *tags: str) -> None:
+        purged_at = repr(time.time()).encode()
+        for tag in tags:
+            self.backend.set(self._tag_key(tag), purged_at, self._tag_ttl_seconds)
+        self.record("purges")
+
+    async def apurge(self, *tags: str) -> None:
+        purged_at = repr(time.time()).encode()
+        for tag in tags:
+            await self.backend.aset(
+                self._tag_key(tag), purged_at, self._tag_ttl_seconds
+            )
+        self.record("purges")
+
+    def record(self, counter: str) -> None:
+        with self._stats_lock:
+            self._stats[counter] += 1
+
+    def stats(self) -> dict:
+        with self._stats_lock:
+            return dict(self._stats)
+
+    def _tag_key(self, tag: str) -> str:
+        return f"{self.namespace}:tag:{tag}"
+
+
+def _encode(entry: CachedResponse) -> bytes:
+    meta = {
+        "status": entry.status,
+        "headers": [
+            [k.decode("latin-1"), v.decode("latin-1")] for k, v in entry.headers
+        ],
+        "started_at": entry.started_at,
+        "tags": entry.tags,
+    }
+    return json.dumps(meta).encode() + b"\n" + entry.body
+
+
+def _decode(raw: bytes) -> CachedResponse:
+    meta, body = raw.split(b"\n", 1)
+    meta = json.loads(meta)
+    return CachedResponse(
+        status=meta["status"],
+        headers=[
+            (k.encode("latin-1"), v.encode("latin-1")) for k, v in meta["headers"]
+        ],
+        body=body,
+        started_at=meta["started_at"],
+        tags=tuple(meta["tags"]),
+    )
+
+
+response_cache = ResponseCache(
+    backend=create_cache_backend(maxsize=settings.response_cache_maxsize),
+    namespace="response",
+    ttl_seconds=settings.response_cache_ttl_seconds,
+    stale_seconds=settings.response_cache_stale_seconds,
+    max_body_bytes=settings.response_cache_max_body_bytes,
+)
+metrics_registry.register("http.response_cache", response_cache.stats)
+
+
+# 의존성 주입을 위한 함수
+def get_response_cache() -> ResponseCache:
+    return response_cache
@@ -2,13 +2,36 @@ from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 
 from core.config import settings
+from core.database.pool import engine_options, pool_metrics
+from core.database.routing import ReplicaSet, RoutingSession
+from core.database.unit_of_work import unit_of_work_stats
+from core.metrics.registry import metrics_registry
 
 
 # 데이터베이스에 접근,설정을 관리하는 객체
-engine = create_engine(settings.database_url)
+engine = create_engine(settings.database_url, **engine_options())
+
+# 읽기 전용 쿼리를 받는 replica
+replica_set = ReplicaSet(
+    engines=[
+        create_engine(url, **engine_options())
+        for url in settings.database_replica_urls
+    ],
+    strategy=settings.database_replica_strategy,
+    retry_seconds=settings.database_replica_retry_seconds,
+)
+
+metrics_registry.register("db.pool.primary", lambda: pool_metrics(engine))
+for index, replica_engine in enumerate(replica_set.engines):
+    metrics_registry.register(
+        f"db.pool.replica.{index}",
+        lambda replica_engine=replica_engine: pool_metrics(replica_engine),
+    )
 
 # 세션을 생성하는 객체
 SessionFactory = sessionmaker(
+    class_=RoutingSession,
+    replicas=replica_set,
     autocommit=False,
     autoflush=False,
     expire_on_commit=False,
@@ -17,9 +40,23 @@ SessionFactory = sessionmaker(
 
 
 # 의존성 주입을 위한 함수
+# 요청 하나가 하나의 트랜잭션이다: repository 는 flush 만 하고, 요청이 끝나면 한 번 커밋한다
+# (예외가 발생하면 롤백한다)
 def get_db():
     session = SessionFactory()
+    unit_of_work_stats.record(requests=1)
     try:
         yield session
+        if session.in_transaction():
+            session.commit()
+    except Exception:
+        session.rollback()
+        unit_of_work_stats.record(rollbacks=1)
+        raise
     finally:
         session.close()
+
+
+# 요청 수명과 별개로 세션을 열어야 하는 경우 (StreamingResponse 등) 를 위한 의존성
+def get_session_factory() -> sessionmaker:
+    return SessionFactory
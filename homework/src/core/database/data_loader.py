@@ -0,0 +1,105 @@
+import asyncio
+import logging
+import weakref
+from typing import Awaitable, Callable, Generic, Hashable, Mapping, TypeVar
+
+logger = logging.getLogger(__name__)
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class _Batch:
+    def __init__(self):
+        self.futures: dict = {}
+        self.dispatched = False
+
+
+class DataLoader(Generic[K, V]):
+    """
+    같은 이벤트 루프에서 window_seconds 동안(0 이면 한 tick) 들어온 load(key) 를 모아서
+    batch_fn(keys) 한 번으로 처리한다 (WHERE id IN (...))
+     - 같은 key 는 한 번만 조회하고 결과를 나눠준다
+     - max_batch_size 를 채우면 기다리지 않고 바로 보낸다
+     - batch_fn 이 반환하지 않은 key 는 None, Exception 을 반환한 key 는 그 key 만 실패한다
+     - batch_fn 자체가 실패하면 key 별로 다시 조회해서 실패를 해당 key 로 한정한다
+    """
+
+    def __init__(
+        self,
+        batch_fn: Callable[[list[K]], Awaitable[Mapping[K, V | Exception]]],
+        max_batch_size: int = 100,
+        window_seconds: float = 0.0,
+    ):
+        self.batch_fn = batch_fn
+        self.max_batch_size = max_batch_size
+        self.window_seconds = window_seconds
+
+        self.batches = 0
+        self.keys = 0
+        self._tasks: set[asyncio.Task] = set()
+        self._open: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _Batch] = (
+            weakref.WeakKeyDictionary()
+        )
+
+    async def load(self, key: K) -> V | None:
+        loop = asyncio.get_running_loop()
+        batch = self._open.get(loop)
+        if batch is None or batch.dispatched:
+            batch = self._open[loop] = _Batch()
+            loop.call_later(self.window_seconds, self._dispatch, loop, batch)
+
+        future = batch.futures.get(key)
+        if future is None:
+            future = batch.futures[key] = loop.create_future()
+            if len(batch.futures) >= self.max_batch_size:
+                self._dispatch(loop, batch)
+
+        # 한 요청이 취소되어도 같은 key 를 기다리는 다른 요청에는 영향이 없도록 shield
+        return await asyncio.shield(future)
+
+    def stats(self) -> dict:
+        return {
+            "batches": self.batches,
+            "keys": self.keys,
+            "avg_batch_size": self.keys / self.batches if self.batches else 0.0,
+        }
+
+    def _dispatch(self, loop: asyncio.AbstractEventLoop, batch: _Batch) -> None:
+        if batch.dispatched:
+            return
+        batch.dispatched = True
+        if self._open.get(loop) is batch:
+            del self._open[loop]
+        task = loop.create_task(self._run(batch.futures))
+        # 실행 중인 task 가 GC 되지 않도록 참조를 들고 있는다
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, futures: dict) -> None:
+        self.batches += 1
+        self.keys += len(futures)
+        try:
+            results = await self.batch_fn(list(futures))
+        except asyncio.CancelledError:
+            for future in futures.values():
+                future.cancel()
+            raise
+        except Exception as exc:
+            if len(futures) > 1:
+                logger.warning("batch load failed, retrying %d keys", len(futures))
+                await asyncio.gather(
+                    *(self._run({key: future}) for key, future in futures.items())
+                )
+                return
+            results = dict.fromkeys(futures, exc)
+
+        for key, future in futures.items():
+            if future.done():
+                continue
+            value = results.get(key)
+            if isinstance(value, Exception):
+                future.set_exception(value)
+                future.exception()  # 기다리는 요청이 없어도 경고가 남지 않도록 소비
+            else:
+                future.set_result(value)
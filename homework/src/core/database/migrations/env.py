@@ -10,6 +10,7 @@ from core.database.orm import Base
 
 from users.domains.user import User  # noqa
 from products.domains.product import Product  # noqa
+from core.email.domains.email_outbox import EmailOutbox  # noqa
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
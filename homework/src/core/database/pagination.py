@@ -0,0 +1,24 @@
+import base64
+import binascii
+import json
+from typing import Any
+
+from core.database.exceptions.custom_exceptions import InvalidCursorException
+
+
+# keyset pagination 용 cursor: 마지막 행의 정렬 key 를 JSON -> base64url 로 감싼 문자열
+def encode_cursor(*values: Any) -> str:
+    raw = json.dumps(values, separators=(",", ":")).encode("UTF-8")
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+
+def decode_cursor(cursor: str, size: int) -> list[Any]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (binascii.Error, UnicodeError, ValueError):
+        raise InvalidCursorException()
+
+    if not isinstance(values, list) or len(values) != size:
+        raise InvalidCursorException()
+    return values
@@ -0,0 +1,109 @@
+import bisect
+import threading
+import time
+
+from sqlalchemy import Engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from core.config import settings
+
+# 커넥션 체크아웃 대기 시간 히스토그램 구간 (초)
+WAIT_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+
+
+class PoolStats:
+    """커넥션 체크아웃 횟수 / 대기 시간 / 실패 횟수"""
+
+    def __init__(self):
+        self.checkouts = 0
+        self.timeouts = 0  # QueuePool limit 에 걸려 pool_timeout 을 넘긴 경우
+        self.failures = 0  # timeout 을 포함한 모든 체크아웃 실패
+        self.wait_seconds_total = 0.0
+        self._bucket_counts = [0] * (len(WAIT_BUCKETS) + 1)
+        self._lock = threading.Lock()
+
+    def record_checkout(self, wait_seconds: float) -> None:
+        with self._lock:
+            self.checkouts += 1
+            self.wait_seconds_total += wait_seconds
+            self._bucket_counts[bisect.bisect_left(WAIT_BUCKETS, wait_seconds)] += 1
+
+    def record_failure(self, timeout: bool) -> None:
+        with self._lock:
+            self.failures += 1
+            self.timeouts += timeout
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            # prometheus 와 같은 누적 히스토그램 (le: 이하)
+            histogram, cumulative = {}, 0
+            for bound, count in zip((*WAIT_BUCKETS, "+Inf"), self._bucket_counts):
+                cumulative += count
+                histogram[str(bound)] = cumulative
+            return {
+                "checkouts": self.checkouts,
+                "checkout_timeouts": self.timeouts,
+                "checkout_failures": self.failures,
+                "wait_seconds_total": self.wait_seconds_total,
+                "wait_seconds_histogram": histogram,
+            }
+
+
+class _InstrumentedPoolMixin:
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.stats = PoolStats()
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except Exception as exc:
+            self.stats.record_failure(timeout=isinstance(exc, PoolTimeoutError))
+            raise
+        self.stats.record_checkout(time.perf_counter() - started)
+        return connection
+
+    # engine.dispose() / 끊김 감지 시 pool 을 새로 만들어도 통계는 이어간다
+    def recreate(self):
+        pool = super().recreate()
+        pool.stats = self.stats
+        return pool
+
+
+class InstrumentedQueuePool(_InstrumentedPoolMixin, QueuePool):
+    pass
+
+
+class InstrumentedAsyncAdaptedQueuePool(_InstrumentedPoolMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+def engine_options(async_engine: bool = False) -> dict:
+    options = {
+        "poolclass": (
+            InstrumentedAsyncAdaptedQueuePool if async_engine else InstrumentedQueuePool
+        ),
+        "pool_size": settings.database_pool_size,
+        "max_overflow": settings.database_max_overflow,
+        "pool_timeout": settings.database_pool_timeout,
+        "pool_recycle": settings.database_pool_recycle,
+        "pool_pre_ping": settings.database_pool_pre_ping,
+    }
+    if settings.database_isolation_level is not None:
+        options["isolation_level"] = settings.database_isolation_level
+    return options
+
+
+def pool_metrics(engine: Engine) -> dict:
+    pool = engine.pool
+    metrics = {
+        "size": pool.size(),
+        "checked_in": pool.checkedin(),
+        "checked_out": pool.checkedout(),
+        "overflow": pool.overflow(),
+    }
+    if isinstance(pool, _InstrumentedPoolMixin):
+        metrics.update(pool.stats.snapshot())
+    return metrics
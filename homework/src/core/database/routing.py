@@ -0,0 +1,86 @@
+import itertools
+import threading
+import time
+from typing import Literal
+
+from sqlalchemy import Engine, event
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.dml import UpdateBase
+
+# 읽기 전용 쿼리를 replica 로 보낼 때 execute(bind_arguments=...) 에 넘기는 값
+READ_REPLICA = {"replica": True}
+
+
+class ReplicaSet:
+    """
+    read replica engine 묶음
+     - round_robin: 순서대로 고른다
+     - least_connections: 체크아웃된 커넥션이 가장 적은 replica 를 고른다
+     - 접속 실패/끊김이 난 replica 는 retry_seconds 동안 제외한다 (이후 다시 시도)
+    사용 가능한 replica 가 없으면 None 을 반환하고 primary 로 보낸다.
+    """
+
+    def __init__(
+        self,
+        engines: list[Engine],
+        strategy: Literal["round_robin", "least_connections"] = "round_robin",
+        retry_seconds: float = 30.0,
+    ):
+        self.engines = engines
+        self.strategy = strategy
+        self.retry_seconds = retry_seconds
+        self._counter = itertools.count()
+        self._evicted_until: dict[Engine, float] = {}
+        self._lock = threading.Lock()
+
+        for engine in engines:
+            event.listen(engine, "handle_error", self._on_error)
+
+    def choose(self) -> Engine | None:
+        now = time.monotonic()
+        with self._lock:
+            healthy = [
+                engine
+                for engine in self.engines
+                if self._evicted_until.get(engine, 0.0) <= now
+            ]
+        if not healthy:
+            return None
+
+        if self.strategy == "least_connections":
+            return min(healthy, key=lambda engine: engine.pool.checkedout())
+        return healthy[next(self._counter) % len(healthy)]
+
+    def evict(self, engine: Engine) -> None:
+        with self._lock:
+            self._evicted_until[engine] = time.monotonic() + self.retry_seconds
+
+    def _on_error(self, context) -> None:
+        # connection 이 None 이면 접속 단계에서 실패한 것이다
+        if context.is_disconnect or context.connection is None:
+            self.evict(context.engine)
+
+
+class RoutingSession(Session):
+    """
+    READ_REPLICA 로 실행한 쿼리만 replica 로 보내고 나머지는 모두 primary 로 보낸다
+     - replica 는 세션(= 요청)마다 한 번만 골라서 같은 커넥션을 계속 사용한다
+     - flush / INSERT / UPDATE / DELETE 이후에는 세션이 끝날 때까지 읽기도 primary 로 보낸다
+       (read-your-writes)
+    """
+
+    def __init__(self, *args, replicas: ReplicaSet | None = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.replicas = replicas
+        self.read_from_primary = False
+        self._replica: Engine | None = None
+
+    def get_bind(self, mapper=None, *, clause=None, replica=False, **kw):
+        if self._flushing or isinstance(clause, UpdateBase):
+            self.read_from_primary = True
+        elif replica and not self.read_from_primary and self.replicas is not None:
+            if self._replica is None:
+                self._replica = self.replicas.choose()
+            if self._replica is not None:
+                return self._replica
+        return super().get_bind(mapper, clause=clause, **kw)
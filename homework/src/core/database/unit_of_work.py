@@ -0,0 +1,141 @@
+import logging
+import threading
+from typing import Awaitable, Callable
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from core.metrics.registry import metrics_registry
+
+logger = logging.getLogger(__name__)
+
+_AFTER_COMMIT_KEY = "after_commit_callbacks"
+_AFTER_COMMIT_ASYNC_KEY = "after_commit_async_callbacks"
+_AFTER_ROLLBACK_KEY = "after_rollback_callbacks"
+_HAS_WRITES_KEY = "has_writes"
+
+
+class UnitOfWorkStats:
+    """요청 수 / 커밋 수 / 롤백 수 (요청당 커밋 수를 확인하기 위한 지표)"""
+
+    def __init__(self):
+        self.requests = 0
+        self.commits = 0
+        self.rollbacks = 0
+        self._lock = threading.Lock()
+
+    def record(self, requests: int = 0, commits: int = 0, rollbacks: int = 0) -> None:
+        with self._lock:
+            self.requests += requests
+            self.commits += commits
+            self.rollbacks += rollbacks
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "commits": self.commits,
+                "rollbacks": self.rollbacks,
+                "commits_per_request": (
+                    self.commits / self.requests if self.requests else 0.0
+                ),
+            }
+
+
+unit_of_work_stats = UnitOfWorkStats()
+metrics_registry.register("db.unit_of_work", unit_of_work_stats.snapshot)
+
+
+# 커밋이 끝난 뒤에 실행할 작업 (캐시 무효화 등) 을 등록한다. 롤백되면 버린다
+def after_commit(session: Session, callback: Callable[[], None]) -> None:
+    session.info.setdefault(_AFTER_COMMIT_KEY, []).append(callback)
+
+
+# 롤백되면 실행할 작업 (커밋 전에 잡아 둔 외부 자원을 돌려놓는 등). 커밋되면 버린다
+def after_rollback(session: Session, callback: Callable[[], None]) -> None:
+    session.info.setdefault(_AFTER_ROLLBACK_KEY, []).append(callback)
+
+
+def after_commit_async(
+    session: AsyncSession, callback: Callable[[], Awaitable[None]]
+) -> None:
+    session.info.setdefault(_AFTER_COMMIT_ASYNC_KEY, []).append(callback)
+
+
+async def commit_async(session: AsyncSession) -> None:
+    # 이벤트 핸들러에서는 await 할 수 없으므로 async 작업은 여기서 실행한다
+    await session.commit()
+    for callback in session.info.pop(_AFTER_COMMIT_ASYNC_KEY, []):
+        try:
+            await callback()
+        except Exception:
+            logger.exception("after commit callback failed")
+
+
+# 읽기만 한 트랜잭션을 일찍 끝내서 커넥션을 풀에 돌려준다
+# (Session 은 첫 쿼리 때 커넥션을 꺼내므로, 이후 bcrypt 처럼 오래 걸리는 작업 동안 붙잡지 않도록)
+# 쓰기가 있었다면 요청 끝의 커밋까지 그대로 둔다
+def release_connection(session: Session) -> None:
+    if _is_read_only(session):
+        session.commit()
+
+
+async def release_connection_async(session: AsyncSession) -> None:
+    if _is_read_only(session.sync_session):
+        await session.commit()
+
+
+def _is_read_only(session: Session) -> bool:
+    return (
+        session.in_transaction()
+        and not session.info.get(_HAS_WRITES_KEY)
+        and not (session.new or session.dirty or session.deleted)
+    )
+
+
+@event.listens_for(Session, "after_flush")
+def _mark_flush_as_write(session: Session, flush_context) -> None:
+    session.info[_HAS_WRITES_KEY] = True
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _mark_dml_as_write(orm_execute_state) -> None:
+    if (
+        orm_execute_state.is_insert
+        or orm_execute_state.is_update
+        or orm_execute_state.is_delete
+    ):
+        orm_execute_state.session.info[_HAS_WRITES_KEY] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _run_after_commit_callbacks(session: Session) -> None:
+    # savepoint RELEASE 에서도 호출된다 (바깥 트랜잭션이 커밋될 때까지 미룬다)
+    if session.in_nested_transaction():
+        return
+    unit_of_work_stats.record(commits=1)
+    session.info.pop(_HAS_WRITES_KEY, None)
+    session.info.pop(_AFTER_ROLLBACK_KEY, None)
+    for callback in session.info.pop(_AFTER_COMMIT_KEY, []):
+        try:
+            callback()
+        except Exception:
+            # 데이터는 이미 커밋되었으므로 요청을 실패시키지 않는다
+            logger.exception("after commit callback failed")
+
+
+# savepoint 롤백은 바깥 트랜잭션의 작업을 버리지 않는다
+# (savepoint 안에서 등록된 작업이 남아 있어도 캐시 무효화가 한 번 더 될 뿐이다)
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_after_commit_callbacks(session: Session, previous_transaction) -> None:
+    if previous_transaction.nested:
+        return
+    session.info.pop(_HAS_WRITES_KEY, None)
+    session.info.pop(_AFTER_COMMIT_KEY, None)
+    session.info.pop(_AFTER_COMMIT_ASYNC_KEY, None)
+    for callback in session.info.pop(_AFTER_ROLLBACK_KEY, []):
+        try:
+            callback()
+        except Exception:
+            logger.exception("after rollback callback failed")
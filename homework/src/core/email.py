@@ -1,6 +0,0 @@
-import time
-
-
-def send_email(msg: str):
-    time.sleep(3)
-    print(f"[이메일] {msg}")
@@ -0,0 +1,53 @@
+from datetime import datetime
+from enum import StrEnum
+
+from sqlalchemy import Column, DateTime, Index, Integer, String, Text
+
+from core.database.orm import Base
+
+
+class EmailOutboxStatus(StrEnum):
+    PENDING = "pending"  # 발송 대기 (worker 가 가져가면 next_attempt_at 이 lease 만료 시각이 된다)
+    SENT = "sent"
+    FAILED = "failed"  # 영구 오류 또는 최대 시도 횟수 초과
+
+
+class EmailOutbox(Base):
+    """
+    보낼 메일 (transactional outbox)
+    유저 등 업무 데이터와 같은 트랜잭션에 쓰므로 커밋된 가입에 대한 메일만 남고, 재시작해도 잃지 않는다
+    """
+
+    __tablename__ = "email_outbox"
+
+    __table_args__ = (
+        # worker 가 발송할 메일을 가져가는 조회 (status = pending AND next_attempt_at <= now)
+        Index("ix_email_outbox_status_next_attempt_at", "status", "next_attempt_at"),
+    )
+
+    id = Column(Integer, primary_key=True)
+    recipient = Column(String(255), nullable=False)
+    subject = Column(String(255), nullable=False)
+    body = Column(Text, nullable=False)
+    status = Column(String(16), nullable=False, default=EmailOutboxStatus.PENDING)
+    attempts = Column(Integer, nullable=False, default=0)
+    next_attempt_at = Column(DateTime, nullable=False, default=datetime.now)
+    last_error = Column(String(255), nullable=True)
+    created_at = Column(DateTime, default=datetime.now)
+    sent_at = Column(DateTime, nullable=True)
+
+    @classmethod
+    def create(cls, recipient: str, subject: str, body: str):
+        return cls(
+            recipient=recipient,
+            subject=subject,
+            body=body,
+            status=EmailOutboxStatus.PENDING,
+            attempts=0,
+            next_attempt_at=datetime.now(),
+        )
+
+    def claim(self, lease_until: datetime) -> None:
+        # 발송 중 프로세스가 죽으면 lease 가 끝난 뒤 다른 worker 가 다시 가져간다 (at-least-once)
+        self.attempts += 1
+        self.next_attempt_at = lease_until
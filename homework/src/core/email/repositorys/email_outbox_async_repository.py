@@ -0,0 +1,28 @@
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.database.connection_async import get_async_db
+from core.database.unit_of_work import after_commit_async
+from core.email.domains.email_outbox import EmailOutbox
+from core.email.services.email_outbox_dispatcher import (
+    EmailOutboxDispatcher,
+    get_email_outbox_dispatcher,
+)
+
+
+class EmailOutboxAsyncRepository:
+    def __init__(
+        self,
+        db: AsyncSession = Depends(get_async_db),
+        dispatcher: EmailOutboxDispatcher = Depends(get_email_outbox_dispatcher),
+    ):
+        self.db = db
+        self.dispatcher = dispatcher
+
+    # 업무 데이터와 같은 세션에 쓴다 (커밋은 요청이 끝날 때 get_async_db 가 한다)
+    def enqueue(self, recipient: str, subject: str, body: str) -> None:
+        self.db.add(EmailOutbox.create(recipient=recipient, subject=subject, body=body))
+        after_commit_async(self.db, self._wake)
+
+    async def _wake(self) -> None:
+        self.dispatcher.wake()
@@ -0,0 +1,41 @@
+from typing import Callable
+
+from fastapi import Depends
+from sqlalchemy.orm import Session
+
+from core.database.connection import get_db
+from core.database.unit_of_work import after_commit, after_rollback
+from core.email.domains.email_outbox import EmailOutbox
+from core.email.services.email_outbox_dispatcher import (
+    EmailOutboxDispatcher,
+    get_email_outbox_dispatcher,
+)
+
+
+class EmailOutboxRepository:
+    def __init__(
+        self,
+        db: Session = Depends(get_db),
+        dispatcher: EmailOutboxDispatcher = Depends(get_email_outbox_dispatcher),
+    ):
+        self.db = db
+        self.dispatcher = dispatcher
+
+    # 업무 데이터와 같은 세션에 쓴다 (커밋은 요청이 끝날 때 get_db 가 한다)
+    # on_commit: 메일이 커밋된 뒤, worker 를 깨우기 전에 실행할 작업 (메일에 담긴 코드 저장 등)
+    # on_rollback: 메일이 롤백되면 실행할 작업 (메일을 위해 잡아 둔 것을 돌려놓는 등)
+    def enqueue(
+        self,
+        recipient: str,
+        subject: str,
+        body: str,
+        on_commit: Callable[[], None] | None = None,
+        on_rollback: Callable[[], None] | None = None,
+    ) -> None:
+        if on_rollback is not None:
+            after_rollback(self.db, on_rollback)
+        self.db.add(EmailOutbox.create(recipient=recipient, subject=subject, body=body))
+        if on_commit is not None:
+            after_commit(self.db, on_commit)
+        # 커밋된 뒤에 worker 를 깨운다 (롤백되면 메일도 남지 않는다)
+        after_commit(self.db, self.dispatcher.wake)
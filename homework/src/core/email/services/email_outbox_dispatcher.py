@@ -0,0 +1,355 @@
+import asyncio
+import logging
+import random
+import smtplib
+import threading
+import time
+from datetime import datetime, timedelta
+from email.message import EmailMessage
+from typing import NamedTuple
+
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.orm import sessionmaker
+
+from core.config import settings
+from core.database.connection import SessionFactory
+from core.email.domains.email_outbox import EmailOutbox, EmailOutboxStatus
+from core.email.services.smtp_pool import SmtpConnectionPool, create_smtp_connection
+from core.metrics.registry import metrics_registry
+
+logger = logging.getLogger(__name__)
+
+
+class OutboxMessage(NamedTuple):
+    id: int
+    recipient: str
+    subject: str
+    body: str
+    attempts: int  # 이번 시도를 포함한 시도 횟수
+
+
+class DeliveryFailure(NamedTuple):
+    error: str
+    permanent: bool  # 5xx 응답: 다시 보내도 실패하므로 재시도하지 않는다
+
+
+class EmailOutboxDispatcher:
+    """
+    email_outbox 를 비우는 발송기 (lifespan 에서 worker 를 띄운다)
+     - claim: pending 중 next_attempt_at 이 지난 메일을 batch_size 개 가져간다
+       (FOR UPDATE SKIP LOCKED -> 여러 worker / 프로세스가 같은 메일을 가져가지 않는다)
+     - deliver: 풀의 SMTP 연결 하나로 batch 를 이어서 보낸다 (DB / SMTP 는 스레드에서 실행)
+     - 실패: 4xx / 연결 오류는 지수 backoff(+jitter) 로 다시 시도하고,
+       5xx 이거나 max_attempts 를 넘으면 failed 로 남긴다
+     - 새 메일이 커밋되면 wake() 로 poll 주기를 기다리지 않고 바로 보낸다 (같은 프로세스만)
+     - 발송이 끝난(sent / failed) 메일은 본문을 지운다 (인증 코드 등이 DB 에 남지 않도록)
+     - prune: sent / failed 로 끝난 지 retention 이 지난 메일은 prune 주기마다 batch 단위로 지운다
+    """
+
+    def __init__(
+        self,
+        session_factory: sessionmaker,
+        smtp_pool: SmtpConnectionPool,
+        sender: str,
+        batch_size: int,
+        poll_seconds: float,
+        lease_seconds: float,
+        max_attempts: int,
+        backoff_seconds: float,
+        backoff_max_seconds: float,
+        retention_seconds: float,
+        prune_seconds: float,
+    ):
+        self.session_factory = session_factory
+        self.smtp_pool = smtp_pool
+        self.sender = sender
+        self.batch_size = batch_size
+        self.poll_seconds = poll_seconds
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.backoff_seconds = backoff_seconds
+        self.backoff_max_seconds = backoff_max_seconds
+        self.retention_seconds = retention_seconds
+        self.prune_seconds = prune_seconds
+
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._wakeup: asyncio.Event | None = None
+
+        # 같은 프로세스의 worker 끼리는 claim 을 하나씩 한다 (row lock 이 없는 sqlite 에서도 중복 발송 방지)
+        self._claim_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._stats = dict.fromkeys(
+            (
+                "batches",
+                "claimed",
+                "sent",
+                "retried",
+                "failed",
+                "delivery_errors",
+                "pruned",
+            ),
+            0,
+        )
+        self._backlog = 0
+        self._oldest_pending_at: datetime | None = None
+        self._started_at = time.monotonic()
+        self._next_prune_at = self._started_at
+
+    # 커밋 뒤에 호출된다 (sync 요청은 threadpool 스레드에서 호출하므로 thread-safe 하게 깨운다)
+    def wake(self) -> None:
+        loop, wakeup = self._loop, self._wakeup
+        if loop is None or wakeup is None:
+            return
+        try:
+            loop.call_soon_threadsafe(wakeup.set)
+        except RuntimeError:  # 종료된 루프
+            pass
+
+    async def run_worker(self) -> None:
+        if self._loop is None:
+            self._loop = asyncio.get_running_loop()
+            self._wakeup = asyncio.Event()
+
+        while True:
+            # claim 전에 지워야 claim 이후에 커밋된 메일의 wake 를 놓치지 않는다
+            self._wakeup.clear()
+            try:
+                # 같은 프로세스의 worker 중 하나만 지운다 (await 전에 다음 시각을 정한다)
+                if time.monotonic() >= self._next_prune_at:
+                    self._next_prune_at = time.monotonic() + self.prune_seconds
+                    await asyncio.to_thread(self.prune_finished)
+                delivered = await self.run_once()
+            except Exception:
+                logger.exception("email outbox dispatch failed")
+                delivered = 0
+
+            if delivered < self.batch_size:
+                try:
+                    await asyncio.wait_for(
+                        self._wakeup.wait(), timeout=self.poll_seconds
+                    )
+                except TimeoutError:
+                    pass
+
+    async def run_once(self) -> int:
+        messages = await asyncio.to_thread(self.claim_batch)
+        if not messages:
+            return 0
+        results = await asyncio.to_thread(self.deliver_batch, messages)
+        await asyncio.to_thread(self.record_results, messages, results)
+        return len(messages)
+
+    def claim_batch(self) -> list[OutboxMessage]:
+        now = datetime.now()
+        lease_until = now + timedelta(seconds=self.lease_seconds)
+        with self._claim_lock, self.session_factory() as session:
+            outbox = session.scalars(
+                select(EmailOutbox)
+                .where(
+                    EmailOutbox.status == EmailOutboxStatus.PENDING,
+                    EmailOutbox.next_attempt_at <= now,
+                )
+                .order_by(EmailOutbox.next_attempt_at, EmailOutbox.id)
+                .limit(self.batch_size)
+                .with_for_update(skip_locked=True)
+            ).all()
+            for email in outbox:
+                email.claim(lease_until=lease_until)
+            messages = [
+                OutboxMessage(
+                    email.id, email.recipient, email.subject, email.body, email.attempts
+                )
+                for email in outbox
+            ]
+
+            backlog, oldest_pending_at = session.execute(
+                select(func.count(), func.min(EmailOutbox.created_at)).where(
+                    EmailOutbox.status == EmailOutboxStatus.PENDING
+                )
+            ).one()
+            session.commit()
+
+        with self._stats_lock:
+            # 이번에 가져간 메일은 발송 중이므로 대기 건수에서 뺀다
+            self._backlog = backlog - len(messages)
+            self._oldest_pending_at = oldest_pending_at
+            if messages:
+                self._stats["batches"] += 1
+                self._stats["claimed"] += len(messages)
+        return messages
+
+    def deliver_batch(
+        self, messages: list[OutboxMessage]
+    ) -> list[DeliveryFailure | None]:
+        try:
+            smtp = self.smtp_pool.acquire()
+        except (smtplib.SMTPException, OSError) as exc:
+            # 연결 / 인증 실패는 메일 문제가 아니므로 모두 재시도한다
+            failure = DeliveryFailure(error=_describe(exc), permanent=False)
+            return [failure] * len(messages)
+
+        results: list[DeliveryFailure | None] = []
+        broken: DeliveryFailure | None = None
+        try:
+            for message in messages:
+                if broken is not None:
+                    results.append(broken)
+                    continue
+                try:
+                    smtp.send_message(self._build(message))
+                    results.append(None)
+                except (
+                    smtplib.SMTPResponseException,
+                    smtplib.SMTPRecipientsRefused,
+                ) as exc:
+                    # 서버가 이 메일만 거절했다: 연결은 계속 쓸 수 있다
+                    results.append(
+                        DeliveryFailure(error=_describe(exc), permanent=_permanent(exc))
+                    )
+                except (smtplib.SMTPException, OSError) as exc:
+                    broken = DeliveryFailure(error=_describe(exc), permanent=False)
+                    results.append(broken)
+        finally:
+            self.smtp_pool.release(smtp, discard=broken is not None)
+        return results
+
+    def record_results(
+        self,
+        messages: list[OutboxMessage],
+        results: list[DeliveryFailure | None],
+    ) -> None:
+        now = datetime.now()
+        sent_ids = [m.id for m, failure in zip(messages, results) if failure is None]
+        retried = failed = 0
+
+        with self.session_factory() as session:
+            if sent_ids:
+                session.execute(
+                    update(EmailOutbox)
+                    .where(EmailOutbox.id.in_(sent_ids))
+                    .values(
+                        status=EmailOutboxStatus.SENT,
+                        sent_at=now,
+                        last_error=None,
+                        body="",
+                    )
+                )
+            for message, failure in zip(messages, results):
+                if failure is None:
+                    continue
+                values = {"last_error": failure.error[:255]}
+                if failure.permanent or message.attempts >= self.max_attempts:
+                    values["status"] = EmailOutboxStatus.FAILED
+                    values["body"] = ""
+                    failed += 1
+                else:
+                    values["next_attempt_at"] = now + timedelta(
+                        seconds=self.backoff(message.attempts)
+                    )
+                    retried += 1
+                session.execute(
+                    update(EmailOutbox)
+                    .where(EmailOutbox.id == message.id)
+                    .values(**values)
+                )
+            session.commit()
+
+        with self._stats_lock:
+            self._stats["sent"] += len(sent_ids)
+            self._stats["retried"] += retried
+            self._stats["failed"] += failed
+            self._stats["delivery_errors"] += retried + failed
+
+    def prune_finished(self) -> int:
+        # sent / failed 의 next_attempt_at 은 마지막 claim 의 lease 만료 시각(= 끝난 시각 + lease)
+        # 이므로 (status, next_attempt_at) index 로 찾는다
+        deleted_before = datetime.now() - timedelta(seconds=self.retention_seconds)
+        pruned = 0
+        while True:
+            with self.session_factory() as session:
+                # 한 번에 batch_size 개씩 지워서 lock 을 오래 잡지 않는다
+                ids = session.scalars(
+                    select(EmailOutbox.id)
+                    .where(
+                        EmailOutbox.status.in_(
+                            (EmailOutboxStatus.SENT, EmailOutboxStatus.FAILED)
+                        ),
+                        EmailOutbox.next_attempt_at < deleted_before,
+                    )
+                    .limit(self.batch_size)
+                ).all()
+                if ids:
+                    session.execute(delete(EmailOutbox).where(EmailOutbox.id.in_(ids)))
+                    session.commit()
+            pruned += len(ids)
+            if len(ids) < self.batch_size:
+                break
+
+        with self._stats_lock:
+            self._stats["pruned"] += pruned
+        return pruned
+
+    def backoff(self, attempts: int) -> float:
+        # 1회 실패 후 backoff_seconds, 이후 2배씩 (최대 backoff_max_seconds), ±20% jitter
+        delay = min(
+            self.backoff_seconds * 2 ** (attempts - 1), self.backoff_max_seconds
+        )
+        return delay * random.uniform(0.8, 1.2)
+
+    def stats(self) -> dict:
+        with self._stats_lock:
+            stats = dict(self._stats)
+            stats["backlog"] = self._backlog
+            oldest_pending_at = self._oldest_pending_at
+        elapsed = time.monotonic() - self._started_at
+        stats["sent_per_second"] = round(stats["sent"] / elapsed, 3) if elapsed else 0.0
+        stats["oldest_pending_seconds"] = (
+            (datetime.now() - oldest_pending_at).total_seconds()
+            if oldest_pending_at is not None
+            else 0.0
+        )
+        stats["smtp_pool"] = self.smtp_pool.stats()
+        return stats
+
+    def _build(self, message: OutboxMessage) -> EmailMessage:
+        email = EmailMessage()
+        email["From"] = self.sender
+        email["To"] = message.recipient
+        email["Subject"] = message.subject
+        email.set_content(message.body)
+        return email
+
+
+def _permanent(exc: smtplib.SMTPException) -> bool:
+    if isinstance(exc, smtplib.SMTPRecipientsRefused):
+        return all(code >= 500 for code, _ in exc.recipients.values())
+    return exc.smtp_code >= 500
+
+
+def _describe(exc: Exception) -> str:
+    return f"{type(exc).__name__}: {exc}"
+
+
+email_outbox_dispatcher = EmailOutboxDispatcher(
+    session_factory=SessionFactory,
+    smtp_pool=SmtpConnectionPool(
+        factory=create_smtp_connection,
+        max_size=settings.smtp_pool_size,
+        idle_seconds=settings.smtp_idle_seconds,
+    ),
+    sender=settings.email_sender,
+    batch_size=settings.email_outbox_batch_size,
+    poll_seconds=settings.email_outbox_poll_seconds,
+    lease_seconds=settings.email_outbox_lease_seconds,
+    max_attempts=settings.email_outbox_max_attempts,
+    backoff_seconds=settings.email_outbox_backoff_seconds,
+    backoff_max_seconds=settings.email_outbox_backoff_max_seconds,
+    retention_seconds=settings.email_outbox_retention_seconds,
+    prune_seconds=settings.email_outbox_prune_seconds,
+)
+metrics_registry.register("email.outbox", email_outbox_dispatcher.stats)
+
+
+# 의존성 주입을 위한 함수
+def get_email_outbox_dispatcher() -> EmailOutboxDispatcher:
+    return email_outbox_dispatcher
@@ -0,0 +1,118 @@
+import smtplib
+import ssl
+import threading
+import time
+from typing import Callable
+
+from core.config import settings
+
+
+def create_smtp_connection() -> smtplib.SMTP:
+    smtp = smtplib.SMTP(
+        host=settings.smtp_host,
+        port=settings.smtp_port,
+        timeout=settings.smtp_timeout_seconds,
+    )
+    try:
+        if settings.smtp_starttls:
+            smtp.starttls(context=ssl.create_default_context())
+        if settings.smtp_username:
+            smtp.login(settings.smtp_username, settings.smtp_password or "")
+    except BaseException:
+        smtp.close()
+        raise
+    return smtp
+
+
+class SmtpConnectionPool:
+    """
+    SMTP 연결 재사용 (메일마다 연결 + EHLO + STARTTLS + AUTH 를 반복하지 않는다)
+     - 최대 max_size 개까지 만들고, 쉬고 있는 연결은 최근에 쓴 것부터 다시 쓴다
+     - idle_seconds 넘게 쉰 연결은 NOOP 으로 살아 있는지 확인하고 죽었으면 새로 만든다
+     - 오류가 난 연결은 release(discard=True) 로 닫고 버린다
+    worker 의 to_thread 안에서 호출되므로 thread-safe 하게 만든다
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], smtplib.SMTP],
+        max_size: int,
+        idle_seconds: float,
+    ):
+        self.factory = factory
+        self.idle_seconds = idle_seconds
+        self._slots = threading.BoundedSemaphore(max_size)
+        self._idle: list[tuple[smtplib.SMTP, float]] = []
+        self._lock = threading.Lock()
+        self.opened = 0
+        self.reused = 0
+        self.discarded = 0
+
+    def acquire(self) -> smtplib.SMTP:
+        self._slots.acquire()
+        try:
+            return self._take_idle() or self._open()
+        except BaseException:
+            self._slots.release()
+            raise
+
+    def release(self, smtp: smtplib.SMTP, discard: bool = False) -> None:
+        try:
+            if discard:
+                self._quit(smtp)
+                with self._lock:
+                    self.discarded += 1
+            else:
+                with self._lock:
+                    self._idle.append((smtp, time.monotonic()))
+        finally:
+            self._slots.release()
+
+    def close(self) -> None:
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for smtp, _ in idle:
+            self._quit(smtp)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "opened": self.opened,
+                "reused": self.reused,
+                "discarded": self.discarded,
+                "idle": len(self._idle),
+            }
+
+    def _take_idle(self) -> smtplib.SMTP | None:
+        while True:
+            with self._lock:
+                if not self._idle:
+                    return None
+                smtp, released_at = self._idle.pop()
+            if time.monotonic() - released_at < self.idle_seconds or self._alive(smtp):
+                with self._lock:
+                    self.reused += 1
+                return smtp
+            self._quit(smtp)
+            with self._lock:
+                self.discarded += 1
+
+    def _open(self) -> smtplib.SMTP:
+        smtp = self.factory()
+        with self._lock:
+            self.opened += 1
+        return smtp
+
+    @staticmethod
+    def _alive(smtp: smtplib.SMTP) -> bool:
+        try:
+            return smtp.noop()[0] == 250
+        except (smtplib.SMTPException, OSError):
+            return False
+
+    @staticmethod
+    def _quit(smtp: smtplib.SMTP) -> None:
+        try:
+            smtp.quit()
+        except (smtplib.SMTPException, OSError):
+            smtp.close()
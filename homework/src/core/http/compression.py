@@ -0,0 +1,175 @@
+import threading
+import time
+import zlib
+from typing import Callable, NamedTuple, Protocol
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - 선택 의존성
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - 선택 의존성
+    zstandard = None
+
+from core.metrics.registry import metrics_registry
+
+
+class StreamCompressor(Protocol):
+    # 청크마다 바로 보낼 수 있도록 flush 까지 한 bytes 를 돌려준다
+    def compress(self, chunk: bytes) -> bytes: ...
+
+    def finish(self) -> bytes: ...
+
+
+class Codec(NamedTuple):
+    name: str  # Content-Encoding 값
+    compress: Callable[[bytes, int], bytes]
+    streamer: Callable[[int], StreamCompressor]
+    default_level: int
+
+
+class _GzipStream:
+    def __init__(self, level: int):
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+
+    def compress(self, chunk: bytes) -> bytes:
+        return self._compressor.compress(chunk) + self._compressor.flush(
+            zlib.Z_SYNC_FLUSH
+        )
+
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+
+class _BrotliStream:
+    def __init__(self, level: int):
+        self._compressor = brotli.Compressor(quality=level)
+
+    def compress(self, chunk: bytes) -> bytes:
+        return self._compressor.process(chunk) + self._compressor.flush()
+
+    def finish(self) -> bytes:
+        return self._compressor.finish()
+
+
+class _ZstdStream:
+    def __init__(self, level: int):
+        self._compressor = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, chunk: bytes) -> bytes:
+        return self._compressor.compress(chunk) + self._compressor.flush(
+            zstandard.COMPRESSOBJ_FLUSH_BLOCK
+        )
+
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+
+def _available_codecs() -> dict[str, Codec]:
+    # 순서가 서버 선호 순서다 (클라이언트 q 값이 같으면 앞의 것을 고른다)
+    codecs = {}
+    if zstandard is not None:
+        codecs["zstd"] = Codec(
+            "zstd",
+            lambda data, level: zstandard.ZstdCompressor(level=level).compress(data),
+            _ZstdStream,
+            default_level=3,
+        )
+    if brotli is not None:
+        codecs["br"] = Codec(
+            "br",
+            lambda data, level: brotli.compress(data, quality=level),
+            _BrotliStream,
+            default_level=4,
+        )
+    codecs["gzip"] = Codec(
+        "gzip",
+        lambda data, level: zlib.compress(data, level, wbits=31),
+        _GzipStream,
+        default_level=6,
+    )
+    return codecs
+
+
+CODECS = _available_codecs()
+
+
+def negotiate_encoding(accept_encoding: str | None) -> str | None:
+    """
+    Accept-Encoding 에서 사용할 Content-Encoding 을 고른다 (None 이면 압축하지 않는다)
+     - q 값이 가장 큰 것, 같으면 서버 선호 순서 (zstd > br > gzip)
+     - "*" 는 따로 적지 않은 나머지 codec 에 적용된다, q=0 은 거절이다
+    """
+    if not accept_encoding:
+        return None
+
+    weights: dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        name, _, params = item.strip().partition(";")
+        weight = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                weight = float(params[2:])
+            except ValueError:
+                weight = 0.0
+        weights[name.strip().lower()] = weight
+
+    wildcard = weights.get("*", 0.0)
+    best, best_weight = None, 0.0
+    for name in CODECS:
+        weight = weights.get(name, wildcard)
+        if weight > best_weight:
+            best, best_weight = name, weight
+    return best
+
+
+class CompressionStats:
+    """
+    codec 별 압축 응답 수 / 입출력 bytes / CPU 시간 (대역폭과 CPU 의 trade-off 조정용)
+    CPU 시간은 압축을 실행한 스레드의 thread_time 으로 잰다 (이벤트 루프 대기 시간 제외)
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._codecs: dict[str, dict] = {}
+
+    def measure(
+        self,
+        name: str,
+        compress: Callable[[bytes], bytes],
+        data: bytes,
+        responses: int = 1,
+    ) -> bytes:
+        # 스트리밍 응답은 청크마다 호출되므로 첫 청크만 responses=1 로 센다
+        started = time.thread_time_ns()
+        compressed = compress(data)
+        cpu_ns = time.thread_time_ns() - started
+
+        with self._lock:
+            codec = self._codecs.setdefault(
+                name, {"responses": 0, "bytes_in": 0, "bytes_out": 0, "cpu_ns": 0}
+            )
+            codec["responses"] += responses
+            codec["bytes_in"] += len(data)
+            codec["bytes_out"] += len(compressed)
+            codec["cpu_ns"] += cpu_ns
+        return compressed
+
+    def stats(self) -> dict:
+        with self._lock:
+            codecs = {name: dict(codec) for name, codec in self._codecs.items()}
+        for codec in codecs.values():
+            codec["cpu_ms"] = round(codec.pop("cpu_ns") / 1_000_000, 3)
+            codec["ratio"] = (
+                round(codec["bytes_out"] / codec["bytes_in"], 4)
+                if codec["bytes_in"]
+                else None
+            )
+        return {"available": list(CODECS), "codecs": codecs}
+
+
+compression_stats = CompressionStats()
+metrics_registry.register("http.compression", compression_stats.stats)
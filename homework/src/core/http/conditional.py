@@ -0,0 +1,62 @@
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+
+from fastapi import Request, Response, status
+
+
+def make_etag(*parts) -> str:
+    # 응답에 들어가는 값으로 만든 strong ETag (값이 같으면 같은 ETag)
+    digest = hashlib.blake2b(repr(parts).encode(), digest_size=16).hexdigest()
+    return f'"{digest}"'
+
+
+def http_date(value: datetime) -> str:
+    # DB 의 naive datetime 은 서버 local time 이다 (datetime.now 로 저장)
+    return format_datetime(value.astimezone(timezone.utc), usegmt=True)
+
+
+def evaluate_conditional(
+    request: Request,
+    response: Response,
+    etag: str,
+    last_modified: datetime | None = None,
+    cache_control: str = "no-cache",
+) -> Response | None:
+    """
+    응답에 ETag / Last-Modified 를 넣고, 클라이언트가 가진 표현과 같으면 304 응답을 돌려준다.
+    (None 이면 평소처럼 DTO 를 만들어 반환한다. 304 는 body 를 만들지 않는다)
+     - If-None-Match 가 있으면 그것만 비교한다 (RFC 9110 13.2.2, weak 비교)
+     - 없을 때만 If-Modified-Since 를 초 단위로 비교한다
+    """
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    if last_modified is not None:
+        headers["Last-Modified"] = http_date(last_modified)
+    response.headers.update(headers)
+
+    if is_not_modified(request, etag, last_modified):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return None
+
+
+def is_not_modified(
+    request: Request, etag: str, last_modified: datetime | None
+) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+        # 압축 응답은 weak ETag 로 나가므로 양쪽 모두 weak 비교한다
+        return "*" in tags or etag.removeprefix("W/") in tags
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is None or last_modified is None:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        return False
+    # Last-Modified 는 초 단위로 보냈으므로 같은 초 안의 변경은 같다고 본다
+    modified = last_modified.astimezone(timezone.utc).replace(microsecond=0)
+    return modified <= since
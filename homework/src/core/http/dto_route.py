@@ -0,0 +1,155 @@
+import functools
+import inspect
+from typing import Any, Callable
+
+from fastapi import FastAPI, Response
+from fastapi.routing import APIRoute
+from pydantic import BaseModel
+
+# FastAPI 가 handler 와 같은 sub-response 를 넣어 주는 wrapper 전용 인자
+_SUB_RESPONSE = "_dto_sub_response"
+
+
+class DtoJsonRoute(APIRoute):
+    """
+    handler 가 response_model 인스턴스(build 로 이미 검증된 DTO)를 반환하면
+    FastAPI 의 재검증(validate) + jsonable_encoder + json.dumps 를 건너뛰고
+    pydantic-core(Rust) serializer 로 한 번에 JSON bytes 를 만든다.
+    그 외의 반환값(dict, 304 Response, 하위 클래스 등)은 기존 경로로 처리된다.
+    """
+
+    def __init__(self, path: str, endpoint: Callable[..., Any], **kwargs: Any):
+        response_model = kwargs.get("response_model")
+        if _encodes_directly(endpoint, response_model, kwargs):
+            endpoint = _dto_endpoint(
+                endpoint, response_model, kwargs.get("status_code")
+            )
+        super().__init__(path, endpoint, **kwargs)
+
+    @classmethod
+    def from_route(cls, route: APIRoute) -> "DtoJsonRoute":
+        # include_router 로 합쳐진 route 의 설정을 그대로 옮긴다
+        return cls(
+            route.path,
+            route.endpoint,
+            response_model=route.response_model,
+            status_code=route.status_code,
+            tags=route.tags,
+            dependencies=route.dependencies,
+            summary=route.summary,
+            description=route.description,
+            response_description=route.response_description,
+            responses=route.responses,
+            deprecated=route.deprecated,
+            name=route.name,
+            methods=route.methods,
+            operation_id=route.operation_id,
+            response_model_include=route.response_model_include,
+            response_model_exclude=route.response_model_exclude,
+            response_model_by_alias=route.response_model_by_alias,
+            response_model_exclude_unset=route.response_model_exclude_unset,
+            response_model_exclude_defaults=route.response_model_exclude_defaults,
+            response_model_exclude_none=route.response_model_exclude_none,
+            include_in_schema=route.include_in_schema,
+            response_class=route.response_class,
+            dependency_overrides_provider=route.dependency_overrides_provider,
+            callbacks=route.callbacks,
+            openapi_extra=route.openapi_extra,
+            generate_unique_id_function=route.generate_unique_id_function,
+        )
+
+
+def use_dto_json_routes(app: FastAPI) -> None:
+    # include_router 뒤에 호출한다 (이미 추가된 APIRoute 를 DtoJsonRoute 로 바꾼다)
+    for i, route in enumerate(app.router.routes):
+        if type(route) is APIRoute:
+            app.router.routes[i] = DtoJsonRoute.from_route(route)
+
+
+def _encodes_directly(
+    endpoint: Callable[..., Any], response_model: Any, kwargs: dict
+) -> bool:
+    if not (isinstance(response_model, type) and issubclass(response_model, BaseModel)):
+        return False
+    # include / exclude 옵션이 있는 route 는 FastAPI 의 직렬화를 그대로 쓴다
+    if any(
+        kwargs.get(option)
+        for option in (
+            "response_model_include",
+            "response_model_exclude",
+            "response_model_exclude_unset",
+            "response_model_exclude_defaults",
+            "response_model_exclude_none",
+        )
+    ):
+        return False
+    # wrapper 는 keyword-only 인자를 하나 더 받으므로 *args / **kwargs handler 는 제외한다
+    parameters = inspect.signature(endpoint).parameters.values()
+    return all(
+        parameter.kind
+        not in (inspect.Parameter.VAR_POSITIONAL, inspect.Parameter.VAR_KEYWORD)
+        for parameter in parameters
+    )
+
+
+def _dto_endpoint(
+    endpoint: Callable[..., Any],
+    response_model: type[BaseModel],
+    status_code: int | None,
+) -> Callable[..., Any]:
+    serializer = response_model.__pydantic_serializer__
+
+    def render(result: Any, sub_response: Response) -> Any:
+        if type(result) is not response_model:
+            return result
+        response = Response(
+            content=serializer.to_json(result, by_alias=True),
+            status_code=sub_response.status_code or status_code or 200,
+            media_type="application/json",
+        )
+        # handler 가 response 인자에 넣은 헤더(ETag 등)와 쿠키를 옮긴다
+        response.headers.raw.extend(sub_response.headers.raw)
+        return response
+
+    # FastAPI 는 Response 인자를 하나만 채우므로 handler 에 이미 있으면 그 인자를 같이 쓴다
+    signature = inspect.signature(endpoint, eval_str=True)
+    response_name = next(
+        (
+            name
+            for name, parameter in signature.parameters.items()
+            if isinstance(parameter.annotation, type)
+            and issubclass(parameter.annotation, Response)
+        ),
+        None,
+    )
+    if response_name is None:
+        response_name = _SUB_RESPONSE
+        sub_response_parameter = inspect.Parameter(
+            _SUB_RESPONSE, inspect.Parameter.KEYWORD_ONLY, annotation=Response
+        )
+        signature = signature.replace(
+            parameters=[*signature.parameters.values(), sub_response_parameter]
+        )
+
+    def pop_sub_response(kwargs: dict) -> Response:
+        if response_name == _SUB_RESPONSE:
+            return kwargs.pop(_SUB_RESPONSE)
+        return kwargs[response_name]
+
+    # FastAPI 는 handler 가 async 인지 보고 sync handler 를 threadpool 에서 실행하므로 그대로 맞춘다
+    if inspect.iscoroutinefunction(endpoint):
+
+        @functools.wraps(endpoint)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            sub_response = pop_sub_response(kwargs)
+            return render(await endpoint(*args, **kwargs), sub_response)
+
+    else:
+
+        @functools.wraps(endpoint)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            sub_response = pop_sub_response(kwargs)
+            return render(endpoint(*args, **kwargs), sub_response)
+
+    wrapper.__signature__ = signature
+    return wrapper
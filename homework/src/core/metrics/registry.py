@@ -0,0 +1,37 @@
+import logging
+import threading
+from typing import Callable
+
+logger = logging.getLogger(__name__)
+
+
+class MetricsRegistry:
+    """
+    이름 -> 수집 함수 목록
+    수집 함수는 호출 시점의 값을 dict 로 반환한다 (GET /admin/metrics 에서 모아서 반환)
+    """
+
+    def __init__(self):
+        self._collectors: dict[str, Callable[[], dict]] = {}
+        self._lock = threading.Lock()
+
+    def register(self, name: str, collector: Callable[[], dict]) -> None:
+        with self._lock:
+            self._collectors[name] = collector
+
+    def collect(self) -> dict[str, dict]:
+        with self._lock:
+            collectors = dict(self._collectors)
+
+        metrics = {}
+        for name, collector in collectors.items():
+            try:
+                metrics[name] = collector()
+            except Exception:
+                # 한 수집 함수가 실패해도 나머지 지표는 반환한다
+                logger.exception("metrics collector %s failed", name)
+                metrics[name] = {"error": "collect failed"}
+        return metrics
+
+
+metrics_registry = MetricsRegistry()
@@ -0,0 +1,31 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+
+from core.authenticate.services.authenticate_service import AuthenticateService
+from core.config import settings
+from core.metrics.registry import metrics_registry
+
+
+# 가입은 누구나 할 수 있으므로 로그인만으로는 부족하다 -> 설정된 관리자만 허용한다
+def get_admin_username(
+    username: str = Depends(AuthenticateService.get_username),
+) -> str:
+    if username not in settings.admin_usernames:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="관리자만 사용할 수 있는 API 이다",
+        )
+    return username
+
+
+router = APIRouter(
+    prefix="/admin", tags=["Admin"], dependencies=[Depends(get_admin_username)]
+)
+
+
+@router.get(
+    "/metrics",
+    description="커넥션 풀 / 캐시 등 서버 내부 지표를 반환하는 API입니다 (관리자 전용)",
+    status_code=status.HTTP_200_OK,
+)
+def get_metrics_handler() -> dict[str, dict]:
+    return metrics_registry.collect()
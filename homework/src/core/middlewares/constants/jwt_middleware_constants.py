@@ -3,3 +3,7 @@ from core.config import settings
 JWT_SECRET_KEY = settings.jwt_secret_key
 JWT_ALGORITHM = "HS256"
 JWT_EXPIRY_SECONDS = 24 * 60 * 60  # 하루: 24시간 * 60분 * 60초
+
+# JWTAuthMiddleware 가 scope["state"] 에 남기는 값의 key
+JWT_CLAIMS_STATE_KEY = "jwt_claims"
+JWT_AUTH_ERROR_STATE_KEY = "jwt_auth_error"
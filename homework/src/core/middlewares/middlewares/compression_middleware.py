@@ -0,0 +1,174 @@
+import asyncio
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from core.http.compression import (
+    CODECS,
+    CompressionStats,
+    StreamCompressor,
+    negotiate_encoding,
+)
+
+# 이보다 큰 body 는 이벤트 루프를 막지 않도록 스레드에서 압축한다 (zlib 등은 GIL 을 놓는다)
+_THREAD_OFFLOAD_BYTES = 256 * 1024
+_COMPRESSIBLE_TYPES = frozenset(
+    (
+        "application/json",
+        "application/x-ndjson",
+        "application/javascript",
+        "application/xml",
+        "image/svg+xml",
+    )
+)
+
+
+class CompressionMiddleware:
+    """
+    순수 ASGI 응답 압축 미들웨어 (Accept-Encoding 협상: zstd > br > gzip, 설치된 것만)
+     - body 가 한 번에 오는 응답은 minimum_size 이상일 때만 압축하고 Content-Length 를 고친다
+     - StreamingResponse 처럼 나눠 오는 응답은 청크마다 압축 + flush 해서 바로 보낸다
+     - level 은 route path 별 설정(route_levels) -> 기본 설정(levels) -> codec 기본값 순으로 정한다
+     - 압축한 응답의 ETag 는 weak 로 바꾼다 (같은 표현의 다른 encoding)
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int,
+        levels: dict[str, int],
+        route_levels: dict[str, dict[str, int]],
+        stats: CompressionStats,
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.levels = levels
+        self.route_levels = route_levels
+        self.stats = stats
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding"))
+        responder = _CompressionResponder(self, scope, send, encoding)
+        await self.app(scope, receive, responder.send)
+
+    def level(self, scope: Scope, encoding: str) -> int:
+        # 라우팅이 끝난 뒤에는 scope["route"] 에 매칭된 route 가 있다
+        path = getattr(scope.get("route"), "path", scope["path"])
+        route_levels = self.route_levels.get(path, {})
+        if encoding in route_levels:
+            return route_levels[encoding]
+        return self.levels.get(encoding, CODECS[encoding].default_level)
+
+    async def compress(self, encoding: str, compress, data: bytes, responses: int):
+        if len(data) >= _THREAD_OFFLOAD_BYTES:
+            return await asyncio.to_thread(
+                self.stats.measure, encoding, compress, data, responses
+            )
+        return self.stats.measure(encoding, compress, data, responses)
+
+
+class _CompressionResponder:
+    def __init__(
+        self,
+        middleware: CompressionMiddleware,
+        scope: Scope,
+        send: Send,
+        encoding: str | None,
+    ):
+        self.middleware = middleware
+        self.scope = scope
+        self._send = send
+        self.encoding = encoding
+        self.start: Message | None = None
+        self.streamer: StreamCompressor | None = None
+
+    async def send(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            headers = MutableHeaders(scope=message)
+            if _is_compressible(message["status"], headers):
+                _add_vary(headers)
+                if self.encoding is not None:
+                    # 첫 body 를 보고 압축 여부 / 방식을 정할 때까지 보내지 않는다
+                    self.start = message
+                    return
+            await self._send(message)
+            return
+
+        if message["type"] != "http.response.body" or (
+            self.start is None and self.streamer is None
+        ):
+            await self._send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self.streamer is not None:
+            await self._send_chunk(body, more_body, responses=0)
+            return
+
+        start, self.start = self.start, None
+        headers = MutableHeaders(scope=start)
+        codec = CODECS[self.encoding]
+        level = self.middleware.level(self.scope, self.encoding)
+
+        if not more_body:
+            if len(body) < self.middleware.minimum_size:
+                await self._send(start)
+                await self._send(message)
+                return
+            body = await self.middleware.compress(
+                self.encoding, lambda data: codec.compress(data, level), body, 1
+            )
+            headers["Content-Length"] = str(len(body))
+            self._mark_encoded(headers)
+            await self._send(start)
+            await self._send({"type": "http.response.body", "body": body})
+            return
+
+        # 전체 크기를 모르는 스트리밍 응답
+        if "content-length" in headers:
+            del headers["Content-Length"]
+        self._mark_encoded(headers)
+        self.streamer = codec.streamer(level)
+        await self._send(start)
+        await self._send_chunk(body, more_body, responses=1)
+
+    async def _send_chunk(self, body: bytes, more_body: bool, responses: int) -> None:
+        streamer = self.streamer
+
+        def compress(data: bytes) -> bytes:
+            compressed = streamer.compress(data)
+            return compressed if more_body else compressed + streamer.finish()
+
+        data = await self.middleware.compress(self.encoding, compress, body, responses)
+        await self._send(
+            {"type": "http.response.body", "body": data, "more_body": more_body}
+        )
+
+    def _mark_encoded(self, headers: MutableHeaders) -> None:
+        headers["Content-Encoding"] = self.encoding
+        etag = headers.get("etag")
+        if etag is not None and not etag.startswith("W/"):
+            headers["ETag"] = f"W/{etag}"
+
+
+def _is_compressible(status: int, headers: MutableHeaders) -> bool:
+    if status < 200 or status in (204, 206, 304) or "content-encoding" in headers:
+        return False
+    if "no-transform" in headers.get("cache-control", "").lower():
+        return False
+    content_type = headers.get("content-type", "").split(";")[0].strip().lower()
+    return content_type.startswith("text/") or content_type in _COMPRESSIBLE_TYPES
+
+
+def _add_vary(headers: MutableHeaders) -> None:
+    vary = headers.get("vary")
+    if vary is None:
+        headers["Vary"] = "Accept-Encoding"
+    elif "accept-encoding" not in vary.lower():
+        headers["Vary"] = f"{vary}, Accept-Encoding"
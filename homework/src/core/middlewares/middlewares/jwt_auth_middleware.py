@@ -1,14 +1,15 @@
 import time
 
 import jwt
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
-from starlette.requests import Request
-from starlette.responses import Response
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
+from core.authenticate.services.token_verifier import token_verifier
 from core.middlewares.constants.jwt_middleware_constants import (
-    JWT_EXPIRY_SECONDS,
     JWT_SECRET_KEY,
     JWT_ALGORITHM,
+    JWT_CLAIMS_STATE_KEY,
+    JWT_AUTH_ERROR_STATE_KEY,
 )
 from core.middlewares.dtos.jwt_payload_typed_dict import JwtPayloadTypedDict
 from core.middlewares.exceptions.custom_exceptions import (
@@ -17,19 +18,33 @@ from core.middlewares.exceptions.custom_exceptions import (
 )
 
 
-class JWTAuthMiddleware(BaseHTTPMiddleware):
-    def __init__(self, app):
-        super().__init__(app)
+class JWTAuthMiddleware:
+    """
+    순수 ASGI 미들웨어 (BaseHTTPMiddleware 의 task / memory stream 비용이 없다)
+     - 토큰 검증은 여기서 한 번만 하고 결과를 scope["state"] 에 남긴다
+       성공: JWT_CLAIMS_STATE_KEY -> payload, 실패: JWT_AUTH_ERROR_STATE_KEY -> 사유
+     - 요청을 거절하지 않는다. 거절은 AuthenticateService.get_username 의 몫이다
+     - access 토큰이 만료되고 refresh 토큰이 유효하면 응답 헤더로 새 access 토큰을 내려준다
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
         self.secret_key = JWT_SECRET_KEY
         self.algorithm = JWT_ALGORITHM
 
-    async def dispatch(
-        self, request: Request, call_next: RequestResponseEndpoint
-    ) -> Response:
-        auth_header = request.headers.get("Authorization")
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        state = scope.setdefault("state", {})
+        headers = Headers(scope=scope)
+        auth_header = headers.get("Authorization")
 
         if auth_header is None or not auth_header.startswith("Bearer "):
-            return await call_next(request)
+            state[JWT_AUTH_ERROR_STATE_KEY] = "JWT access not provided"
+            await self.app(scope, receive, send)
+            return
 
         token = auth_header.split(" ")[1]
 
@@ -39,36 +54,61 @@ class JWTAuthMiddleware(BaseHTTPMiddleware):
             if not self._is_valid_token(access_token_payload):
                 raise ExpiredTokenException()
 
-            return await call_next(request)
+        except jwt.InvalidTokenError:
+            state[JWT_AUTH_ERROR_STATE_KEY] = "Invalid token"
+            await self.app(scope, receive, send)
+            return
 
-        except ExpiredTokenException:
-            refresh_token = request.headers.get("X-Refresh-Token")
+        except ExpiredTokenException as exc:
+            new_access_token = self._refresh_access_token(headers, state, exc)
 
-            if refresh_token is None:
-                raise InvalidRefreshTokenException()
+            if new_access_token is None:
+                await self.app(scope, receive, send)
+                return
 
-            refresh_token_payload = self._decode_access_token(refresh_token)
+            state[JWT_CLAIMS_STATE_KEY] = access_token_payload
 
-            new_access_token = self._create_access_token(
-                username=refresh_token_payload["username"]
-            )
+            async def send_with_new_access_token(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    MutableHeaders(scope=message).append(
+                        "X-Custom-Header", new_access_token
+                    )
+                await send(message)
 
-            response = await call_next(request)
+            await self.app(scope, receive, send_with_new_access_token)
+            return
 
-            response.headers["X-Custom-Header"] = new_access_token
+        state[JWT_CLAIMS_STATE_KEY] = access_token_payload
+        await self.app(scope, receive, send)
 
-            return response
+    def _refresh_access_token(
+        self, headers: Headers, state: dict, exc: ExpiredTokenException
+    ) -> str | None:
+        refresh_token = headers.get("X-Refresh-Token")
 
-    def _decode_access_token(self, token: JwtPayloadTypedDict) -> dict:
-        return jwt.decode(
-            jwt=token,
-            key=self.secret_key,
-            algorithms=[self.algorithm],
-        )
+        if refresh_token is None:
+            state[JWT_AUTH_ERROR_STATE_KEY] = str(InvalidRefreshTokenException())
+            return None
+
+        try:
+            refresh_token_payload = token_verifier.decode_refresh_token(refresh_token)
+        except jwt.InvalidTokenError:
+            state[JWT_AUTH_ERROR_STATE_KEY] = "Invalid token"
+            return None
+
+        if not token_verifier.is_valid_refresh_token(refresh_token_payload):
+            state[JWT_AUTH_ERROR_STATE_KEY] = str(exc)
+            return None
+
+        return self._create_access_token(username=refresh_token_payload["username"])
+
+    @staticmethod
+    def _decode_access_token(token: str) -> JwtPayloadTypedDict:
+        return token_verifier.decode_access_token(token)
 
     @staticmethod
     def _is_valid_token(payload: JwtPayloadTypedDict) -> bool:
-        return time.time() < payload["isa"] + JWT_EXPIRY_SECONDS
+        return token_verifier.is_valid_access_token(payload)
 
     def _create_access_token(self, username: str) -> str:
         payload: JwtPayloadTypedDict = {
@@ -0,0 +1,227 @@
+import asyncio
+import logging
+import time
+from email.utils import parsedate_to_datetime
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.requests import Request
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from core.cache.response_cache import (
+    SURROGATE_KEY_HEADER,
+    CachedResponse,
+    ResponseCache,
+)
+from core.http.compression import negotiate_encoding
+from core.http.conditional import is_not_modified
+
+logger = logging.getLogger(__name__)
+
+# 304 응답에 그대로 실어 보내는 헤더
+_NOT_MODIFIED_HEADERS = (b"etag", b"cache-control", b"last-modified")
+# 백그라운드 재생성 요청에서 빼는 헤더 (304 가 아닌 전체 응답을 받아야 한다)
+_CONDITIONAL_HEADERS = (b"if-none-match", b"if-modified-since")
+
+
+class ResponseCacheMiddleware:
+    """
+    순수 ASGI 응답 캐시 미들웨어
+     - 익명 GET 요청만 본다 (Authorization / Cookie 가 있으면 그대로 app 으로 보낸다)
+     - 내부용 Surrogate-Key 헤더는 저장 여부와 관계없이 모든 응답에서 뗀다
+     - handler 가 Surrogate-Key 헤더로 tag 를 단 200 응답만 저장한다
+       (Set-Cookie / private / no-store 응답, max_body_bytes 를 넘는 응답은 저장하지 않는다)
+     - hit 은 저장된 bytes 를 그대로 보낸다 (DB 조회, DTO 직렬화, 압축, 인증 미들웨어를 거치지 않는다)
+       항목은 협상된 Content-Encoding 별로 따로 저장되므로 압축은 항목당 한 번이다
+     - stale 항목은 바로 보내고, 같은 key 의 재생성은 워커당 하나만 백그라운드에서 실행한다
+     - 응답에 X-Cache: HIT / STALE / MISS 를 단다
+    """
+
+    def __init__(self, app: ASGIApp, cache: ResponseCache):
+        self.app = app
+        self.cache = cache
+        self._revalidating: dict[str, asyncio.Task] = {}
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        headers = Headers(scope=scope)
+        if (
+            scope["method"] != "GET"
+            or "authorization" in headers
+            or "cookie" in headers
+        ):
+            # 저장하지 않는 응답에서도 내부용 Surrogate-Key 는 떼고 보낸다
+            await self.app(scope, receive, _without_surrogate_keys(send))
+            return
+
+        # 안쪽의 CompressionMiddleware 와 같은 협상 결과로 저장된 (압축된) 항목을 찾는다
+        encoding = negotiate_encoding(headers.get("accept-encoding"))
+        key = self.cache.key(scope["path"], scope["query_string"], encoding)
+        entry = await self.cache.aget(key)
+        if entry is None:
+            self.cache.record("misses")
+            await self._fill(scope, receive, send, key)
+            return
+
+        now = time.time()
+        if self.cache.is_fresh(entry, now):
+            self.cache.record("hits")
+            await self._send_cached(scope, send, entry, now, b"HIT")
+        else:
+            self.cache.record("stale_hits")
+            self._revalidate_in_background(scope, key)
+            await self._send_cached(scope, send, entry, now, b"STALE")
+
+    async def _fill(
+        self, scope: Scope, receive: Receive, send: Send | None, key: str
+    ) -> None:
+        # 응답을 만들기 시작한 시각: 이 뒤의 purge 는 이번 응답을 무효로 만든다
+        started_at = time.time()
+        start: Message | None = None
+        tags: tuple[str, ...] = ()
+        chunks: list[bytes] = []
+        size = 0
+
+        async def send_and_capture(message: Message) -> None:
+            nonlocal start, tags, size
+            if message["type"] == "http.response.start":
+                response_headers = MutableHeaders(scope=message)
+                tags = tuple(response_headers.get(SURROGATE_KEY_HEADER, "").split())
+                if SURROGATE_KEY_HEADER in response_headers:
+                    del response_headers[SURROGATE_KEY_HEADER]
+                if tags:
+                    response_headers.append("X-Cache", "MISS")
+                    if _is_cacheable(message["status"], response_headers):
+                        start = message
+            elif message["type"] == "http.response.body" and start is not None:
+                size += len(message.get("body", b""))
+                if size > self.cache.max_body_bytes:
+                    start = None
+                    chunks.clear()
+                else:
+                    chunks.append(message.get("body", b""))
+
+            if send is not None:
+                await send(message)
+
+        await self.app(scope, receive, send_and_capture)
+
+        if start is None:
+            return
+        # X-Cache 는 보낼 때마다 다시 단다
+        stored_headers = [
+            (name, value) for name, value in start["headers"] if name != b"x-cache"
+        ]
+        entry = CachedResponse(
+            status=start["status"],
+            headers=stored_headers,
+            body=b"".join(chunks),
+            started_at=started_at,
+            tags=tags,
+        )
+        await self.cache.astore(key, entry)
+
+    async def _send_cached(
+        self,
+        scope: Scope,
+        send: Send,
+        entry: CachedResponse,
+        now: float,
+        state: bytes,
+    ) -> None:
+        extra = [(b"x-cache", state), (b"age", str(int(entry.age(now))).encode())]
+        if _is_not_modified(scope, entry):
+            headers = [
+                (name, value)
+                for name, value in entry.headers
+                if name in _NOT_MODIFIED_HEADERS
+            ]
+            await send(
+                {
+                    "type": "http.response.start",
+                    "status": 304,
+                    "headers": headers + extra,
+                }
+            )
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        await send(
+            {
+                "type": "http.response.start",
+                "status": entry.status,
+                "headers": entry.headers + extra,
+            }
+        )
+        await send({"type": "http.response.body", "body": entry.body})
+
+    def _revalidate_in_background(self, scope: Scope, key: str) -> None:
+        if key in self._revalidating:
+            return
+
+        revalidate_scope = dict(scope)
+        revalidate_scope["headers"] = [
+            (name, value)
+            for name, value in scope["headers"]
+            if name not in _CONDITIONAL_HEADERS
+        ]
+        revalidate_scope["state"] = {}
+
+        task = asyncio.create_task(self._revalidate(revalidate_scope, key))
+        self._revalidating[key] = task
+        task.add_done_callback(lambda _: self._revalidating.pop(key, None))
+
+    async def _revalidate(self, scope: Scope, key: str) -> None:
+        self.cache.record("revalidations")
+        finished = asyncio.Event()
+        request_sent = False
+
+        async def receive() -> Message:
+            nonlocal request_sent
+            if not request_sent:
+                request_sent = True
+                return {"type": "http.request", "body": b"", "more_body": False}
+            # 응답을 다 만들 때까지 연결이 살아 있는 것으로 둔다
+            await finished.wait()
+            return {"type": "http.disconnect"}
+
+        try:
+            await self._fill(scope, receive, None, key)
+        except Exception:
+            # 실패해도 stale 항목은 그대로 두고 다음 요청에서 다시 시도한다
+            logger.exception("response cache revalidation failed: %s", key)
+        finally:
+            finished.set()
+
+
+def _without_surrogate_keys(send: Send) -> Send:
+    async def send_without_surrogate_keys(message: Message) -> None:
+        if message["type"] == "http.response.start":
+            response_headers = MutableHeaders(scope=message)
+            if SURROGATE_KEY_HEADER in response_headers:
+                del response_headers[SURROGATE_KEY_HEADER]
+        await send(message)
+
+    return send_without_surrogate_keys
+
+
+def _is_cacheable(status: int, headers: MutableHeaders) -> bool:
+    if status != 200 or "set-cookie" in headers:
+        return False
+    cache_control = headers.get("cache-control", "").lower()
+    return "private" not in cache_control and "no-store" not in cache_control
+
+
+def _is_not_modified(scope: Scope, entry: CachedResponse) -> bool:
+    headers = Headers(raw=entry.headers)
+    etag = headers.get("etag")
+    if etag is None:
+        return False
+    last_modified = headers.get("last-modified")
+    return is_not_modified(
+        Request(scope),
+        etag,
+        parsedate_to_datetime(last_modified) if last_modified else None,
+    )
@@ -0,0 +1,64 @@
+from starlette.datastructures import Headers
+from starlette.exceptions import HTTPException
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from core.storage.exceptions.custom_exceptions import ContentTooLargeException
+
+
+class UploadLimitMiddleware:
+    """
+    업로드 요청 body 크기를 form 파싱 전에 제한한다 (순수 ASGI 미들웨어)
+     - Starlette 는 multipart body 를 끝까지 읽어 임시 파일에 옮긴 뒤에 handler 를 부르므로
+       handler / 저장소의 크기 검사만으로는 큰 업로드를 디스크에 쓰는 것을 막을 수 없다
+     - Content-Length 가 limit 을 넘으면 body 를 읽지 않고 바로 413
+     - Content-Length 가 없으면(chunked) 읽은 양을 세다가 넘는 순간 413 (나머지는 읽지 않는다)
+    limits: path prefix -> body 최대 bytes (파일 + multipart boundary / header)
+    """
+
+    def __init__(self, app: ASGIApp, limits: dict[str, int]):
+        self.app = app
+        self.limits = limits
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        max_bytes = self._limit_of(scope) if scope["type"] == "http" else None
+        if max_bytes is None:
+            await self.app(scope, receive, send)
+            return
+
+        content_length = Headers(scope=scope).get("content-length")
+        if content_length is not None and content_length.isdigit():
+            if int(content_length) > max_bytes:
+                response = JSONResponse(
+                    content=str(ContentTooLargeException(max_bytes)),
+                    status_code=413,
+                    headers={"Connection": "close"},
+                )
+                await response(scope, receive, send)
+                return
+            await self.app(scope, receive, send)
+            return
+
+        received = 0
+
+        async def limited_receive() -> Message:
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > max_bytes:
+                    # FastAPI 는 body 파싱 중 HTTPException 을 그대로 전달한다
+                    raise HTTPException(
+                        status_code=413, detail=str(ContentTooLargeException(max_bytes))
+                    )
+            return message
+
+        await self.app(scope, limited_receive, send)
+
+    def _limit_of(self, scope: Scope) -> int | None:
+        if scope["method"] not in ("POST", "PUT", "PATCH"):
+            return None
+        for prefix, max_bytes in self.limits.items():
+            if scope["path"].startswith(prefix):
+                return max_bytes
+        return None
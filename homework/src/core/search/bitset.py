@@ -0,0 +1,30 @@
+import re
+from array import array
+from typing import Iterable, Iterator
+
+# Python int 를 bitset 으로 사용한다 (AND / OR / XOR 가 C 에서 한 번에 처리된다)
+_NONZERO_BYTE = re.compile(rb"[^\x00]")
+
+
+def to_bitset(ids: Iterable[int]) -> int:
+    # 정렬된 배열이면 그대로, 아니면 정렬해서 마지막 id 로 크기를 정한다
+    if not isinstance(ids, array):
+        ids = sorted(ids)
+    if not ids:
+        return 0
+    buffer = bytearray((ids[-1] >> 3) + 1)
+    for i in ids:
+        buffer[i >> 3] |= 1 << (i & 7)
+    return int.from_bytes(buffer, "little")
+
+
+def iter_bits(bits: int) -> Iterator[int]:
+    # 0 인 byte 는 정규식(C)으로 건너뛰고 켜진 bit 의 위치만 오름차순으로 돌려준다
+    data = bits.to_bytes((bits.bit_length() + 7) // 8, "little")
+    for match in _NONZERO_BYTE.finditer(data):
+        base = match.start() << 3
+        byte = data[match.start()]
+        while byte:
+            low = byte & -byte
+            yield base + low.bit_length() - 1
+            byte ^= low
@@ -0,0 +1,151 @@
+import bisect
+from array import array
+from collections import defaultdict
+from typing import Iterable, Iterator
+
+from core.search.bitset import iter_bits, to_bitset
+
+# posting 길이 * _DENSE_RATIO 가 doc id 범위 이상이면 배열 대신 bitset(int) 으로 둔다
+# (bitset 은 doc id 범위 / 8 byte 이므로 같은 posting 의 uint32 배열보다 최대 4배 크다)
+_DENSE_RATIO = 128
+# 한 trigram 에서 이보다 적게 바뀌면 복사본에 끼워 넣고, 많으면 집합 연산으로 다시 만든다
+_SMALL_UPDATE = 8
+
+Posting = array | int
+
+
+def trigrams(text: str) -> frozenset[str]:
+    # pg_trgm 처럼 앞에 공백 2개, 뒤에 1개를 붙여서 단어의 시작/끝도 trigram 에 담는다
+    padded = f"  {text.casefold()} "
+    return frozenset(padded[i : i + 3] for i in range(len(padded) - 2))
+
+
+def similarity(a: frozenset[str], b: frozenset[str]) -> float:
+    # 공유 trigram 비율 (Jaccard)
+    shared = len(a & b)
+    return shared / (len(a) + len(b) - shared) if shared else 0.0
+
+
+def word_similarity(query: frozenset[str], text: frozenset[str]) -> float:
+    # query trigram 중 text 에 있는 비율 (pg_trgm word_similarity 와 비슷하다)
+    # 짧은 검색어가 긴 이름의 접두어 / 일부일 때도 높게 나온다
+    return len(query & text) / len(query) if query else 0.0
+
+
+class TrigramIndex:
+    """
+    trigram -> doc id posting (inverted index)
+     - 드문 trigram 은 정렬된 uint32 배열, 흔한 trigram 은 bitset(int) 으로 둔다
+     - posting 은 바꿀 때 새 객체로 교체하므로 읽는 쪽은 lock 없이 사용할 수 있다
+       (쓰기끼리는 호출하는 쪽에서 직렬화한다)
+     - matches 는 query 와 공유하는 trigram 수별 doc bitset 을 많은 쪽부터 돌려준다
+    """
+
+    def __init__(self):
+        self._postings: dict[str, Posting] = {}
+        self._id_space = 0  # 가장 큰 doc id + 1
+
+    @classmethod
+    def build(cls, docs: Iterable[tuple[int, str]]) -> "TrigramIndex":
+        postings: defaultdict[str, list[int]] = defaultdict(list)
+        # id 순으로 넣으면 posting 이 정렬된 채로 만들어진다
+        for doc_id, text in sorted(docs):
+            for gram in trigrams(text):
+                postings[gram].append(doc_id)
+
+        index = cls()
+        index._id_space = 1 + max((ids[-1] for ids in postings.values()), default=-1)
+        index._postings = {
+            gram: index._compact(array("I", ids)) for gram, ids in postings.items()
+        }
+        return index
+
+    def __len__(self) -> int:
+        return len(self._postings)
+
+    def update(self, changes: Iterable[tuple[int, str | None, str | None]]) -> None:
+        # changes: (doc id, 이전 text, 새 text). None 은 없음(추가/삭제)
+        removed: defaultdict[str, set[int]] = defaultdict(set)
+        added: defaultdict[str, set[int]] = defaultdict(set)
+        for doc_id, old_text, new_text in changes:
+            old = trigrams(old_text) if old_text is not None else frozenset()
+            new = trigrams(new_text) if new_text is not None else frozenset()
+            for gram in old - new:
+                removed[gram].add(doc_id)
+            for gram in new - old:
+                added[gram].add(doc_id)
+                self._id_space = max(self._id_space, doc_id + 1)
+
+        for gram in removed.keys() | added.keys():
+            posting = self._posting(
+                self._postings.get(gram, array("I")),
+                removed.get(gram, set()),
+                added.get(gram, set()),
+            )
+            if posting:
+                self._postings[gram] = self._compact(posting)
+            else:
+                self._postings.pop(gram, None)
+
+    def matches(
+        self, grams: frozenset[str], min_shared: int
+    ) -> Iterator[tuple[int, int]]:
+        """
+        (공유 trigram 수, 그만큼 공유하는 doc bitset) 을 공유 수가 많은 쪽부터 min_shared 까지 돌려준다.
+        doc 마다 수를 세지 않고 posting bitset 을 bit 단위 덧셈으로 더해서
+        공유 수의 자리별 bitset 을 만든다 (planes[j] = 공유 수의 j 번째 bit 가 켜진 doc).
+        """
+        planes: list[int] = []
+        for gram in grams:
+            posting = self._postings.get(gram)
+            if posting is None:
+                continue
+            carry = posting if isinstance(posting, int) else to_bitset(posting)
+            for j, plane in enumerate(planes):
+                planes[j], carry = plane ^ carry, plane & carry
+                if not carry:
+                    break
+            if carry:
+                planes.append(carry)
+
+        if not planes:
+            return
+        full = (1 << max(plane.bit_length() for plane in planes)) - 1
+        top = min(len(grams), (1 << len(planes)) - 1)
+        for shared in range(top, min_shared - 1, -1):
+            bits = full
+            for j, plane in enumerate(planes):
+                bits &= plane if shared >> j & 1 else full ^ plane
+                if not bits:
+                    break
+            if bits:
+                yield shared, bits
+
+    def _compact(self, posting: Posting) -> Posting:
+        if isinstance(posting, int):
+            # 경계에서 오가지 않도록 절반 아래로 드물어졌을 때 배열로 돌린다
+            if posting.bit_count() * _DENSE_RATIO * 2 < self._id_space:
+                return array("I", iter_bits(posting))
+            return posting
+        if len(posting) * _DENSE_RATIO >= self._id_space:
+            return to_bitset(posting)
+        return posting
+
+    @staticmethod
+    def _posting(posting: Posting, removed: set[int], added: set[int]) -> Posting:
+        if isinstance(posting, int):
+            return (posting | to_bitset(added)) & ~to_bitset(removed)
+
+        if len(removed) + len(added) > _SMALL_UPDATE:
+            return array("I", sorted(set(posting).difference(removed).union(added)))
+
+        posting = posting[:]
+        for doc_id in removed:
+            i = bisect.bisect_left(posting, doc_id)
+            if i < len(posting) and posting[i] == doc_id:
+                del posting[i]
+        for doc_id in added:
+            i = bisect.bisect_left(posting, doc_id)
+            if i == len(posting) or posting[i] != doc_id:
+                posting.insert(i, doc_id)
+        return posting
@@ -0,0 +1,100 @@
+import hashlib
+import os
+import tempfile
+import threading
+from typing import BinaryIO, NamedTuple
+
+from core.storage.exceptions.custom_exceptions import ContentTooLargeException
+
+
+class StoredContent(NamedTuple):
+    hash: str  # sha256 hex
+    size: int
+    path: str
+    created: bool  # False 면 같은 내용이 이미 있었다 (중복 업로드)
+
+
+class ContentAddressedStore:
+    """
+    내용의 sha256 을 이름으로 파일을 저장한다 (같은 내용은 한 번만 저장된다)
+     - <root>/<hash[:2]>/<hash[2:4]>/<hash>
+     - 같은 파일 시스템의 임시 파일에 chunk 단위로 쓰면서 hash 를 계산하고, 끝나면 rename 한다
+       (읽는 쪽은 다 쓰인 파일만 보게 되고, 전체 내용을 메모리에 올리지 않는다)
+     - max_bytes 를 넘으면 그 자리에서 읽기를 멈추고 임시 파일을 지운다
+    """
+
+    def __init__(self, root: str, chunk_size: int, max_bytes: int):
+        self.root = root
+        self.chunk_size = chunk_size
+        self.max_bytes = max_bytes
+        self._tmp_dir = os.path.join(root, "tmp")
+        self._lock = threading.Lock()
+        self.saved = 0
+        self.deduplicated = 0
+        self.rejected = 0
+        self.bytes_written = 0
+
+    def path_of(self, content_hash: str) -> str:
+        return os.path.join(
+            self.root, content_hash[:2], content_hash[2:4], content_hash
+        )
+
+    def save(self, source: BinaryIO, declared_size: int | None = None) -> StoredContent:
+        # 크기를 미리 알 수 있으면(Content-Length 등) 읽기 전에 거절한다
+        if declared_size is not None and declared_size > self.max_bytes:
+            self._record(rejected=1)
+            raise ContentTooLargeException(self.max_bytes)
+
+        os.makedirs(self._tmp_dir, exist_ok=True)
+        digest = hashlib.sha256()
+        size = 0
+        fd, tmp_path = tempfile.mkstemp(dir=self._tmp_dir)
+        try:
+            with os.fdopen(fd, "wb") as target:
+                while chunk := source.read(self.chunk_size):
+                    size += len(chunk)
+                    if size > self.max_bytes:
+                        self._record(rejected=1)
+                        raise ContentTooLargeException(self.max_bytes)
+                    digest.update(chunk)
+                    target.write(chunk)
+
+            content_hash = digest.hexdigest()
+            path = self.path_of(content_hash)
+            if os.path.exists(path):
+                os.remove(tmp_path)
+                self._record(deduplicated=1)
+                return StoredContent(content_hash, size, path, created=False)
+
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # 같은 내용이 동시에 올라와도 rename 은 원자적이고 결과도 같다
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+        self._record(saved=1, bytes_written=size)
+        return StoredContent(content_hash, size, path, created=True)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "saved": self.saved,
+                "deduplicated": self.deduplicated,
+                "rejected": self.rejected,
+                "bytes_written": self.bytes_written,
+            }
+
+    def _record(
+        self,
+        saved: int = 0,
+        deduplicated: int = 0,
+        rejected: int = 0,
+        bytes_written: int = 0,
+    ) -> None:
+        with self._lock:
+            self.saved += saved
+            self.deduplicated += deduplicated
+            self.rejected += rejected
+            self.bytes_written += bytes_written
@@ -0,0 +1,3 @@
+class ContentTooLargeException(Exception):
+    def __init__(self, max_bytes: int):
+        super().__init__(f"File is larger than {max_bytes} bytes")
@@ -0,0 +1,134 @@
+import logging
+import os
+import tempfile
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+try:
+    from PIL import Image
+except ImportError:  # pragma: no cover - 설치되지 않아도 업로드는 동작한다
+    Image = None
+
+logger = logging.getLogger(__name__)
+
+
+def thumbnail_path(source_path: str, size: int) -> str:
+    return f"{source_path}_{size}.webp"
+
+
+# 프로세스 풀에서 실행되는 함수 (pickle 가능해야 하므로 모듈 최상단에 정의)
+def make_thumbnails(source_path: str, sizes: tuple[int, ...]) -> list[str]:
+    created = []
+    with Image.open(source_path) as image:
+        image.load()
+        for size in sizes:
+            path = thumbnail_path(source_path, size)
+            # 원본이 content-addressed 이므로 이미 있는 썸네일은 같은 내용이다
+            if os.path.exists(path):
+                continue
+            # CMYK / 팔레트 이미지 등은 WEBP 로 바로 저장할 수 없다
+            thumbnail = (
+                image.copy() if image.mode in ("RGB", "RGBA") else image.convert("RGBA")
+            )
+            thumbnail.thumbnail((size, size))
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path))
+            try:
+                with os.fdopen(fd, "wb") as target:
+                    thumbnail.save(target, format="WEBP")
+                os.replace(tmp_path, path)
+            except BaseException:
+                os.remove(tmp_path)
+                raise
+            created.append(path)
+    return created
+
+
+class ThumbnailPool:
+    """
+    썸네일 생성을 요청 밖의 프로세스 풀에서 실행한다 (요청은 결과를 기다리지 않는다)
+     - 실행 중 + 대기 중인 작업 수를 max_workers + max_pending 으로 제한하고
+       자리가 없으면 요청을 막지 않도록 버린다 (dropped 로 집계한다)
+     - Pillow 를 import 할 수 없으면 만들지 않는다 (skipped 로 집계한다)
+    """
+
+    def __init__(self, max_workers: int, max_pending: int):
+        self.max_workers = max_workers
+        self._slots = threading.BoundedSemaphore(max_workers + max_pending)
+        self._executor: ProcessPoolExecutor | None = None
+        self._lock = threading.Lock()
+        # 완료 callback 의 집계용 (shutdown 이 _lock 을 잡고 기다리는 동안에도 쓰인다)
+        self._stats_lock = threading.Lock()
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.dropped = 0
+        self.skipped = 0
+
+    @property
+    def available(self) -> bool:
+        return Image is not None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        # import 시점이 아닌 첫 사용 시점에 워커 프로세스를 띄운다
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+        return self._executor
+
+    def submit(self, source_path: str, sizes: tuple[int, ...]) -> bool:
+        if not self.available or not sizes:
+            self._record("skipped")
+            return False
+        if not self._slots.acquire(blocking=False):
+            self._record("dropped")
+            return False
+
+        try:
+            future = self._get_executor().submit(make_thumbnails, source_path, sizes)
+        except BrokenProcessPool:
+            # 워커가 비정상 종료된 풀은 버리고 다음 요청에서 새로 만든다
+            self._executor = None
+            self._slots.release()
+            self._record("dropped")
+            return False
+        except BaseException:
+            self._slots.release()
+            raise
+
+        self._record("submitted")
+        future.add_done_callback(self._done)
+        return True
+
+    def _done(self, future: Future) -> None:
+        self._slots.release()
+        if future.cancelled():
+            return
+        if future.exception() is not None:
+            # 이미지가 아닌 파일 등: 원본은 저장되어 있으므로 로그만 남긴다
+            logger.warning("thumbnail generation failed: %s", future.exception())
+            self._record("failed")
+        else:
+            self._record("completed")
+
+    def _record(self, counter: str) -> None:
+        with self._stats_lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def stats(self) -> dict:
+        with self._stats_lock:
+            return {
+                "available": self.available,
+                "submitted": self.submitted,
+                "completed": self.completed,
+                "failed": self.failed,
+                "dropped": self.dropped,
+                "skipped": self.skipped,
+            }
+
+    def shutdown(self) -> None:
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True, cancel_futures=True)
+                self._executor = None
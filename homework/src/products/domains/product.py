@@ -1,14 +1,72 @@
 from datetime import datetime
+from typing import NamedTuple
 
-from sqlalchemy import Column, Integer, String, DateTime
+from sqlalchemy import Column, Integer, String, DateTime, Index
 
 from core.database.orm import Base
 
+# 제품 목록 / 검색 응답의 surrogate key (제품이 바뀌면 purge)
+PRODUCTS_SURROGATE_KEY = "products"
+
 
 class Product(Base):
     __tablename__ = "products"
 
+    __table_args__ = (
+        Index("ix_products_name", "name"),
+        # 가격순 목록 / max_price 필터 + (price, id) keyset pagination
+        Index("ix_products_price_id", "price", "id"),
+        # 제품 catalog index 의 증분 갱신 (updated_at watermark)
+        Index("ix_products_updated_at", "updated_at"),
+        # 같은 이미지(content hash)를 쓰는 제품 조회
+        Index("ix_products_image_hash", "image_hash"),
+    )
+
     id = Column(Integer, primary_key=True)
     name = Column(String(16))  # Varchar 16
     price = Column(Integer)  # Bcrypt 60자
+    image_name = Column(String(255), nullable=True)
+    image_hash = Column(String(64), nullable=True)  # sha256 hex (이미지 저장 경로)
     created_at = Column(DateTime, default=datetime.now)
+    updated_at = Column(DateTime, default=datetime.now, onupdate=datetime.now)
+    # 쓰기마다 1 씩 증가 (catalog index 가 같은 초에 일어난 쓰기의 선후를 가린다)
+    version = Column(Integer, nullable=False, server_default="1")
+
+    __mapper_args__ = {"version_id_col": version}
+
+    @classmethod
+    def create(cls, name: str, price: int):
+        return cls(name=name, price=price)
+
+    def update(self, name: str | None = None, price: int | None = None) -> None:
+        if name:
+            self.name = name
+        if price:
+            self.price = price
+
+    def update_image(self, image_name: str, image_hash: str) -> None:
+        self.image_name = image_name
+        self.image_hash = image_hash
+
+
+# 삭제된 제품 (다른 워커의 catalog index 가 refresh 때 삭제를 반영한다)
+class ProductTombstone(Base):
+    __tablename__ = "product_tombstones"
+
+    __table_args__ = (Index("ix_product_tombstones_deleted_at", "deleted_at"),)
+
+    product_id = Column(Integer, primary_key=True, autoincrement=False)
+    deleted_at = Column(DateTime, nullable=False, default=datetime.now)
+
+    @classmethod
+    def create(cls, product_id: int):
+        return cls(product_id=product_id)
+
+
+# 메모리 색인(catalog index)에서 조회한 제품 (ORM 엔티티로 만들지 않는다)
+class ProductReadRow(NamedTuple):
+    id: int
+    name: str
+    price: int
+    image_name: str | None
+    updated_at: datetime | None
@@ -2,11 +2,10 @@ from pydantic import BaseModel
 
 
 class ProductCreateRequestDto(BaseModel):
-    id: int
     name: str
     price: int
 
 
 class ProductUpdateRequestDto(BaseModel):
-    name: str
-    price: int
+    name: str | None = None
+    price: int | None = None
@@ -1,13 +1,10 @@
-from typing import TypedDict
+from datetime import datetime
+from typing import Sequence
 
 from pydantic import BaseModel
 
-
-class ProductTypedDict(TypedDict):
-    id: int
-    name: str
-    price: int
-    image_name: str | None
+from core.http.conditional import make_etag
+from products.domains.product import Product, ProductReadRow
 
 
 class ProductResponseDto(BaseModel):
@@ -17,10 +14,75 @@ class ProductResponseDto(BaseModel):
     image_name: str | None
 
     @classmethod
-    def build(cls, product: ProductTypedDict):
+    def build(cls, product: Product | ProductReadRow):
+        return cls(
+            id=product.id,
+            name=product.name,
+            price=product.price,
+            image_name=product.image_name,
+        )
+
+    # build 와 같은 값으로 만든다 (응답 내용이 바뀌면 ETag 도 바뀐다)
+    @staticmethod
+    def etag(product: Product | ProductReadRow) -> str:
+        return make_etag(product.id, product.name, product.price, product.image_name)
+
+
+class ProductPageResponseDto(BaseModel):
+    products: list[ProductResponseDto]
+    next_cursor: str | None
+
+    @classmethod
+    def build(
+        cls, products: Sequence[Product | ProductReadRow], next_cursor: str | None
+    ):
+        return cls(
+            products=[
+                ProductResponseDto.build(product=product) for product in products
+            ],
+            next_cursor=next_cursor,
+        )
+
+    @staticmethod
+    def etag(
+        products: Sequence[Product | ProductReadRow], next_cursor: str | None
+    ) -> str:
+        return make_etag(
+            next_cursor, *(ProductResponseDto.etag(product) for product in products)
+        )
+
+    @staticmethod
+    def last_modified(
+        products: Sequence[Product | ProductReadRow],
+    ) -> datetime | None:
+        return max(
+            (product.updated_at for product in products if product.updated_at),
+            default=None,
+        )
+
+
+class ProductSearchResultDto(ProductResponseDto):
+    score: float
+
+    @classmethod
+    def build(cls, product: Product | ProductReadRow, score: float):
+        return cls(
+            id=product.id,
+            name=product.name,
+            price=product.price,
+            image_name=product.image_name,
+            score=round(score, 4),
+        )
+
+
+class ProductSearchResponseDto(BaseModel):
+    products: list[ProductSearchResultDto]
+
+    @classmethod
+    def build(cls, results: Sequence[tuple[Product | ProductReadRow, float]]):
         return cls(
-            id=product["id"],
-            name=product["name"],
-            price=product["price"],
-            image_name=product["image_name"],
+            products=[
+                ProductSearchResultDto.build(product=product, score=score)
+                for product, score in results
+            ]
         )
@@ -0,0 +1,3 @@
+class ProductNotFoundException(Exception):
+    def __init__(self):
+        super().__init__("Product not found")
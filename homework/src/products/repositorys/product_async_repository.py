@@ -0,0 +1,134 @@
+from typing import Sequence
+
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.cache.response_cache import ResponseCache, get_response_cache
+from core.config import settings
+from core.database.connection_async import get_async_db
+from core.database.routing import READ_REPLICA
+from core.database.unit_of_work import (
+    after_commit,
+    after_commit_async,
+    release_connection_async,
+)
+from products.domains.product import (
+    PRODUCTS_SURROGATE_KEY,
+    Product,
+    ProductReadRow,
+    ProductTombstone,
+)
+from products.repositorys.product_catalog_index import (
+    ProductCatalogIndex,
+    catalog_entry,
+    get_product_catalog_index,
+)
+from products.repositorys.product_repository import (
+    rank_products,
+    select_products_containing,
+    select_products_page,
+)
+
+
+class ProductAsyncRepository:
+    def __init__(
+        self,
+        db: AsyncSession = Depends(get_async_db),
+        catalog_index: ProductCatalogIndex = Depends(get_product_catalog_index),
+        response_cache: ResponseCache = Depends(get_response_cache),
+    ):
+        self.db = db
+        self.catalog_index = catalog_index
+        self.response_cache = response_cache
+
+    async def save(self, product: Product) -> None:
+        self.db.add(product)
+        await self.db.flush()
+        self._upsert_index_after_commit(product)
+        self._purge_responses_after_commit()
+
+    async def get_products_page(
+        self,
+        limit: int,
+        after: tuple[int, int] | None = None,
+        max_price: int | None = None,
+        name: str | None = None,
+        name_prefix: str | None = None,
+    ) -> Sequence[Product | ProductReadRow]:
+        # 메모리 색인이 준비되어 있으면 DB 를 거치지 않는다
+        if self.catalog_index.ready:
+            return self.catalog_index.query(
+                limit=limit,
+                after=after,
+                max_price=max_price,
+                name=name,
+                name_prefix=name_prefix,
+            )
+
+        query = select_products_page(
+            limit=limit,
+            after=after,
+            max_price=max_price,
+            name=name,
+            name_prefix=name_prefix,
+        )
+        result = await self.db.scalars(query, bind_arguments=READ_REPLICA)
+        return result.all()
+
+    async def search_products(
+        self, query: str, limit: int, max_price: int | None = None
+    ) -> list[tuple[Product | ProductReadRow, float]]:
+        if self.catalog_index.ready:
+            return self.catalog_index.search(
+                query=query,
+                limit=limit,
+                max_price=max_price,
+                threshold=settings.product_search_similarity_threshold,
+            )
+
+        statement = select_products_containing(query=query, max_price=max_price)
+        result = await self.db.scalars(statement, bind_arguments=READ_REPLICA)
+        return rank_products(query=query, products=result.all(), limit=limit)
+
+    async def get_product_by_id(self, product_id: int) -> Product | None:
+        return await self.db.get(Product, product_id)
+
+    async def release(self) -> None:
+        await release_connection_async(self.db)
+
+    async def delete(self, product: Product) -> None:
+        product_id = product.id
+        await self.db.delete(product)
+        # 다른 워커의 catalog index 가 refresh 때 삭제를 알 수 있도록 같은 트랜잭션에 남긴다
+        self.db.add(ProductTombstone.create(product_id))
+        await self.db.flush()
+        after_commit(
+            self.db.sync_session, lambda: self.catalog_index.discard(product_id)
+        )
+        self._purge_responses_after_commit()
+
+    def _upsert_index_after_commit(self, product: Product) -> None:
+        # 커밋 뒤에는 엔티티가 만료될 수 있으므로 값은 지금 읽어 둔다
+        if product.price is None:
+            # 가격이 없는 제품은 목록에 나오지 않는다
+            product_id = product.id
+            after_commit(
+                self.db.sync_session, lambda: self.catalog_index.discard(product_id)
+            )
+            return
+        entry = catalog_entry(
+            product.id,
+            product.name,
+            product.price,
+            product.image_name,
+            product.updated_at,
+            product.version,
+        )
+        # 색인 반영은 await 할 필요가 없으므로 sync 세션의 커밋 이벤트에 건다
+        after_commit(self.db.sync_session, lambda: self.catalog_index.upsert(entry))
+
+    def _purge_responses_after_commit(self) -> None:
+        # 제품 목록 / 검색 응답 캐시를 지운다 (redis 일 수 있으므로 commit_async 에서 await 한다)
+        after_commit_async(
+            self.db, lambda: self.response_cache.apurge(PRODUCTS_SURROGATE_KEY)
+        )
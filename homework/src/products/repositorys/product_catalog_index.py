@@ -0,0 +1,616 @@
+import asyncio
+import bisect
+import heapq
+import math
+import threading
+from array import array
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Iterable, NamedTuple
+
+from sqlalchemy import delete, select
+from sqlalchemy.orm import sessionmaker
+
+from core.database.routing import READ_REPLICA
+from core.metrics.registry import metrics_registry
+from core.search.bitset import iter_bits, to_bitset
+from core.search.trigram_index import TrigramIndex, trigrams
+from products.domains.product import Product, ProductReadRow, ProductTombstone
+
+# 정렬 키 = (price + 2^31) << 32 | id
+# (가격순, 같은 가격이면 id 순. INT 범위의 가격을 unsigned 64bit 하나에 담는다)
+_PRICE_OFFSET = 1 << 31
+_MAX_ID = (1 << 32) - 1
+_MAX_KEY = (1 << 64) - 1
+# 검색 후보가 이보다 적으면 이름 길이별로 나누지 않고 한 번에 정렬한다
+_SEARCH_RANK_ALL = 1024
+
+_EPOCH = datetime(1970, 1, 1)
+# updated_at 은 초 단위이고 커밋은 updated_at 보다 늦게 일어나므로
+# watermark 보다 조금 앞에서부터 다시 읽는다 (이미 반영한 값은 row version 으로 걸러진다)
+_WATERMARK_OVERLAP = timedelta(seconds=5)
+# 이보다 많이 바뀌면 한 건씩 끼워 넣지 않고 전체를 다시 정렬해서 만든다
+_BULK_APPLY_THRESHOLD = 256
+
+_CATALOG_COLUMNS = (
+    Product.id,
+    Product.name,
+    Product.price,
+    Product.image_name,
+    Product.updated_at,
+    Product.version,
+)
+
+
+class CatalogEntry(NamedTuple):
+    id: int
+    name: str
+    price: int
+    image_name: str | None
+    updated_at: datetime | None
+    # products.version (쓰기마다 DB 에서 1 씩 증가). 더 오래된 값으로 덮어쓰지 않기 위해 사용한다
+    # (updated_at 은 초 단위라 같은 초에 다른 워커가 쓴 값의 선후를 가릴 수 없다)
+    version: int
+
+
+def catalog_entry(
+    product_id: int,
+    name: str | None,
+    price: int,
+    image_name: str | None,
+    updated_at: datetime | None,
+    version: int,
+) -> CatalogEntry:
+    return CatalogEntry(product_id, name or "", price, image_name, updated_at, version)
+
+
+def _micros(updated_at: datetime | None) -> int:
+    if updated_at is None:
+        return 0
+    elapsed = updated_at - _EPOCH
+    return (elapsed.days * 86_400 + elapsed.seconds) * 1_000_000 + elapsed.microseconds
+
+
+def _updated_at(micros: int) -> datetime | None:
+    return _EPOCH + timedelta(microseconds=micros) if micros else None
+
+
+def _sort_key(price: int, product_id: int) -> int:
+    return (price + _PRICE_OFFSET) << 32 | product_id
+
+
+def _price_range(
+    min_price: int | None, max_price: int | None, after: tuple[int, int] | None
+) -> tuple[int, int]:
+    low = 0 if min_price is None else _sort_key(min_price, 0)
+    if after is not None:
+        low = max(low, _sort_key(*after) + 1)
+    high = _MAX_KEY if max_price is None else _sort_key(max_price, _MAX_ID)
+    return low, high
+
+
+class _CatalogSnapshot:
+    """
+    한 시점의 색인. 다른 스레드가 읽는 중일 수 있으므로 만든 뒤에는 바꾸지 않는다
+    (쓰기는 copy() 한 것을 고쳐서 통째로 교체한다)
+     - keys      : 정렬 키 (가격순), 같은 위치에 names / images / updated / versions
+     - ids       : id 순, 같은 위치에 prices (id 로 정렬 키를 찾는다)
+     - folds     : casefold 한 name 순, 같은 위치에 name_keys (이름으로 정렬 키를 찾는다)
+     - length_bits: 이름 길이 -> id bitset (검색 결과의 같은 점수 정렬용)
+    """
+
+    __slots__ = (
+        "keys",
+        "names",
+        "images",
+        "updated",
+        "versions",
+        "ids",
+        "prices",
+        "length_bits",
+        "folds",
+        "name_keys",
+    )
+
+    def __init__(self):
+        self.keys = array("Q")
+        self.names: list[str] = []
+        self.images: list[str | None] = []
+        self.updated = array("q")
+        self.versions = array("q")
+        self.ids = array("q")
+        self.prices = array("q")
+        self.length_bits: dict[int, int] = {}
+        self.folds: list[str] = []
+        self.name_keys = array("Q")
+
+    @classmethod
+    def build(cls, entries: Iterable[CatalogEntry]) -> "_CatalogSnapshot":
+        entries = list(entries)
+        ids = [entry.id for entry in entries]
+        prices = [entry.price for entry in entries]
+        keys = [
+            (price + _PRICE_OFFSET) << 32 | product_id
+            for price, product_id in zip(prices, ids)
+        ]
+        folds = [entry.name.casefold() for entry in entries]
+
+        # tuple 대신 위치(int)를 정렬해서 배열마다 같은 순서로 옮긴다
+        # (rebuild 는 id 순으로 읽으므로 id 정렬은 거의 O(n) 이다)
+        by_key = sorted(range(len(entries)), key=keys.__getitem__)
+        by_id = sorted(range(len(entries)), key=ids.__getitem__)
+        by_name = sorted(range(len(entries)), key=folds.__getitem__)
+
+        snapshot = cls()
+        snapshot.keys = array("Q", [keys[i] for i in by_key])
+        snapshot.names = [entries[i].name for i in by_key]
+        snapshot.images = [entries[i].image_name for i in by_key]
+        snapshot.updated = array("q", [_micros(entries[i].updated_at) for i in by_key])
+        snapshot.versions = array("q", [entries[i].version for i in by_key])
+        snapshot.ids = array("q", [ids[i] for i in by_id])
+        snapshot.prices = array("q", [prices[i] for i in by_id])
+        by_length = defaultdict(list)
+        for entry in entries:
+            by_length[len(entry.name)].append(entry.id)
+        snapshot.length_bits = {
+            length: to_bitset(ids) for length, ids in sorted(by_length.items())
+        }
+        snapshot.folds = [folds[i] for i in by_name]
+        snapshot.name_keys = array("Q", [keys[i] for i in by_name])
+        return snapshot
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def copy(self) -> "_CatalogSnapshot":
+        snapshot = _CatalogSnapshot()
+        for slot in self.__slots__:
+            value = getattr(self, slot)
+            setattr(
+                snapshot, slot, value.copy() if isinstance(value, dict) else value[:]
+            )
+        return snapshot
+
+    def entries(self) -> Iterable[CatalogEntry]:
+        for key, name, image_name, updated, version in zip(
+            self.keys, self.names, self.images, self.updated, self.versions
+        ):
+            yield CatalogEntry(
+                key & _MAX_ID,
+                name,
+                (key >> 32) - _PRICE_OFFSET,
+                image_name,
+                _updated_at(updated),
+                version,
+            )
+
+    def row(self, position: int) -> ProductReadRow:
+        key = self.keys[position]
+        return ProductReadRow(
+            id=key & _MAX_ID,
+            name=self.names[position],
+            price=(key >> 32) - _PRICE_OFFSET,
+            image_name=self.images[position],
+            updated_at=_updated_at(self.updated[position]),
+        )
+
+    def name_range(self, name: str | None, name_prefix: str | None) -> array:
+        if name is not None:
+            fold = name.casefold()
+            if name_prefix is not None and not fold.startswith(name_prefix.casefold()):
+                return array("Q")
+            start = bisect.bisect_left(self.folds, fold)
+            end = bisect.bisect_right(self.folds, fold)
+        else:
+            fold = name_prefix.casefold()
+            start = bisect.bisect_left(self.folds, fold)
+            end = bisect.bisect_left(self.folds, fold + "\U0010ffff")
+        return self.name_keys[start:end]
+
+    def entry_of(self, product_id: int) -> CatalogEntry | None:
+        i = bisect.bisect_left(self.ids, product_id)
+        if i == len(self.ids) or self.ids[i] != product_id:
+            return None
+        price = self.prices[i]
+        position = bisect.bisect_left(self.keys, _sort_key(price, product_id))
+        return CatalogEntry(
+            product_id,
+            self.names[position],
+            price,
+            self.images[position],
+            _updated_at(self.updated[position]),
+            self.versions[position],
+        )
+
+    def remove(self, product_id: int) -> None:
+        i = bisect.bisect_left(self.ids, product_id)
+        if i == len(self.ids) or self.ids[i] != product_id:
+            return
+        key = _sort_key(self.prices[i], product_id)
+        del self.ids[i]
+        del self.prices[i]
+
+        position = bisect.bisect_left(self.keys, key)
+        name = self.names[position]
+        fold = name.casefold()
+        length = len(name)
+        self.length_bits[length] &= ~(1 << product_id)
+        if not self.length_bits[length]:
+            del self.length_bits[length]
+        del self.keys[position]
+        del self.names[position]
+        del self.images[position]
+        del self.updated[position]
+        del self.versions[position]
+
+        j = bisect.bisect_left(self.folds, fold)
+        while self.name_keys[j] != key:
+            j += 1
+        del self.folds[j]
+        del self.name_keys[j]
+
+    def insert(self, entry: CatalogEntry) -> None:
+        key = _sort_key(entry.price, entry.id)
+        i = bisect.bisect_left(self.ids, entry.id)
+        self.ids.insert(i, entry.id)
+        self.prices.insert(i, entry.price)
+        length = len(entry.name)
+        if length in self.length_bits:
+            self.length_bits[length] |= 1 << entry.id
+        else:
+            # 짧은 길이부터 훑을 수 있도록 정렬된 순서를 유지한다
+            self.length_bits[length] = 1 << entry.id
+            self.length_bits = dict(sorted(self.length_bits.items()))
+
+        position = bisect.bisect_left(self.keys, key)
+        self.keys.insert(position, key)
+        self.names.insert(position, entry.name)
+        self.images.insert(position, entry.image_name)
+        self.updated.insert(position, _micros(entry.updated_at))
+        self.versions.insert(position, entry.version)
+
+        fold = entry.name.casefold()
+        j = bisect.bisect_right(self.folds, fold)
+        self.folds.insert(j, fold)
+        self.name_keys.insert(j, key)
+
+
+# (id, None) 은 삭제
+_Change = tuple[int, CatalogEntry | None]
+
+
+class ProductCatalogIndex:
+    """
+    GET /products 의 가격 / 이름 필터를 DB 없이 처리하기 위한 워커별 메모리 색인
+     - 가격: (price, id) 정렬 키 배열을 이진 탐색한다 (max_price / min_price / cursor)
+     - 이름: casefold 한 이름 정렬 배열을 이진 탐색한다 (exact / prefix)
+     - 검색: 이름 trigram inverted index 로 후보를 찾아 유사도순으로 정렬한다 (search)
+    rebuild 는 전체를 읽고, refresh 는 updated_at watermark 이후 바뀐 제품과
+    삭제된 제품(product_tombstones)만 읽는다.
+    이 워커의 쓰기는 커밋 직후 큐에 쌓고 apply_pending() 이 모아서 한 번에 반영한다
+    (쓰기마다 색인을 복사하지 않는다. lifespan 이 wait_for_changes() 로 깨어나서 호출한다).
+    가격이 없는(NULL) 제품은 목록에 나오지 않는다 (DB 조회와 같다).
+    rebuild 전(ready=False)에는 사용하지 않고 DB 로 조회한다.
+    """
+
+    def __init__(self):
+        self.ready = False
+        self._snapshot = _CatalogSnapshot()
+        self._trigrams = TrigramIndex()
+        self._watermark: datetime | None = None
+        # 색인 교체 (rebuild / refresh / apply_pending) 를 직렬화한다
+        self._lock = threading.Lock()
+        # DB 를 읽는 도중 반영한 이 워커의 쓰기 (읽은 결과보다 나중이므로 다시 반영한다)
+        self._pending: list[_Change] | None = None
+        # 커밋됐지만 아직 반영하지 않은 이 워커의 쓰기
+        self._queue_lock = threading.Lock()
+        self._queued: list[_Change] = []
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._changed: asyncio.Event | None = None
+
+        self.rebuilds = 0
+        self.refreshes = 0
+        self.refreshed_products = 0
+        self.applied_batches = 0
+        self.applied_changes = 0
+
+    def __len__(self) -> int:
+        return len(self._snapshot)
+
+    def rebuild(self, session_factory: sessionmaker, batch_size: int = 10_000) -> None:
+        with self._lock:
+            self._pending = []
+
+        try:
+            changes, watermark = self._read(session_factory, batch_size=batch_size)
+            snapshot = _CatalogSnapshot.build(entry for _, entry in changes)
+            trigram_index = TrigramIndex.build(
+                (entry.id, entry.name) for _, entry in changes
+            )
+        except BaseException:
+            with self._lock:
+                self._pending = None
+            raise
+
+        with self._lock:
+            self._take_queued()
+            self._snapshot = self._apply(snapshot, trigram_index, self._pending)
+            self._trigrams = trigram_index
+            self._pending = None
+            self._watermark = watermark
+            self.ready = True
+            self.rebuilds += 1
+
+    def refresh(self, session_factory: sessionmaker, batch_size: int = 10_000) -> None:
+        if not self.ready:
+            self.rebuild(session_factory, batch_size=batch_size)
+            return
+
+        with self._lock:
+            self._pending = []
+            since = self._watermark
+
+        try:
+            changes, watermark = self._read(
+                session_factory, batch_size=batch_size, since=since
+            )
+        except BaseException:
+            with self._lock:
+                self._pending = None
+            raise
+
+        with self._lock:
+            self._take_queued()
+            self._snapshot = self._apply(
+                self._snapshot, self._trigrams, changes + self._pending
+            )
+            self._pending = None
+            if watermark is not None:
+                self._watermark = max(watermark, self._watermark or watermark)
+            self.refreshes += 1
+            self.refreshed_products += len(changes)
+
+    def upsert(self, entry: CatalogEntry) -> None:
+        self._change((entry.id, entry))
+
+    def discard(self, product_id: int) -> None:
+        self._change((product_id, None))
+
+    def apply_pending(self) -> int:
+        """큐에 쌓인 쓰기를 한 번의 복사로 반영한다. 반영한 쓰기 수를 돌려준다"""
+        with self._lock:
+            changes = self._take_queued()
+            if changes:
+                self._snapshot = self._apply(self._snapshot, self._trigrams, changes)
+                self.applied_batches += 1
+                self.applied_changes += len(changes)
+        return len(changes)
+
+    async def wait_for_changes(self, timeout: float) -> bool:
+        # 큐에 쓰기가 들어오면 깨어난다 (timeout 이 지나도 깨어난다)
+        if self._changed is None:
+            self._loop = asyncio.get_running_loop()
+            self._changed = asyncio.Event()
+        if not self._queued:
+            try:
+                await asyncio.wait_for(self._changed.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+        self._changed.clear()
+        return bool(self._queued)
+
+    def query(
+        self,
+        limit: int,
+        after: tuple[int, int] | None = None,
+        min_price: int | None = None,
+        max_price: int | None = None,
+        name: str | None = None,
+        name_prefix: str | None = None,
+    ) -> list[ProductReadRow]:
+        # 읽는 동안 교체되어도 같은 시점의 색인을 보도록 참조를 한 번만 잡는다
+        snapshot = self._snapshot
+        low, high = _price_range(min_price, max_price, after)
+
+        if name is None and name_prefix is None:
+            start = bisect.bisect_left(snapshot.keys, low)
+            end = min(bisect.bisect_right(snapshot.keys, high), start + limit)
+            return [snapshot.row(position) for position in range(start, end)]
+
+        keys = heapq.nsmallest(
+            limit,
+            (
+                key
+                for key in snapshot.name_range(name, name_prefix)
+                if low <= key <= high
+            ),
+        )
+        return [snapshot.row(bisect.bisect_left(snapshot.keys, key)) for key in keys]
+
+    def search(
+        self,
+        query: str,
+        limit: int,
+        max_price: int | None = None,
+        threshold: float = 0.3,
+    ) -> list[tuple[ProductReadRow, float]]:
+        """
+        점수 = query trigram 중 이름에 있는 비율 (word_similarity)
+        같은 점수면 이름이 짧은 제품(= Jaccard 유사도가 높은 제품), 싼 제품, id 순
+        """
+        snapshot, trigram_index = self._snapshot, self._trigrams
+        grams = trigrams(query)
+        min_shared = max(1, math.ceil(threshold * len(grams)))
+        ids, prices, keys = snapshot.ids, snapshot.prices, snapshot.keys
+
+        # 공유 trigram 수가 곧 점수이므로 많은 쪽부터, 같은 점수 안에서는 짧은 이름부터 채운다
+        results = []
+        for shared, matched in trigram_index.matches(grams, min_shared=min_shared):
+            score = shared / len(grams)
+            # 후보가 많으면 이름 길이별 bitset 으로 나눠서 짧은 길이부터 본다
+            if matched.bit_count() <= _SEARCH_RANK_ALL:
+                groups = [matched]
+            else:
+                groups = (matched & bits for bits in snapshot.length_bits.values())
+
+            for group in groups:
+                ranked = []
+                for product_id in iter_bits(group):
+                    i = bisect.bisect_left(ids, product_id)
+                    if i == len(ids) or ids[i] != product_id:
+                        continue  # 삭제된 제품
+                    if max_price is not None and prices[i] > max_price:
+                        continue
+                    position = bisect.bisect_left(
+                        keys, _sort_key(prices[i], product_id)
+                    )
+                    length = len(snapshot.names[position])
+                    ranked.append((length, prices[i], product_id, position))
+
+                for *_, position in heapq.nsmallest(limit - len(results), ranked):
+                    results.append((snapshot.row(position), score))
+                if len(results) == limit:
+                    return results
+        return results
+
+    def stats(self) -> dict:
+        return {
+            "ready": self.ready,
+            "products": len(self),
+            "trigrams": len(self._trigrams),
+            "rebuilds": self.rebuilds,
+            "refreshes": self.refreshes,
+            "refreshed_products": self.refreshed_products,
+            "queued": len(self._queued),
+            "applied_batches": self.applied_batches,
+            "applied_changes": self.applied_changes,
+        }
+
+    def _change(self, change: _Change) -> None:
+        # rebuild 전이고 읽는 중도 아니면 쌓을 필요가 없다 (rebuild 가 DB 에서 읽는다)
+        if not self.ready and self._pending is None:
+            return
+        with self._queue_lock:
+            self._queued.append(change)
+        if self._loop is not None and self._changed is not None:
+            try:
+                self._loop.call_soon_threadsafe(self._changed.set)
+            except RuntimeError:
+                pass  # loop 종료 후 (다음 rebuild 가 DB 에서 읽는다)
+
+    def _take_queued(self) -> list[_Change]:
+        # self._lock 을 잡고 호출한다
+        with self._queue_lock:
+            changes, self._queued = self._queued, []
+        if self._pending is not None:
+            self._pending.extend(changes)
+        return changes
+
+    @staticmethod
+    def _read(
+        session_factory: sessionmaker,
+        batch_size: int,
+        since: datetime | None = None,
+    ) -> tuple[list[_Change], datetime | None]:
+        query = (
+            select(*_CATALOG_COLUMNS)
+            .order_by(Product.id)
+            .execution_options(yield_per=batch_size)
+        )
+        if since is None:
+            query = query.where(Product.price.is_not(None))
+        else:
+            query = query.where(Product.updated_at >= since - _WATERMARK_OVERLAP)
+
+        changes, watermark = [], None
+        with session_factory() as session:
+            for row in session.execute(query, bind_arguments=READ_REPLICA):
+                # 가격이 NULL 로 바뀐 제품은 목록에서 뺀다
+                entry = catalog_entry(*row) if row.price is not None else None
+                changes.append((row.id, entry))
+                if row.updated_at is not None:
+                    watermark = max(row.updated_at, watermark or row.updated_at)
+
+            # 다른 워커가 지운 제품 (삭제는 updated_at 으로 알 수 없으므로 tombstone 을 읽는다)
+            if since is not None:
+                tombstones = session.execute(
+                    select(ProductTombstone.product_id, ProductTombstone.deleted_at)
+                    .where(ProductTombstone.deleted_at >= since - _WATERMARK_OVERLAP)
+                    .execution_options(yield_per=batch_size),
+                    bind_arguments=READ_REPLICA,
+                )
+                for product_id, deleted_at in tombstones:
+                    changes.append((product_id, None))
+                    watermark = max(deleted_at, watermark or deleted_at)
+        return changes, watermark
+
+    @staticmethod
+    def _apply(
+        snapshot: _CatalogSnapshot, trigram_index: TrigramIndex, changes: list[_Change]
+    ) -> _CatalogSnapshot:
+        if not changes:
+            return snapshot
+
+        # id 별 마지막 값 (이미 있는 값보다 오래된 upsert 는 버린다)
+        latest: dict[int, CatalogEntry | None] = {}
+        for product_id, entry in changes:
+            current = (
+                latest[product_id]
+                if product_id in latest
+                else snapshot.entry_of(product_id)
+            )
+            if (
+                entry is not None
+                and current is not None
+                and current.version > entry.version
+            ):
+                continue
+            latest[product_id] = entry
+
+        # 이름이 바뀐(추가/삭제 포함) 제품만 trigram 을 고친다
+        renames = []
+        for product_id, entry in latest.items():
+            current = snapshot.entry_of(product_id)
+            old_name = current.name if current is not None else None
+            new_name = entry.name if entry is not None else None
+            if old_name != new_name:
+                renames.append((product_id, old_name, new_name))
+        trigram_index.update(renames)
+
+        if len(latest) > _BULK_APPLY_THRESHOLD:
+            entries = {entry.id: entry for entry in snapshot.entries()}
+            for product_id, entry in latest.items():
+                if entry is None:
+                    entries.pop(product_id, None)
+                else:
+                    entries[product_id] = entry
+            return _CatalogSnapshot.build(entries.values())
+
+        snapshot = snapshot.copy()
+        for product_id, entry in latest.items():
+            snapshot.remove(product_id)
+            if entry is not None:
+                snapshot.insert(entry)
+        return snapshot
+
+
+def prune_product_tombstones(
+    session_factory: sessionmaker, retention_seconds: float
+) -> int:
+    # rebuild 가 전체를 다시 읽으므로 rebuild 주기보다 오래된 tombstone 은 필요 없다
+    deleted_before = datetime.now() - timedelta(seconds=retention_seconds)
+    with session_factory() as session:
+        result = session.execute(
+            delete(ProductTombstone).where(ProductTombstone.deleted_at < deleted_before)
+        )
+        session.commit()
+        return result.rowcount
+
+
+product_catalog_index = ProductCatalogIndex()
+metrics_registry.register("products.catalog_index", product_catalog_index.stats)
+
+
+# 의존성 주입을 위한 함수
+def get_product_catalog_index() -> ProductCatalogIndex:
+    return product_catalog_index
@@ -0,0 +1,50 @@
+from typing import BinaryIO
+
+from core.config import settings
+from core.metrics.registry import metrics_registry
+from core.storage.content_store import ContentAddressedStore, StoredContent
+from core.storage.thumbnail_pool import ThumbnailPool
+
+
+class ProductImageStorage:
+    """
+    제품 이미지 원본은 content-addressed 로 디스크에 저장하고 (같은 이미지는 한 번만),
+    썸네일은 요청을 기다리게 하지 않도록 프로세스 풀에 맡긴다
+    """
+
+    def __init__(
+        self,
+        store: ContentAddressedStore,
+        thumbnails: ThumbnailPool,
+        thumbnail_sizes: tuple[int, ...],
+    ):
+        self.store = store
+        self.thumbnails = thumbnails
+        self.thumbnail_sizes = thumbnail_sizes
+
+    def save(self, file: BinaryIO, declared_size: int | None = None) -> StoredContent:
+        stored = self.store.save(file, declared_size=declared_size)
+        self.thumbnails.submit(stored.path, self.thumbnail_sizes)
+        return stored
+
+    def stats(self) -> dict:
+        return {**self.store.stats(), "thumbnails": self.thumbnails.stats()}
+
+
+product_image_storage = ProductImageStorage(
+    store=ContentAddressedStore(
+        root=settings.product_image_dir,
+        chunk_size=settings.product_image_chunk_size,
+        max_bytes=settings.product_image_max_bytes,
+    ),
+    thumbnails=ThumbnailPool(
+        max_workers=settings.product_thumbnail_pool_size,
+        max_pending=settings.product_thumbnail_queue_size,
+    ),
+    thumbnail_sizes=tuple(settings.product_thumbnail_sizes),
+)
+metrics_registry.register("products.image_storage", product_image_storage.stats)
+
+
+def get_product_image_storage() -> ProductImageStorage:
+    return product_image_storage
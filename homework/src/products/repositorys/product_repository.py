@@ -0,0 +1,176 @@
+from typing import Sequence
+
+from fastapi import Depends
+from sqlalchemy import and_, or_, select
+from sqlalchemy.orm import Session
+
+from core.cache.response_cache import ResponseCache, get_response_cache
+from core.config import settings
+from core.database.connection import get_db
+from core.database.routing import READ_REPLICA
+from core.database.unit_of_work import after_commit, release_connection
+from core.search.trigram_index import similarity, trigrams, word_similarity
+from products.domains.product import (
+    PRODUCTS_SURROGATE_KEY,
+    Product,
+    ProductReadRow,
+    ProductTombstone,
+)
+from products.repositorys.product_catalog_index import (
+    ProductCatalogIndex,
+    catalog_entry,
+    get_product_catalog_index,
+)
+
+
+def select_products_page(
+    limit: int,
+    after: tuple[int, int] | None = None,
+    max_price: int | None = None,
+    name: str | None = None,
+    name_prefix: str | None = None,
+):
+    # 필터는 SQL 로 처리한다 (name: ix_products_name, price: ix_products_price_id)
+    # 가격이 없는 제품은 목록에 나오지 않는다 (catalog index 와 같다)
+    query = select(Product).where(Product.price.is_not(None))
+    if max_price is not None:
+        query = query.where(Product.price <= max_price)
+    if name is not None:
+        query = query.where(Product.name == name)
+    if name_prefix is not None:
+        query = query.where(Product.name.startswith(name_prefix, autoescape=True))
+    if after is not None:
+        price, product_id = after
+        query = query.where(
+            or_(
+                Product.price > price,
+                and_(Product.price == price, Product.id > product_id),
+            )
+        )
+    return query.order_by(Product.price, Product.id).limit(limit)
+
+
+def select_products_containing(query: str, max_price: int | None = None):
+    # 메모리 색인을 쓸 수 없을 때의 검색 (부분 문자열만 찾고 full scan 이 되므로 후보 수를 제한한다)
+    statement = select(Product).where(
+        Product.name.contains(query, autoescape=True), Product.price.is_not(None)
+    )
+    if max_price is not None:
+        statement = statement.where(Product.price <= max_price)
+    return statement.limit(settings.product_search_max_candidates)
+
+
+def rank_products(
+    query: str, products: Sequence[Product], limit: int
+) -> list[tuple[Product, float]]:
+    # 메모리 색인 검색과 같은 기준 (word_similarity, Jaccard 유사도, 가격, id 순)
+    grams = trigrams(query)
+    ranked = sorted(
+        products,
+        key=lambda product: (
+            -word_similarity(grams, trigrams(product.name)),
+            -similarity(grams, trigrams(product.name)),
+            product.price,
+            product.id,
+        ),
+    )
+    return [
+        (product, word_similarity(grams, trigrams(product.name)))
+        for product in ranked[:limit]
+    ]
+
+
+class ProductRepository:
+    def __init__(
+        self,
+        db: Session = Depends(get_db),
+        catalog_index: ProductCatalogIndex = Depends(get_product_catalog_index),
+        response_cache: ResponseCache = Depends(get_response_cache),
+    ):
+        self.db = db
+        self.catalog_index = catalog_index
+        self.response_cache = response_cache
+
+    def save(self, product: Product) -> None:
+        self.db.add(product)
+        self.db.flush()
+        self._upsert_index_after_commit(product)
+        self._purge_responses_after_commit()
+
+    def get_products_page(
+        self,
+        limit: int,
+        after: tuple[int, int] | None = None,
+        max_price: int | None = None,
+        name: str | None = None,
+        name_prefix: str | None = None,
+    ) -> Sequence[Product | ProductReadRow]:
+        # 메모리 색인이 준비되어 있으면 DB 를 거치지 않는다
+        if self.catalog_index.ready:
+            return self.catalog_index.query(
+                limit=limit,
+                after=after,
+                max_price=max_price,
+                name=name,
+                name_prefix=name_prefix,
+            )
+
+        query = select_products_page(
+            limit=limit,
+            after=after,
+            max_price=max_price,
+            name=name,
+            name_prefix=name_prefix,
+        )
+        return self.db.scalars(query, bind_arguments=READ_REPLICA).all()
+
+    def search_products(
+        self, query: str, limit: int, max_price: int | None = None
+    ) -> list[tuple[Product | ProductReadRow, float]]:
+        if self.catalog_index.ready:
+            return self.catalog_index.search(
+                query=query,
+                limit=limit,
+                max_price=max_price,
+                threshold=settings.product_search_similarity_threshold,
+            )
+
+        statement = select_products_containing(query=query, max_price=max_price)
+        products = self.db.scalars(statement, bind_arguments=READ_REPLICA).all()
+        return rank_products(query=query, products=products, limit=limit)
+
+    def get_product_by_id(self, product_id: int) -> Product | None:
+        return self.db.get(Product, product_id)
+
+    def release(self) -> None:
+        release_connection(self.db)
+
+    def delete(self, product: Product) -> None:
+        product_id = product.id
+        self.db.delete(product)
+        # 다른 워커의 catalog index 가 refresh 때 삭제를 알 수 있도록 같은 트랜잭션에 남긴다
+        self.db.add(ProductTombstone.create(product_id))
+        self.db.flush()
+        after_commit(self.db, lambda: self.catalog_index.discard(product_id))
+        self._purge_responses_after_commit()
+
+    def _upsert_index_after_commit(self, product: Product) -> None:
+        # 커밋 뒤에는 엔티티가 만료될 수 있으므로 값은 지금 읽어 둔다
+        if product.price is None:
+            # 가격이 없는 제품은 목록에 나오지 않는다
+            product_id = product.id
+            after_commit(self.db, lambda: self.catalog_index.discard(product_id))
+            return
+        entry = catalog_entry(
+            product.id,
+            product.name,
+            product.price,
+            product.image_name,
+            product.updated_at,
+            product.version,
+        )
+        after_commit(self.db, lambda: self.catalog_index.upsert(entry))
+
+    def _purge_responses_after_commit(self) -> None:
+        # 제품 목록 / 검색 응답 캐시를 지운다 (커밋 전에 지우면 이전 값이 다시 캐시될 수 있다)
+        after_commit(self.db, lambda: self.response_cache.purge(PRODUCTS_SURROGATE_KEY))
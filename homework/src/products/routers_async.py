@@ -0,0 +1,166 @@
+from fastapi import APIRouter, Depends, Query, Request, Response, UploadFile, status
+
+from core.cache.response_cache import set_surrogate_keys
+from core.http.conditional import evaluate_conditional
+
+from products.domains.product import PRODUCTS_SURROGATE_KEY, Product
+from products.dtos.responses import (
+    ProductPageResponseDto,
+    ProductResponseDto,
+    ProductSearchResponseDto,
+)
+from products.dtos.reqeusts import ProductCreateRequestDto, ProductUpdateRequestDto
+from products.services.product_async_service import ProductAsyncService
+
+router = APIRouter(prefix="/async/products", tags=["Async Products"])
+
+
+@router.get(
+    "",
+    response_model=ProductPageResponseDto,
+    description="제품 목록을 가격순 cursor 기반 페이지 단위로 조회하는 API입니다",
+    status_code=status.HTTP_200_OK,
+)
+async def get_products_handler(
+    request: Request,
+    response: Response,
+    max_price: int | None = Query(default=None, ge=100),
+    name: str | None = Query(default=None),
+    name_prefix: str | None = Query(default=None, min_length=1),
+    limit: int = Query(default=20, ge=1, le=100),
+    cursor: str | None = Query(default=None),
+    product_service: ProductAsyncService = Depends(),
+):
+    products, next_cursor = await product_service.get_products_page(
+        limit=limit,
+        cursor=cursor,
+        max_price=max_price,
+        name=name,
+        name_prefix=name_prefix,
+    )
+
+    # 같은 페이지를 이미 가진 클라이언트에게는 body 를 만들지 않고 304 를 보낸다
+    not_modified = evaluate_conditional(
+        request,
+        response,
+        etag=ProductPageResponseDto.etag(products=products, next_cursor=next_cursor),
+        last_modified=ProductPageResponseDto.last_modified(products=products),
+    )
+    if not_modified:
+        return not_modified
+
+    # 익명 요청이면 응답 캐시에 저장되고 제품이 바뀌면 purge 된다
+    set_surrogate_keys(response, PRODUCTS_SURROGATE_KEY)
+    return ProductPageResponseDto.build(products=products, next_cursor=next_cursor)
+
+
+@router.get(
+    "/search",
+    response_model=ProductSearchResponseDto,
+    description="제품 이름 검색 API입니다 (부분 / 오타 포함 검색, 유사도순)",
+    status_code=status.HTTP_200_OK,
+)
+async def search_products_handler(
+    response: Response,
+    q: str = Query(min_length=1, max_length=64),
+    max_price: int | None = Query(default=None, ge=100),
+    limit: int = Query(default=20, ge=1, le=100),
+    product_service: ProductAsyncService = Depends(),
+):
+    results = await product_service.search_products(
+        query=q, limit=limit, max_price=max_price
+    )
+
+    set_surrogate_keys(response, PRODUCTS_SURROGATE_KEY)
+    return ProductSearchResponseDto.build(results=results)
+
+
+@router.post(
+    "",
+    response_model=ProductResponseDto,
+    description="단일 제품 생성 API입니다",
+    status_code=status.HTTP_201_CREATED,
+)
+async def create_product_handler(
+    body: ProductCreateRequestDto,
+    product_service: ProductAsyncService = Depends(),
+):
+    product: Product = await product_service.create_product(
+        name=body.name, price=body.price
+    )
+
+    return ProductResponseDto.build(product=product)
+
+
+@router.get(
+    "/{product_id}",
+    response_model=ProductResponseDto,
+    description="제품 단일 조회 API입니다",
+    status_code=status.HTTP_200_OK,
+)
+async def get_product_handler(
+    product_id: int,
+    request: Request,
+    response: Response,
+    product_service: ProductAsyncService = Depends(),
+):
+    product: Product = await product_service.get_product_or_404(product_id=product_id)
+
+    not_modified = evaluate_conditional(
+        request,
+        response,
+        etag=ProductResponseDto.etag(product=product),
+        last_modified=product.updated_at,
+    )
+    if not_modified:
+        return not_modified
+
+    return ProductResponseDto.build(product=product)
+
+
+@router.patch(
+    "/{product_id}",
+    response_model=ProductResponseDto,
+    description="단일 제품 업데이트 API입니다",
+    status_code=status.HTTP_200_OK,
+)
+async def update_product_handler(
+    product_id: int,
+    body: ProductUpdateRequestDto,
+    product_service: ProductAsyncService = Depends(),
+):
+    product: Product = await product_service.update_product_or_404(
+        product_id=product_id, name=body.name, price=body.price
+    )
+
+    return ProductResponseDto.build(product=product)
+
+
+@router.delete(
+    "/{product_id}",
+    description="단일 제품 삭제 API입니다",
+    status_code=status.HTTP_204_NO_CONTENT,
+)
+async def delete_product_handler(
+    product_id: int,
+    product_service: ProductAsyncService = Depends(),
+):
+    await product_service.delete_product_or_404(product_id=product_id)
+
+
+@router.patch(
+    "/file/{product_id}",
+    response_model=ProductResponseDto,
+    description="제품 이미지 업로드 API입니다 (크기 제한을 넘으면 413)",
+    status_code=status.HTTP_200_OK,
+)
+async def update_product_file_handler(
+    product_id: int,
+    file: UploadFile,
+    product_service: ProductAsyncService = Depends(),
+):
+    product: Product = await product_service.update_product_image_or_404(
+        product_id=product_id, file=file
+    )
+
+    return ProductResponseDto.build(product=product)
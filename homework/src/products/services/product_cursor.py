@@ -0,0 +1,16 @@
+from core.database.exceptions.custom_exceptions import InvalidCursorException
+from core.database.pagination import decode_cursor, encode_cursor
+from products.domains.product import Product, ProductReadRow
+
+
+# 제품 목록 cursor = (price, id)
+def encode_product_cursor(product: Product | ProductReadRow) -> str:
+    return encode_cursor(product.price, product.id)
+
+
+def decode_product_cursor(cursor: str) -> tuple[int, int]:
+    price, product_id = decode_cursor(cursor, size=2)
+    try:
+        return int(price), int(product_id)
+    except (TypeError, ValueError):
+        raise InvalidCursorException()
@@ -0,0 +1,108 @@
+from typing import Sequence
+
+from fastapi import Depends, UploadFile
+
+from products.domains.product import Product, ProductReadRow
+from products.exceptions.custom_exceptions import ProductNotFoundException
+from products.repositorys.product_image_storage import (
+    ProductImageStorage,
+    get_product_image_storage,
+)
+from products.repositorys.product_repository import ProductRepository
+from products.services.product_cursor import (
+    decode_product_cursor,
+    encode_product_cursor,
+)
+
+# 의존 관계
+# ProductService <- ProductRepository, ProductImageStorage
+
+
+class ProductService:
+    def __init__(
+        self,
+        repo: ProductRepository = Depends(),
+        image_storage: ProductImageStorage = Depends(get_product_image_storage),
+    ):
+        self.product_repo = repo
+        self.image_storage = image_storage
+
+    def create_product(self, name: str, price: int) -> Product:
+        product = Product.create(name=name, price=price)
+
+        self.product_repo.save(product=product)
+
+        return product
+
+    def get_products_page(
+        self,
+        limit: int,
+        cursor: str | None = None,
+        max_price: int | None = None,
+        name: str | None = None,
+        name_prefix: str | None = None,
+    ) -> tuple[Sequence[Product | ProductReadRow], str | None]:
+        after = decode_product_cursor(cursor) if cursor else None
+
+        # 다음 페이지 존재 여부를 알기 위해 한 건 더 조회한다
+        products = self.product_repo.get_products_page(
+            limit=limit + 1,
+            after=after,
+            max_price=max_price,
+            name=name,
+            name_prefix=name_prefix,
+        )
+
+        if len(products) <= limit:
+            return products, None
+
+        products = products[:limit]
+        return products, encode_product_cursor(products[-1])
+
+    def search_products(
+        self, query: str, limit: int, max_price: int | None = None
+    ) -> list[tuple[Product | ProductReadRow, float]]:
+        return self.product_repo.search_products(
+            query=query, limit=limit, max_price=max_price
+        )
+
+    def get_product_or_404(self, product_id: int) -> Product:
+        product: Product | None = self.product_repo.get_product_by_id(
+            product_id=product_id
+        )
+
+        self._validate_product_or_raise(product)
+
+        return product
+
+    def update_product_or_404(
+        self, product_id: int, name: str | None, price: int | None
+    ) -> Product:
+        product = self.get_product_or_404(product_id=product_id)
+
+        product.update(name=name, price=price)
+        self.product_repo.save(product=product)
+
+        return product
+
+    def update_product_image_or_404(self, product_id: int, file: UploadFile) -> Product:
+        # 없는 제품이면 파일을 저장하기 전에 404
+        product = self.get_product_or_404(product_id=product_id)
+
+        # 파일을 옮겨 쓰는 동안 커넥션을 붙잡지 않는다 (UPDATE 는 새 트랜잭션에서 실행된다)
+        self.product_repo.release()
+        stored = self.image_storage.save(file.file, declared_size=file.size)
+        product.update_image(image_name=file.filename, image_hash=stored.hash)
+        self.product_repo.save(product=product)
+
+        return product
+
+    def delete_product_or_404(self, product_id: int) -> None:
+        product = self.get_product_or_404(product_id=product_id)
+
+        self.product_repo.delete(product=product)
+
+    @staticmethod
+    def _validate_product_or_raise(product: Product | None) -> None:
+        if product is None:
+            raise ProductNotFoundException()
@@ -13,10 +13,29 @@ from sqlalchemy_utils import database_exists, create_database
 from fastapi.testclient import TestClient
 
 from core.authenticate.services.authenticate_service import AuthenticateService
+from core.cache.backends import InMemoryCacheBackend
+from core.cache.response_cache import response_cache
+from core.config import settings
 from core.database.connection import get_db
 from core.database.orm import Base
+from core.storage.content_store import ContentAddressedStore
+from core.storage.thumbnail_pool import ThumbnailPool
 from main import app
+from products.repositorys.product_catalog_index import (
+    ProductCatalogIndex,
+    get_product_catalog_index,
+)
+from products.repositorys.product_image_storage import (
+    ProductImageStorage,
+    get_product_image_storage,
+)
 from users.domains.user import User
+from users.repositorys.user_availability_filter import (
+    UserAvailabilityFilter,
+    get_user_availability_filter,
+)
+from users.repositorys.user_cache import create_user_cache, get_user_cache
+from users.repositorys.user_otp_store import UserOtpStore, get_user_otp_store
 
 
 @pytest.fixture(scope="session")
@@ -49,11 +68,47 @@ def test_session(test_db):
 
 
 @pytest.fixture
-def client(test_session):
+def client(test_session, tmp_path):
     def test_get_db():
         yield test_session
 
+    # 테스트마다 롤백되는 DB 와 맞추기 위해 캐시도 테스트마다 새로 만든다
+    test_user_cache = create_user_cache(backend=InMemoryCacheBackend(maxsize=1_000))
+    test_availability_filter = UserAvailabilityFilter(capacity=1_000, error_rate=0.01)
+    # 적재(rebuild) 전 색인이므로 제품 목록은 DB 로 조회한다
+    test_catalog_index = ProductCatalogIndex()
+    # 업로드한 이미지는 테스트마다 임시 디렉터리에 저장한다 (썸네일은 만들지 않는다)
+    test_image_storage = ProductImageStorage(
+        store=ContentAddressedStore(
+            root=str(tmp_path / "media"), chunk_size=1024, max_bytes=64 * 1024
+        ),
+        thumbnails=ThumbnailPool(max_workers=1, max_pending=0),
+        thumbnail_sizes=(),
+    )
+
+    # 발급한 OTP / 재발급 제한이 다른 테스트에 남지 않도록 테스트마다 새로 만든다
+    test_otp_store = UserOtpStore(
+        backend=InMemoryCacheBackend(maxsize=1_000),
+        secret="test-secret",
+        ttl_seconds=settings.otp_ttl_seconds,
+        max_attempts=settings.otp_max_attempts,
+        resend_cooldown_seconds=settings.otp_resend_cooldown_seconds,
+        max_sends=settings.otp_max_sends,
+        send_window_seconds=settings.otp_send_window_seconds,
+    )
+
+    # 응답 캐시는 미들웨어가 쓰는 객체이므로 저장소만 테스트마다 새로 만든다
+    # (테스트의 쓰기는 커밋되지 않아 purge 되지 않는다)
+    response_cache.backend = InMemoryCacheBackend(maxsize=1_000)
+
     app.dependency_overrides[get_db] = test_get_db
+    app.dependency_overrides[get_user_cache] = lambda: test_user_cache
+    app.dependency_overrides[get_user_availability_filter] = (
+        lambda: test_availability_filter
+    )
+    app.dependency_overrides[get_product_catalog_index] = lambda: test_catalog_index
+    app.dependency_overrides[get_product_image_storage] = lambda: test_image_storage
+    app.dependency_overrides[get_user_otp_store] = lambda: test_otp_store
 
     return TestClient(app=app)
 
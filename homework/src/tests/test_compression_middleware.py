@@ -0,0 +1,90 @@
+import json
+
+from fastapi import FastAPI, Response
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+
+from core.http.compression import CompressionStats, negotiate_encoding
+from core.middlewares.middlewares.compression_middleware import (
+    CompressionMiddleware,
+)
+
+ITEMS = [{"id": i, "name": f"item_{i:05d}"} for i in range(500)]
+
+
+def build_app(stats: CompressionStats) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/items")
+    def get_items_handler(response: Response):
+        response.headers["ETag"] = '"items"'
+        return ITEMS
+
+    @app.get("/items/small")
+    def get_small_item_handler():
+        return ITEMS[0]
+
+    @app.get("/items/export")
+    def export_items_handler():
+        lines = (json.dumps(item) + "\n" for item in ITEMS)
+        return StreamingResponse(lines, media_type="application/x-ndjson")
+
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=500,
+        levels={"gzip": 9},
+        route_levels={"/items/export": {"gzip": 0}},
+        stats=stats,
+    )
+    return app
+
+
+def test_negotiate_encoding():
+    assert negotiate_encoding(None) is None
+    assert negotiate_encoding("identity") is None
+    assert negotiate_encoding("deflate, gzip;q=0.5") == "gzip"
+    assert negotiate_encoding("gzip;q=0") is None
+    assert negotiate_encoding("*") is not None
+    assert negotiate_encoding("*, gzip;q=0") in (None, "br", "zstd")
+
+
+def test_compresses_large_body_and_skips_small_body():
+    # given
+    stats = CompressionStats()
+    client = TestClient(build_app(stats))
+
+    # when
+    large = client.get("/items", headers={"Accept-Encoding": "gzip"})
+    small = client.get("/items/small", headers={"Accept-Encoding": "gzip"})
+    identity = client.get("/items", headers={"Accept-Encoding": "identity"})
+
+    # then
+    assert large.headers["Content-Encoding"] == "gzip"
+    assert large.headers["Vary"] == "Accept-Encoding"
+    assert large.headers["ETag"] == 'W/"items"'
+    assert large.json() == ITEMS
+    assert "Content-Encoding" not in small.headers
+    assert small.headers["Vary"] == "Accept-Encoding"
+    assert "Content-Encoding" not in identity.headers
+    assert identity.headers["ETag"] == '"items"'
+    gzip_stats = stats.stats()["codecs"]["gzip"]
+    assert gzip_stats["responses"] == 1
+    assert gzip_stats["bytes_out"] < gzip_stats["bytes_in"]
+
+
+def test_streaming_response_uses_route_level():
+    # given
+    stats = CompressionStats()
+    client = TestClient(build_app(stats))
+
+    # when
+    response = client.get("/items/export", headers={"Accept-Encoding": "gzip"})
+
+    # then
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert "Content-Length" not in response.headers
+    assert [json.loads(line) for line in response.text.splitlines()] == ITEMS
+    gzip_stats = stats.stats()["codecs"]["gzip"]
+    assert gzip_stats["responses"] == 1
+    # route 별 level 0 (무압축) 이 적용되었다
+    assert gzip_stats["bytes_out"] > gzip_stats["bytes_in"]
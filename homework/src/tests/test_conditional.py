@@ -0,0 +1,60 @@
+from datetime import datetime, timedelta
+
+from fastapi import FastAPI, Request, Response
+from fastapi.testclient import TestClient
+
+from core.http.conditional import evaluate_conditional, http_date, make_etag
+
+UPDATED_AT = datetime(2026, 1, 1, 12, 0, 0, 500_000)
+
+app = FastAPI()
+
+
+@app.get("/item")
+def get_item_handler(request: Request, response: Response):
+    not_modified = evaluate_conditional(
+        request, response, etag=make_etag(1, "apple"), last_modified=UPDATED_AT
+    )
+    if not_modified:
+        return not_modified
+    return {"id": 1, "name": "apple"}
+
+
+client = TestClient(app)
+
+
+def test_if_none_match_returns_304():
+    # given
+    etag = client.get("/item").headers["ETag"]
+
+    # when
+    same = client.get("/item", headers={"If-None-Match": f'"other", W/{etag}'})
+    different = client.get("/item", headers={"If-None-Match": '"other"'})
+
+    # then
+    assert same.status_code == 304
+    assert same.headers["ETag"] == etag
+    assert different.status_code == 200
+    assert different.json() == {"id": 1, "name": "apple"}
+
+
+def test_if_modified_since_is_compared_in_seconds():
+    # given
+    last_modified = client.get("/item").headers["Last-Modified"]
+    earlier = http_date(UPDATED_AT - timedelta(seconds=1))
+
+    # when
+    same = client.get("/item", headers={"If-Modified-Since": last_modified})
+    older = client.get("/item", headers={"If-Modified-Since": earlier})
+    invalid = client.get("/item", headers={"If-Modified-Since": "yesterday"})
+    # If-None-Match 가 있으면 If-Modified-Since 는 보지 않는다
+    etag_wins = client.get(
+        "/item",
+        headers={"If-None-Match": '"other"', "If-Modified-Since": last_modified},
+    )
+
+    # then
+    assert same.status_code == 304
+    assert older.status_code == 200
+    assert invalid.status_code == 200
+    assert etag_wins.status_code == 200
@@ -0,0 +1,43 @@
+import hashlib
+import io
+import os
+
+import pytest
+
+from core.storage.content_store import ContentAddressedStore
+from core.storage.exceptions.custom_exceptions import ContentTooLargeException
+
+
+def test_save_deduplicates_same_content(tmp_path):
+    # given
+    store = ContentAddressedStore(root=str(tmp_path), chunk_size=4, max_bytes=1024)
+    content = b"same image bytes"
+
+    # when
+    first = store.save(io.BytesIO(content))
+    second = store.save(io.BytesIO(content))
+
+    # then
+    assert first.hash == second.hash == hashlib.sha256(content).hexdigest()
+    assert first.created and not second.created
+    with open(first.path, "rb") as f:
+        assert f.read() == content
+    assert store.stats()["saved"] == 1
+    assert store.stats()["deduplicated"] == 1
+
+
+def test_save_rejects_content_over_limit_while_streaming(tmp_path):
+    # given
+    store = ContentAddressedStore(root=str(tmp_path), chunk_size=4, max_bytes=10)
+    source = io.BytesIO(b"x" * 100)
+
+    # when
+    with pytest.raises(ContentTooLargeException):
+        store.save(source)
+
+    # then
+    assert source.tell() <= 12  # 제한을 넘은 chunk 까지만 읽었다
+    assert os.listdir(tmp_path / "tmp") == []  # 임시 파일은 지워졌다
+    with pytest.raises(ContentTooLargeException):
+        store.save(io.BytesIO(b""), declared_size=11)
+    assert store.stats()["rejected"] == 2
@@ -0,0 +1,65 @@
+import asyncio
+
+from core.database.data_loader import DataLoader
+
+
+class FakeBatchSource:
+    def __init__(self, broken_key: int | None = None):
+        self.calls: list[list[int]] = []
+        self.broken_key = broken_key
+
+    async def load(self, keys: list[int]) -> dict[int, str]:
+        self.calls.append(keys)
+        if self.broken_key in keys:
+            raise ValueError(f"broken key {self.broken_key}")
+        return {key: f"user_{key}" for key in keys if key % 10 != 0}
+
+
+def test_concurrent_loads_are_batched_into_one_call():
+    # given
+    source = FakeBatchSource()
+    loader = DataLoader(batch_fn=source.load, max_batch_size=100)
+
+    # when
+    async def load_many():
+        return await asyncio.gather(*(loader.load(key) for key in [1, 2, 2, 10, 3]))
+
+    results = asyncio.run(load_many())
+
+    # then
+    assert results == ["user_1", "user_2", "user_2", None, "user_3"]
+    assert source.calls == [[1, 2, 10, 3]]
+
+
+def test_max_batch_size_splits_batches():
+    # given
+    source = FakeBatchSource()
+    loader = DataLoader(batch_fn=source.load, max_batch_size=2)
+
+    # when
+    async def load_many():
+        return await asyncio.gather(*(loader.load(key) for key in range(1, 6)))
+
+    asyncio.run(load_many())
+
+    # then
+    assert [len(keys) for keys in source.calls] == [2, 2, 1]
+
+
+def test_failing_key_does_not_fail_the_batch():
+    # given
+    source = FakeBatchSource(broken_key=2)
+    loader = DataLoader(batch_fn=source.load, max_batch_size=100)
+
+    # when
+    async def load_many():
+        return await asyncio.gather(
+            *(loader.load(key) for key in [1, 2, 3]), return_exceptions=True
+        )
+
+    results = asyncio.run(load_many())
+
+    # then
+    assert results[0] == "user_1"
+    assert isinstance(results[1], ValueError)
+    assert results[2] == "user_3"
@@ -0,0 +1,105 @@
+from datetime import datetime
+
+from fastapi import Depends, FastAPI, Response, status
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+from core.http.dto_route import DtoJsonRoute, use_dto_json_routes
+
+
+class ItemResponseDto(BaseModel):
+    id: int
+    name: str
+    created_at: datetime
+    tags: list[str] = []
+
+
+def get_name() -> str:
+    return "사과"
+
+
+def build_app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/items/{item_id}", response_model=ItemResponseDto)
+    def get_item_handler(
+        item_id: int, response: Response, name: str = Depends(get_name)
+    ):
+        response.headers["ETag"] = '"item"'
+        return ItemResponseDto(
+            id=item_id, name=name, created_at=datetime(2026, 1, 1), tags=["a"]
+        )
+
+    @app.post(
+        "/items", response_model=ItemResponseDto, status_code=status.HTTP_201_CREATED
+    )
+    async def create_item_handler():
+        return ItemResponseDto(
+            id=1, name="apple", created_at=datetime(2026, 1, 1), tags=[]
+        )
+
+    @app.get("/items-dict", response_model=ItemResponseDto)
+    async def get_item_dict_handler():
+        return {"id": "2", "name": "pear", "created_at": "2026-01-01T00:00:00"}
+
+    @app.get("/items-empty", response_model=ItemResponseDto)
+    def get_item_empty_handler():
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED)
+
+    return app
+
+
+standard = TestClient(build_app())
+fast_app = build_app()
+use_dto_json_routes(fast_app)
+fast = TestClient(fast_app)
+
+
+def test_routes_are_replaced_and_body_is_unchanged():
+    # when
+    expected = standard.get("/items/1")
+    response = fast.get("/items/1")
+
+    # then
+    assert all(
+        isinstance(route, DtoJsonRoute)
+        for route in fast_app.routes
+        if route.path.startswith("/items")
+    )
+    assert response.status_code == 200
+    assert response.content == expected.content
+    assert response.headers["content-type"] == "application/json"
+    assert response.headers["ETag"] == '"item"'
+    assert fast_app.openapi() == build_app().openapi()
+
+
+def test_status_code_and_fallback_paths():
+    # when
+    created = fast.post("/items")
+    from_dict = fast.get("/items-dict")
+    not_modified = fast.get("/items-empty")
+
+    # then
+    assert created.status_code == 201
+    assert created.json()["name"] == "apple"
+    # DTO 가 아닌 반환값은 기존대로 response_model 로 검증된다
+    assert from_dict.status_code == 200
+    assert from_dict.json() == {
+        "id": 2,
+        "name": "pear",
+        "created_at": "2026-01-01T00:00:00",
+        "tags": [],
+    }
+    assert not_modified.status_code == 304
+
+
+def test_dependency_overrides_still_apply():
+    # given
+    fast_app.dependency_overrides[get_name] = lambda: "banana"
+
+    # when
+    response = fast.get("/items/3")
+
+    # then
+    fast_app.dependency_overrides.clear()
+    assert response.json()["name"] == "banana"
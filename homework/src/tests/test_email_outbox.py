@@ -0,0 +1,208 @@
+import asyncio
+import smtplib
+from datetime import datetime, timedelta
+
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from core.database.orm import Base
+from core.email.domains.email_outbox import EmailOutbox, EmailOutboxStatus
+from core.email.services.email_outbox_dispatcher import EmailOutboxDispatcher
+from core.email.services.smtp_pool import SmtpConnectionPool
+
+
+class StubSmtp:
+    # 로컬 SMTP 서버 대신 보낸 메일을 기록한다 (recipient 별로 응답을 정할 수 있다)
+    def __init__(self, errors: dict[str, Exception] | None = None):
+        self.errors = errors or {}
+        self.sent: list[str] = []
+        self.closed = False
+
+    def send_message(self, message):
+        error = self.errors.get(message["To"])
+        if error is not None:
+            raise error
+        self.sent.append(message["To"])
+
+    def noop(self):
+        return 250, b"OK"
+
+    def quit(self):
+        self.closed = True
+
+    def close(self):
+        self.closed = True
+
+
+def create_dispatcher(*connections: StubSmtp, max_attempts: int = 3):
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(engine, tables=[EmailOutbox.__table__])
+    session_factory = sessionmaker(bind=engine, expire_on_commit=False)
+    factory = iter(connections)
+
+    dispatcher = EmailOutboxDispatcher(
+        session_factory=session_factory,
+        smtp_pool=SmtpConnectionPool(
+            factory=lambda: next(factory), max_size=1, idle_seconds=30
+        ),
+        sender="no-reply@test.com",
+        batch_size=10,
+        poll_seconds=0.01,
+        lease_seconds=60,
+        max_attempts=max_attempts,
+        backoff_seconds=5,
+        backoff_max_seconds=600,
+        retention_seconds=3600,
+        prune_seconds=3600,
+    )
+    return dispatcher, session_factory
+
+
+def enqueue(session_factory, *recipients: str) -> None:
+    with session_factory() as session:
+        for recipient in recipients:
+            session.add(
+                EmailOutbox.create(recipient=recipient, subject="환영", body="본문")
+            )
+        session.commit()
+
+
+def outbox_by_recipient(session_factory) -> dict[str, EmailOutbox]:
+    with session_factory() as session:
+        return {e.recipient: e for e in session.scalars(select(EmailOutbox))}
+
+
+def test_dispatcher_sends_batch_over_one_pooled_connection():
+    # given
+    smtp = StubSmtp()
+    dispatcher, session_factory = create_dispatcher(smtp)
+    enqueue(session_factory, "a@test.com", "b@test.com")
+
+    # when
+    delivered = asyncio.run(dispatcher.run_once())
+    enqueue(session_factory, "c@test.com")
+    asyncio.run(dispatcher.run_once())
+
+    # then
+    outbox = outbox_by_recipient(session_factory)
+    assert delivered == 2
+    assert smtp.sent == ["a@test.com", "b@test.com", "c@test.com"]
+    assert all(e.status == EmailOutboxStatus.SENT for e in outbox.values())
+    assert dispatcher.smtp_pool.stats()["opened"] == 1
+    assert dispatcher.smtp_pool.stats()["reused"] == 1
+    assert dispatcher.stats()["backlog"] == 0
+
+
+def test_dispatcher_retries_transient_and_fails_permanent_errors():
+    # given
+    smtp = StubSmtp(
+        errors={
+            "busy@test.com": smtplib.SMTPResponseException(451, b"try later"),
+            "unknown@test.com": smtplib.SMTPRecipientsRefused(
+                {"unknown@test.com": (550, b"no such user")}
+            ),
+        }
+    )
+    dispatcher, session_factory = create_dispatcher(smtp)
+    enqueue(session_factory, "busy@test.com", "unknown@test.com", "ok@test.com")
+
+    # when
+    asyncio.run(dispatcher.run_once())
+
+    # then
+    outbox = outbox_by_recipient(session_factory)
+    busy = outbox["busy@test.com"]
+    assert busy.status == EmailOutboxStatus.PENDING
+    assert busy.attempts == 1
+    assert busy.next_attempt_at > datetime.now() + timedelta(seconds=3)
+    assert "451" in busy.last_error
+    assert outbox["unknown@test.com"].status == EmailOutboxStatus.FAILED
+    assert outbox["ok@test.com"].status == EmailOutboxStatus.SENT
+    # 발송이 끝난 메일의 본문은 지운다 (재시도할 메일은 남긴다)
+    assert outbox["unknown@test.com"].body == outbox["ok@test.com"].body == ""
+    assert busy.body == "본문"
+    # 다음 시도 시각 전에는 다시 가져가지 않는다
+    assert asyncio.run(dispatcher.run_once()) == 0
+
+
+def test_dispatcher_gives_up_after_max_attempts():
+    # given
+    smtp = StubSmtp(
+        errors={"busy@test.com": smtplib.SMTPResponseException(421, b"busy")}
+    )
+    dispatcher, session_factory = create_dispatcher(smtp, max_attempts=2)
+    enqueue(session_factory, "busy@test.com")
+
+    # when
+    for _ in range(2):
+        asyncio.run(dispatcher.run_once())
+        with session_factory() as session:
+            email = session.scalars(select(EmailOutbox)).one()
+            email.next_attempt_at = datetime.now()
+            session.commit()
+
+    # then
+    email = outbox_by_recipient(session_factory)["busy@test.com"]
+    assert email.status == EmailOutboxStatus.FAILED
+    assert email.attempts == 2
+
+
+def test_broken_connection_is_discarded_and_batch_retried():
+    # given
+    broken = StubSmtp(
+        errors={"a@test.com": smtplib.SMTPServerDisconnected("connection lost")}
+    )
+    healthy = StubSmtp()
+    dispatcher, session_factory = create_dispatcher(broken, healthy)
+    enqueue(session_factory, "a@test.com", "b@test.com")
+
+    # when
+    asyncio.run(dispatcher.run_once())
+    with session_factory() as session:
+        for email in session.scalars(select(EmailOutbox)):
+            email.next_attempt_at = datetime.now()
+        session.commit()
+    asyncio.run(dispatcher.run_once())
+
+    # then
+    outbox = outbox_by_recipient(session_factory)
+    assert broken.closed is True
+    assert broken.sent == []
+    assert healthy.sent == ["a@test.com", "b@test.com"]
+    assert all(e.status == EmailOutboxStatus.SENT for e in outbox.values())
+    assert dispatcher.smtp_pool.stats()["discarded"] == 1
+
+
+def test_finished_emails_are_pruned_after_retention():
+    # given
+    smtp = StubSmtp(
+        errors={
+            "busy@test.com": smtplib.SMTPResponseException(451, b"try later"),
+            "unknown@test.com": smtplib.SMTPResponseException(550, b"no such user"),
+        }
+    )
+    dispatcher, session_factory = create_dispatcher(smtp)
+    enqueue(session_factory, "busy@test.com", "unknown@test.com", "old@test.com")
+    asyncio.run(dispatcher.run_once())
+    with session_factory() as session:
+        for email in session.scalars(select(EmailOutbox)):
+            email.next_attempt_at = datetime.now() - timedelta(hours=2)
+        session.commit()
+    enqueue(session_factory, "new@test.com")
+    asyncio.run(dispatcher.run_once())  # busy 는 다시 실패, new 는 방금 보냈다
+
+    # when
+    pruned = dispatcher.prune_finished()
+
+    # then: retention(1시간)이 지난 sent / failed 만 지운다 (재시도 대기는 남긴다)
+    assert pruned == 2
+    assert set(outbox_by_recipient(session_factory)) == {
+        "busy@test.com",
+        "new@test.com",
+    }
+    assert dispatcher.stats()["pruned"] == 2
@@ -0,0 +1,27 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from core.authenticate.services.authenticate_service import AuthenticateService
+from core.config import settings
+from core.metrics.routers import router
+
+
+def build_client(username: str) -> TestClient:
+    app = FastAPI()
+    app.include_router(router)
+    app.dependency_overrides[AuthenticateService.get_username] = lambda: username
+    return TestClient(app)
+
+
+def test_metrics_requires_admin_username(monkeypatch):
+    # given
+    monkeypatch.setattr(settings, "admin_usernames", ["admin"])
+
+    # when: 가입만 하면 누구나 로그인할 수 있다
+    member = build_client("test_user").get("/admin/metrics")
+    admin = build_client("admin").get("/admin/metrics")
+
+    # then
+    assert member.status_code == 403
+    assert admin.status_code == 200
+    assert isinstance(admin.json(), dict)
@@ -0,0 +1,59 @@
+from datetime import datetime
+
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.orm import sessionmaker
+
+from core.authenticate.services.authenticate_service import AuthenticateService
+from core.cache.backends import InMemoryCacheBackend
+from core.database import connection
+from core.database.routing import RoutingSession
+from main import app
+from users.domains.user import UserReadRow
+from users.repositorys.user_cache import create_user_cache, get_user_cache
+
+
+def test_rejected_and_cached_requests_do_not_check_out_connections(
+    test_db, monkeypatch
+):
+    # given
+    # get_db 를 override 하지 않고 실제 get_db 가 test_db 의 pool 을 쓰도록 한다
+    monkeypatch.setattr(
+        connection,
+        "SessionFactory",
+        sessionmaker(class_=RoutingSession, bind=test_db, expire_on_commit=False),
+    )
+    monkeypatch.setattr(app, "dependency_overrides", {})
+
+    user_cache = create_user_cache(backend=InMemoryCacheBackend(maxsize=10))
+    user_cache.get_or_load(
+        user_cache.key("id", 1),
+        lambda: UserReadRow(id=1, username="cached_user", created_at=datetime.now()),
+    )
+    app.dependency_overrides[get_user_cache] = lambda: user_cache
+
+    checkouts = []
+
+    def count_checkout(*args):
+        checkouts.append(args)
+
+    event.listen(test_db, "checkout", count_checkout)
+    headers = {
+        "Authorization": f"Bearer {AuthenticateService.create_access_token('any')}"
+    }
+    client = TestClient(app=app)
+
+    # when
+    rejected = client.get("/users/1")
+    rejected_checkouts = len(checkouts)
+    cached = client.get("/users/1", headers=headers)
+    cached_checkouts = len(checkouts) - rejected_checkouts
+    client.get("/users/2", headers=headers)  # 캐시에 없으면 DB 를 조회한다
+    event.remove(test_db, "checkout", count_checkout)
+
+    # then
+    assert rejected.status_code == 401
+    assert rejected_checkouts == 0
+    assert cached.status_code == 200
+    assert cached_checkouts == 0
+    assert len(checkouts) == 1
@@ -0,0 +1,31 @@
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+from core.database.pool import InstrumentedQueuePool, pool_metrics
+
+
+def test_pool_metrics_counts_checkouts_and_timeouts(tmp_path):
+    # given
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'pool.db'}",
+        poolclass=InstrumentedQueuePool,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.01,
+    )
+    connection = engine.connect()
+
+    # when
+    with pytest.raises(PoolTimeoutError):
+        engine.connect()
+    metrics = pool_metrics(engine)
+    connection.close()
+    engine.dispose()  # pool 을 다시 만들어도 통계는 유지된다
+
+    # then
+    assert metrics["checked_out"] == 1
+    assert metrics["checkouts"] == 1
+    assert metrics["checkout_timeouts"] == 1
+    assert metrics["wait_seconds_histogram"]["+Inf"] == 1
+    assert pool_metrics(engine)["checkout_timeouts"] == 1
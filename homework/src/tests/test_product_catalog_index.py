@@ -0,0 +1,224 @@
+from datetime import datetime, timedelta
+
+from sqlalchemy import create_engine, delete, insert, update
+from sqlalchemy.orm import sessionmaker
+
+from core.database.orm import Base
+from products.domains.product import Product, ProductTombstone
+from products.repositorys.product_catalog_index import (
+    ProductCatalogIndex,
+    catalog_entry,
+)
+
+UPDATED_AT = datetime(2024, 1, 1)
+
+
+def _session_factory(tmp_path, products: list[tuple[str, int]]):
+    engine = create_engine(f"sqlite:///{tmp_path / 'catalog.db'}")
+    Base.metadata.create_all(engine)
+    with engine.begin() as connection:
+        connection.execute(
+            insert(Product),
+            [
+                {"name": name, "price": price, "updated_at": UPDATED_AT}
+                for name, price in products
+            ],
+        )
+    return sessionmaker(bind=engine)
+
+
+def test_query_price_range_and_cursor(tmp_path):
+    # given
+    index = ProductCatalogIndex()
+    index.rebuild(
+        _session_factory(
+            tmp_path,
+            [("apple", 3000), ("banana", 1000), ("cherry", 2000), ("durian", 9000)],
+        )
+    )
+
+    # when
+    first = index.query(limit=2, max_price=5000)
+    second = index.query(limit=2, max_price=5000, after=(first[-1].price, first[-1].id))
+    cheap = index.query(limit=10, min_price=2000, max_price=3000)
+
+    # then
+    assert [p.name for p in first] == ["banana", "cherry"]
+    assert [p.name for p in second] == ["apple"]
+    assert [p.name for p in cheap] == ["cherry", "apple"]
+
+
+def test_query_name_exact_and_prefix(tmp_path):
+    # given
+    index = ProductCatalogIndex()
+    index.rebuild(
+        _session_factory(
+            tmp_path, [("Apple", 3000), ("apple", 1000), ("applepie", 2000), ("b", 1)]
+        )
+    )
+
+    # when
+    exact = index.query(limit=10, name="APPLE")
+    prefix = index.query(limit=10, name_prefix="app", max_price=2500)
+
+    # then
+    assert [(p.name, p.price) for p in exact] == [("apple", 1000), ("Apple", 3000)]
+    assert [p.name for p in prefix] == ["apple", "applepie"]
+
+
+def test_refresh_reads_only_changes_after_watermark(tmp_path):
+    # given
+    session_factory = _session_factory(tmp_path, [("apple", 1000), ("banana", 2000)])
+    with session_factory.begin() as session:
+        session.execute(
+            update(Product)
+            .where(Product.name == "banana")
+            .values(updated_at=UPDATED_AT - timedelta(hours=1))
+        )
+    index = ProductCatalogIndex()
+    index.rebuild(session_factory)
+
+    # when
+    with session_factory.begin() as session:
+        session.execute(
+            update(Product)
+            .where(Product.name == "apple")
+            .values(price=5000, updated_at=UPDATED_AT + timedelta(minutes=1))
+        )
+        # updated_at 을 바꾸지 않은 변경(직접 실행한 SQL 등)은 증분 갱신 대상이 아니다
+        session.execute(
+            update(Product)
+            .where(Product.name == "banana")
+            .values(price=1, updated_at=Product.updated_at)
+        )
+        session.execute(
+            insert(Product),
+            [{"name": "cherry", "price": 10, "updated_at": UPDATED_AT}],
+        )
+    index.refresh(session_factory)
+
+    # then
+    assert [(p.name, p.price) for p in index.query(limit=10)] == [
+        ("cherry", 10),
+        ("banana", 2000),
+        ("apple", 5000),
+    ]
+    assert index.stats()["refreshed_products"] == 2
+
+
+def test_local_writes_and_stale_rows(tmp_path):
+    # given
+    session_factory = _session_factory(tmp_path, [("apple", 1000), ("banana", 2000)])
+    index = ProductCatalogIndex()
+    index.rebuild(session_factory)
+    apple, banana = index.query(limit=10)
+
+    # when: updated_at 이 같은 초여도 version 으로 선후를 가린다
+    index.upsert(catalog_entry(apple.id, "apple", 4000, "apple.png", UPDATED_AT, 3))
+    index.upsert(
+        catalog_entry(apple.id, "apple", 1000, None, UPDATED_AT, 2)
+    )  # 오래된 값
+    index.discard(banana.id)
+    index.apply_pending()
+    with session_factory.begin() as session:
+        session.execute(delete(Product).where(Product.id == banana.id))
+    index.refresh(session_factory)  # DB 의 apple 은 version 1
+
+    # then
+    assert index.query(limit=10) == [(apple.id, "apple", 4000, "apple.png", UPDATED_AT)]
+    assert index.query(limit=10, name="banana") == []
+
+
+def test_local_writes_are_applied_in_one_batch(tmp_path):
+    # given
+    index = ProductCatalogIndex()
+    index.rebuild(_session_factory(tmp_path, [("apple", 1000)]))
+    (apple,) = index.query(limit=10)
+
+    # when: 커밋 직후에는 큐에만 쌓는다
+    for version, price in enumerate([2000, 3000, 4000], start=2):
+        index.upsert(catalog_entry(apple.id, "apple", price, None, UPDATED_AT, version))
+    queued = index.query(limit=10)
+    applied = index.apply_pending()
+
+    # then
+    assert [p.price for p in queued] == [1000]
+    assert applied == 3
+    assert [p.price for p in index.query(limit=10)] == [4000]
+    assert index.stats()["applied_batches"] == 1
+    assert index.stats()["queued"] == 0
+
+
+def test_refresh_removes_products_deleted_by_other_workers(tmp_path):
+    # given
+    session_factory = _session_factory(
+        tmp_path, [("apple", 1000), ("banana", 2000), ("cherry", 3000)]
+    )
+    index = ProductCatalogIndex()
+    index.rebuild(session_factory)
+    apple, banana, cherry = index.query(limit=10)
+
+    # when: 다른 워커가 banana 를 지우고 cherry 의 가격을 지웠다
+    with session_factory.begin() as session:
+        session.execute(delete(Product).where(Product.id == banana.id))
+        session.execute(
+            insert(ProductTombstone),
+            [{"product_id": banana.id, "deleted_at": UPDATED_AT}],
+        )
+        session.execute(
+            update(Product).where(Product.id == cherry.id).values(price=None)
+        )
+    index.refresh(session_factory)
+
+    # then: 가격이 없는 제품은 목록에서 빠진다 (rebuild 도 실패하지 않는다)
+    assert [p.name for p in index.query(limit=10)] == ["apple"]
+    index.rebuild(session_factory)
+    assert [p.name for p in index.query(limit=10)] == ["apple"]
+
+
+def test_search_ranks_fuzzy_and_prefix_matches(tmp_path):
+    # given
+    index = ProductCatalogIndex()
+    index.rebuild(
+        _session_factory(
+            tmp_path,
+            [
+                ("blue chair", 5000),
+                ("blue chairs", 3000),
+                ("red chair", 1000),
+                ("bluetooth", 2000),
+                ("table", 100),
+            ],
+        )
+    )
+
+    # when
+    typo = index.search(query="blue chiar", limit=10)
+    prefix = index.search(query="blu", limit=10)
+    cheap = index.search(query="chair", limit=10, max_price=3000)
+
+    # then
+    assert [row.name for row, _ in typo][:2] == ["blue chair", "blue chairs"]
+    assert {row.name for row, _ in prefix} == {"blue chair", "blue chairs", "bluetooth"}
+    assert [row.name for row, _ in cheap] == ["red chair", "blue chairs"]
+    assert all(score >= 0.3 for _, score in typo + prefix + cheap)
+
+
+def test_search_follows_renames_and_deletes(tmp_path):
+    # given
+    index = ProductCatalogIndex()
+    index.rebuild(_session_factory(tmp_path, [("lamp", 1000), ("desk", 2000)]))
+    (lamp, _), (desk, _) = index.search("lamp", 1) + index.search("desk", 1)
+
+    # when
+    newer = UPDATED_AT + timedelta(minutes=1)
+    index.upsert(catalog_entry(lamp.id, "floor light", 1000, None, newer, 2))
+    index.discard(desk.id)
+    index.apply_pending()
+
+    # then
+    assert index.search(query="lamp", limit=10) == []
+    assert index.search(query="desk", limit=10) == []
+    assert [row.name for row, _ in index.search(query="light", limit=10)] == [
+        "floor light"
+    ]
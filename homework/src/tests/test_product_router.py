@@ -0,0 +1,109 @@
+import hashlib
+
+from products.domains.product import Product
+
+
+def test_create_product(client, test_session):
+    # given
+
+    # when
+    response = client.post("/products", json={"name": "apple", "price": 1000})
+
+    # then
+    assert response.status_code == 201
+    assert response.json()["name"] == "apple"
+    assert test_session.get(Product, response.json()["id"])
+
+
+def test_get_products_filter_and_cursor(client, test_session):
+    # given
+    for name, price in [("apple", 3000), ("banana", 1000), ("cherry", 2000)]:
+        test_session.add(Product.create(name=name, price=price))
+    test_session.add(Product.create(name="durian", price=9000))
+    test_session.commit()
+
+    # when
+    first = client.get("/products", params={"max_price": 5000, "limit": 2})
+    second = client.get(
+        "/products",
+        params={"max_price": 5000, "limit": 2, "cursor": first.json()["next_cursor"]},
+    )
+
+    # then
+    assert [p["name"] for p in first.json()["products"]] == ["banana", "cherry"]
+    assert [p["name"] for p in second.json()["products"]] == ["apple"]
+    assert second.json()["next_cursor"] is None
+
+
+def test_get_product_not_found(client, test_session):
+    # given
+
+    # when
+    response = client.get("/products/0")
+
+    # then
+    assert response.status_code == 404
+
+
+def test_search_products(client, test_session):
+    # given
+    for name, price in [("blue chair", 5000), ("red chair", 1000), ("table", 100)]:
+        test_session.add(Product.create(name=name, price=price))
+    test_session.commit()
+
+    # when
+    response = client.get("/products/search", params={"q": "chair", "max_price": 3000})
+
+    # then
+    assert response.status_code == 200
+    assert [p["name"] for p in response.json()["products"]] == ["red chair"]
+    assert response.json()["products"][0]["score"] > 0
+
+
+def test_update_product_file(client, test_session):
+    # given
+    product = Product.create(name="apple", price=1000)
+    test_session.add(product)
+    test_session.commit()
+    content = b"\x89PNG fake image"
+
+    # when
+    response = client.patch(
+        f"/products/file/{product.id}",
+        files={"file": ("apple.png", content, "image/png")},
+    )
+    too_large = client.patch(
+        f"/products/file/{product.id}",
+        files={"file": ("big.png", b"x" * (64 * 1024 + 1), "image/png")},
+    )
+
+    # then
+    assert response.status_code == 200
+    assert response.json()["image_name"] == "apple.png"
+    test_session.refresh(product)
+    assert product.image_hash == hashlib.sha256(content).hexdigest()
+    assert too_large.status_code == 413
+
+
+def test_get_product_conditional(client, test_session):
+    # given
+    product = Product.create(name="apple", price=1000)
+    test_session.add(product)
+    test_session.commit()
+    first = client.get(f"/products/{product.id}")
+
+    # when
+    not_modified = client.get(
+        f"/products/{product.id}", headers={"If-None-Match": first.headers["ETag"]}
+    )
+    client.patch(f"/products/{product.id}", json={"price": 2000})
+    modified = client.get(
+        f"/products/{product.id}", headers={"If-None-Match": first.headers["ETag"]}
+    )
+
+    # then
+    assert first.status_code == 200
+    assert not_modified.status_code == 304
+    assert modified.status_code == 200
+    assert modified.json()["price"] == 2000
+    assert modified.headers["ETag"] != first.headers["ETag"]
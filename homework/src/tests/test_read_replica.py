@@ -0,0 +1,74 @@
+import pytest
+from sqlalchemy import create_engine, insert, select
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import sessionmaker
+
+from core.database.orm import Base
+from core.database.routing import READ_REPLICA, ReplicaSet, RoutingSession
+from users.domains.user import User
+
+# replica 에서 읽었는지 primary 에서 읽었는지 구분하기 위해 서로 다른 데이터를 넣는다
+SELECT_USERNAMES = select(User.username).order_by(User.id)
+
+
+def _create_sqlite_engine(path, username: str):
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(engine)
+    with engine.begin() as connection:
+        connection.execute(insert(User), [{"username": username, "password": "x"}])
+    return engine
+
+
+def _routing_session_factory(tmp_path, strategy="round_robin"):
+    primary = _create_sqlite_engine(tmp_path / "primary.db", "primary_user")
+    replica = _create_sqlite_engine(tmp_path / "replica.db", "replica_user")
+    replicas = ReplicaSet(engines=[replica], strategy=strategy)
+    return sessionmaker(class_=RoutingSession, replicas=replicas, bind=primary)
+
+
+def test_read_only_query_goes_to_replica(tmp_path):
+    # given
+    session_factory = _routing_session_factory(tmp_path)
+
+    # when
+    with session_factory() as session:
+        replica_rows = session.scalars(
+            SELECT_USERNAMES, bind_arguments=READ_REPLICA
+        ).all()
+        primary_rows = session.scalars(SELECT_USERNAMES).all()
+
+    # then
+    assert replica_rows == ["replica_user"]
+    assert primary_rows == ["primary_user"]
+
+
+def test_reads_stick_to_primary_after_write(tmp_path):
+    # given
+    session_factory = _routing_session_factory(tmp_path, strategy="least_connections")
+
+    # when
+    with session_factory() as session:
+        session.execute(insert(User), [{"username": "new_user", "password": "x"}])
+        session.commit()
+        rows = session.scalars(SELECT_USERNAMES, bind_arguments=READ_REPLICA).all()
+
+    # then
+    assert rows == ["primary_user", "new_user"]
+
+
+def test_unreachable_replica_is_evicted(tmp_path):
+    # given
+    primary = _create_sqlite_engine(tmp_path / "primary.db", "primary_user")
+    broken = create_engine(f"sqlite:///{tmp_path / 'missing' / 'replica.db'}")
+    replicas = ReplicaSet(engines=[broken], retry_seconds=60)
+
+    # when
+    with pytest.raises(OperationalError):
+        broken.connect()
+
+    # then
+    assert replicas.choose() is None
+    with sessionmaker(class_=RoutingSession, replicas=replicas, bind=primary)() as s:
+        assert s.scalars(SELECT_USERNAMES, bind_arguments=READ_REPLICA).all() == [
+            "primary_user"
+        ]
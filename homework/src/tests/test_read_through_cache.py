@@ -0,0 +1,67 @@
+import asyncio
+
+from core.cache.backends import InMemoryCacheBackend
+from core.cache.read_through_cache import ReadThroughCache
+
+
+def create_cache() -> ReadThroughCache:
+    return ReadThroughCache(
+        backend=InMemoryCacheBackend(maxsize=100),
+        namespace="test",
+        ttl_seconds=60,
+        negative_ttl_seconds=60,
+        dumps=lambda value: value.encode(),
+        loads=lambda raw: raw.decode(),
+    )
+
+
+def test_concurrent_misses_share_one_load():
+    # given
+    cache = create_cache()
+    calls = []
+
+    async def loader():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return "value"
+
+    # when
+    async def run():
+        return await asyncio.gather(
+            *(cache.aget_or_load("test:1", loader) for _ in range(5))
+        )
+
+    results = asyncio.run(run())
+
+    # then
+    assert results == ["value"] * 5
+    assert len(calls) == 1
+
+
+def test_waiter_takes_over_when_leader_is_cancelled():
+    # given
+    cache = create_cache()
+    calls = []
+
+    async def loader():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return "value"
+
+    # when
+    async def run():
+        leader = asyncio.create_task(cache.aget_or_load("test:1", loader))
+        await asyncio.sleep(0.01)
+        waiters = [
+            asyncio.create_task(cache.aget_or_load("test:1", loader)) for _ in range(3)
+        ]
+        await asyncio.sleep(0.01)
+        leader.cancel()  # 클라이언트 연결 끊김 등
+        return leader, await asyncio.gather(*waiters)
+
+    leader, results = asyncio.run(run())
+
+    # then: 기다리던 요청은 실패하지 않고, 그 중 하나만 다시 조회한다
+    assert leader.cancelled()
+    assert results == ["value"] * 3
+    assert len(calls) == 2
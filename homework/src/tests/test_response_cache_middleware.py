@@ -0,0 +1,184 @@
+import asyncio
+import time
+
+from fastapi import FastAPI, Request, Response
+from fastapi.testclient import TestClient
+
+from core.cache.backends import InMemoryCacheBackend
+from core.cache.response_cache import (
+    CachedResponse,
+    ResponseCache,
+    set_surrogate_keys,
+)
+from core.http.conditional import evaluate_conditional, make_etag
+from core.middlewares.middlewares.response_cache_middleware import (
+    ResponseCacheMiddleware,
+)
+
+
+def build_app(ttl_seconds: float, stale_seconds: float):
+    cache = ResponseCache(
+        backend=InMemoryCacheBackend(maxsize=100),
+        namespace="test",
+        ttl_seconds=ttl_seconds,
+        stale_seconds=stale_seconds,
+        max_body_bytes=1024,
+    )
+    app = FastAPI()
+    app.state.version = 1
+
+    @app.get("/items")
+    def get_items_handler(request: Request, response: Response, limit: int = 10):
+        version = app.state.version
+        not_modified = evaluate_conditional(
+            request, response, etag=make_etag(version, limit)
+        )
+        if not_modified:
+            return not_modified
+        set_surrogate_keys(response, "items")
+        return {"version": version, "limit": limit}
+
+    @app.get("/untagged")
+    def get_untagged_handler():
+        return {"version": app.state.version}
+
+    app.add_middleware(ResponseCacheMiddleware, cache=cache)
+    return app, cache
+
+
+def test_hit_skips_app_until_purge():
+    # given
+    app, cache = build_app(ttl_seconds=60, stale_seconds=60)
+    client = TestClient(app)
+    first = client.get("/items", params={"limit": 5, "a": ""})
+
+    # when
+    app.state.version = 2
+    hit = client.get("/items", params={"a": "", "limit": 5})
+    cache.purge("items")
+    after_purge = client.get("/items", params={"limit": 5, "a": ""})
+
+    # then
+    assert first.headers["X-Cache"] == "MISS"
+    assert "Surrogate-Key" not in first.headers
+    assert hit.headers["X-Cache"] == "HIT"
+    assert hit.json() == {"version": 1, "limit": 5}
+    assert hit.headers["ETag"] == first.headers["ETag"]
+    assert after_purge.headers["X-Cache"] == "MISS"
+    assert after_purge.json() == {"version": 2, "limit": 5}
+
+
+def test_bypass_and_conditional_hit():
+    # given
+    app, cache = build_app(ttl_seconds=60, stale_seconds=60)
+    client = TestClient(app)
+    etag = client.get("/items").headers["ETag"]
+    client.get("/untagged")
+
+    # when
+    not_modified = client.get("/items", headers={"If-None-Match": etag})
+    authorized = client.get("/items", headers={"Authorization": "Bearer token"})
+    untagged = client.get("/untagged")
+
+    # then
+    assert not_modified.status_code == 304
+    assert not_modified.headers["X-Cache"] == "HIT"
+    assert not_modified.headers["ETag"] == etag
+    assert "X-Cache" not in authorized.headers
+    assert "Surrogate-Key" not in authorized.headers
+    assert "X-Cache" not in untagged.headers
+    assert cache.stats()["stores"] == 1
+
+
+def test_stale_response_is_served_while_revalidating():
+    # given
+    app, cache = build_app(ttl_seconds=0, stale_seconds=60)
+
+    with TestClient(app) as client:
+        client.get("/items")
+        app.state.version = 2
+
+        # when
+        stale = client.get("/items")
+        for _ in range(100):
+            if cache.stats()["stores"] == 2:
+                break
+            time.sleep(0.01)
+        refreshed = client.get("/items")
+
+    # then
+    assert stale.headers["X-Cache"] == "STALE"
+    assert stale.json()["version"] == 1
+    assert refreshed.json()["version"] == 2
+    assert cache.stats()["revalidations"] >= 1
+
+
+class PurgeRacingBackend(InMemoryCacheBackend):
+    # tag key 를 처음 확인한 직후에 다른 요청의 purge 가 끼어든다
+    def __init__(self, maxsize: int):
+        super().__init__(maxsize=maxsize)
+        self.on_tag_access = None
+
+    async def aget(self, key: str) -> bytes | None:
+        value = await super().aget(key)
+        self._race(key)
+        return value
+
+    async def aadd(self, key: str, value: bytes, ttl_seconds: float) -> bool:
+        added = await super().aadd(key, value, ttl_seconds)
+        self._race(key)
+        return added
+
+    def _race(self, key: str) -> None:
+        if ":tag:" in key and self.on_tag_access is not None:
+            callback, self.on_tag_access = self.on_tag_access, None
+            callback()
+
+
+def create_entry(started_at: float) -> CachedResponse:
+    return CachedResponse(
+        status=200, headers=[], body=b"{}", started_at=started_at, tags=("items",)
+    )
+
+
+def test_store_does_not_overwrite_concurrent_purge():
+    # given
+    backend = PurgeRacingBackend(maxsize=100)
+    cache = ResponseCache(
+        backend=backend,
+        namespace="test",
+        ttl_seconds=60,
+        stale_seconds=60,
+        max_body_bytes=1024,
+    )
+    backend.on_tag_access = lambda: cache.purge("items")
+
+    # when: 응답을 만드는 사이에 purge 가 일어났다
+    async def run():
+        await cache.astore("key", create_entry(started_at=time.time() - 1))
+        return await cache.aget("key")
+
+    # then: purge 전에 만들기 시작한 응답은 쓰지 않는다
+    assert asyncio.run(run()) is None
+
+
+def test_store_keeps_used_tag_alive():
+    # given: tag key 의 ttl = 2 * (0.4 + 0) = 0.8 초
+    cache = ResponseCache(
+        backend=InMemoryCacheBackend(maxsize=100),
+        namespace="test",
+        ttl_seconds=0.4,
+        stale_seconds=0,
+        max_body_bytes=1024,
+    )
+
+    # when
+    async def run():
+        await cache.astore("first", create_entry(started_at=time.time()))
+        await asyncio.sleep(0.6)
+        await cache.astore("second", create_entry(started_at=time.time()))
+        await asyncio.sleep(0.3)  # tag 를 처음 만든 지 0.9 초
+        return await cache.aget("second")
+
+    # then: 저장할 때 tag 의 만료를 늘렸으므로 second 는 아직 유효하다
+    assert asyncio.run(run()) is not None
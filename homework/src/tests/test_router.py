@@ -1,4 +1,7 @@
+import re
+
 from core.authenticate.services.authenticate_service import AuthenticateService
+from core.email.domains.email_outbox import EmailOutbox
 from users.domains.user import User
 
 
@@ -81,3 +84,213 @@ def test_get_me(client, test_session):
     response = client.post(
         "/users/me/", headers={"Authorization": f"Bearer {access_token}"}
     )
+
+
+def test_get_users_pagination(client, test_session):
+    # given
+    for i in range(5):
+        test_session.add(
+            User.create(
+                username=f"page_user_{i}",
+                password=AuthenticateService.hash_password("test_password"),
+            )
+        )
+    test_session.commit()
+
+    # when
+    first_page = client.get("/users/", params={"limit": 3}).json()
+    second_page = client.get(
+        "/users/", params={"limit": 3, "cursor": first_page["next_cursor"]}
+    ).json()
+
+    # then
+    first_ids = [user["id"] for user in first_page["users"]]
+    second_ids = [user["id"] for user in second_page["users"]]
+    assert len(first_ids) == 3
+    assert first_page["next_cursor"]
+    assert not set(first_ids) & set(second_ids)
+
+
+def test_get_users_hides_surrogate_key(client, test_session):
+    # given
+    access_token = AuthenticateService.create_access_token("test_user")
+
+    # when
+    anonymous = client.get("/users/")
+    authorized = client.get(
+        "/users/", headers={"Authorization": f"Bearer {access_token}"}
+    )
+
+    # then: 응답 캐시의 내부 tag 는 저장하지 않는 응답에서도 밖으로 나가지 않는다
+    assert anonymous.status_code == authorized.status_code == 200
+    assert "Surrogate-Key" not in anonymous.headers
+    assert "Surrogate-Key" not in authorized.headers
+
+
+def test_sign_up_duplicate_username(client, test_session):
+    # given (autouse test_user fixture 가 test_user 를 만들어 둔다)
+
+    # when
+    response = client.post(
+        "/users/sign-up",
+        json={
+            "username": "test_user",
+            "password": "test_password",
+        },
+    )
+
+    # then
+    assert response.status_code == 409
+
+
+def test_username_availability(client, test_session):
+    # given
+
+    # when
+    taken = client.get("/users/availability", params={"username": "test_user"})
+    free = client.get("/users/availability", params={"username": "free_user"})
+
+    # then
+    assert taken.json() == {"username": "test_user", "available": False}
+    assert free.json() == {"username": "free_user", "available": True}
+
+
+def test_username_availability_ignores_case(client, test_session):
+    # given (MySQL 기본 collation 은 대소문자를 구분하지 않는다)
+
+    # when
+    taken = client.get("/users/availability", params={"username": "Test_User"})
+    sign_up = client.post(
+        "/users/sign-up",
+        json={"username": "TEST_USER", "password": "test_password"},
+    )
+
+    # then
+    assert taken.json() == {"username": "Test_User", "available": False}
+    assert sign_up.status_code == 409
+
+
+def test_get_users_batch(client, test_session):
+    # given
+    users = [
+        User.create(
+            username=f"batch_user_{i}",
+            password=AuthenticateService.hash_password("test_password"),
+        )
+        for i in range(3)
+    ]
+    test_session.add_all(users)
+    test_session.commit()
+    access_token = AuthenticateService.create_access_token("test_user")
+
+    # when
+    response = client.get(
+        "/users/batch",
+        params=[("ids", users[2].id), ("ids", 999_999), ("ids", users[0].id)],
+        headers={"Authorization": f"Bearer {access_token}"},
+    )
+
+    # then
+    assert response.status_code == 200
+    assert [user["id"] for user in response.json()["users"]] == [
+        users[2].id,
+        users[0].id,
+    ]
+    assert response.json()["missing_ids"] == [999_999]
+
+
+def test_get_user_not_modified(client, test_session):
+    # given
+    user = User.create(
+        username="etag_user",
+        password=AuthenticateService.hash_password("test_password"),
+    )
+    test_session.add(user)
+    test_session.commit()
+    headers = {
+        "Authorization": f"Bearer {AuthenticateService.create_access_token('test_user')}"
+    }
+
+    # when
+    first = client.get(f"/users/{user.id}", headers=headers)
+    second = client.get(
+        f"/users/{user.id}",
+        headers={**headers, "If-None-Match": first.headers["ETag"]},
+    )
+
+    # then
+    assert first.status_code == 200
+    assert first.headers["Last-Modified"]
+    assert second.status_code == 304
+    assert second.content == b""
+    assert second.headers["ETag"] == first.headers["ETag"]
+
+
+def sent_otp(test_session, email: str) -> int:
+    # outbox 에 마지막으로 들어간 인증 메일의 코드
+    outbox = (
+        test_session.query(EmailOutbox)
+        .filter(EmailOutbox.recipient == email)
+        .order_by(EmailOutbox.id.desc())
+        .first()
+    )
+    return int(re.search(r"\d{6}", outbox.body).group())
+
+
+def test_send_and_verify_email_otp(client, test_session):
+    # given
+    email = "otp@email.com"
+
+    # when
+    sent = client.post("/users/email/otp", json={"email": email})
+    otp = sent_otp(test_session, email)
+    before_commit = client.post(
+        "/users/email/otp/verify", json={"email": email, "otp": otp}
+    )
+    test_session.commit()  # 요청이 끝날 때 get_db 가 하는 커밋
+    verified = client.post("/users/email/otp/verify", json={"email": email, "otp": otp})
+    reused = client.post("/users/email/otp/verify", json={"email": email, "otp": otp})
+
+    # then: 코드는 메일이 커밋된 뒤에만 쓸 수 있고, 한 번만 쓸 수 있다
+    assert sent.status_code == 200
+    assert before_commit.status_code == 400
+    assert verified.status_code == 200
+    assert reused.status_code == 400
+
+
+def test_send_email_otp_cooldown_starts_before_commit(client, test_session):
+    # given
+    email = "otp@email.com"
+
+    # when
+    sent = client.post("/users/email/otp", json={"email": email})
+    throttled = client.post("/users/email/otp", json={"email": email})
+    test_session.commit()
+
+    # then: 커밋 전에 재발급 제한을 잡으므로 겹친 요청은 메일을 넣지 않는다
+    assert sent.status_code == 200
+    assert throttled.status_code == 429
+    assert 0 < int(throttled.headers["Retry-After"]) <= 60
+    assert test_session.query(EmailOutbox).filter_by(recipient=email).count() == 1
+    verified = client.post(
+        "/users/email/otp/verify",
+        json={"email": email, "otp": sent_otp(test_session, email)},
+    )
+    assert verified.status_code == 200
+
+
+def test_verify_email_otp_rejects_wrong_code(client, test_session):
+    # given
+    email = "otp@email.com"
+    client.post("/users/email/otp", json={"email": email})
+    test_session.commit()
+    wrong = 100_000 if sent_otp(test_session, email) != 100_000 else 100_001
+
+    # when
+    responses = [
+        client.post("/users/email/otp/verify", json={"email": email, "otp": wrong})
+        for _ in range(6)
+    ]
+
+    # then: 시도 횟수(5)를 넘으면 429
+    assert [r.status_code for r in responses] == [400] * 5 + [429]
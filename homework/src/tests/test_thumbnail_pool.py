@@ -0,0 +1,42 @@
+import os
+
+import pytest
+
+from core.storage.thumbnail_pool import ThumbnailPool, thumbnail_path
+
+Image = pytest.importorskip("PIL.Image")
+
+
+def test_thumbnails_are_created_in_process_pool(tmp_path):
+    # given
+    source = str(tmp_path / "image")
+    Image.new("P", (1000, 500), color=1).save(source, format="PNG")  # 팔레트 이미지
+    pool = ThumbnailPool(max_workers=1, max_pending=1)
+
+    # when
+    submitted = pool.submit(source, (128, 512))
+    pool.shutdown()  # 제출한 작업이 끝날 때까지 기다린다
+
+    # then
+    assert submitted
+    assert pool.stats()["completed"] == 1
+    for size in (128, 512):
+        with Image.open(thumbnail_path(source, size)) as thumbnail:
+            assert thumbnail.format == "WEBP"
+            assert thumbnail.size == (size, size // 2)  # 비율을 유지한다
+    assert sorted(os.listdir(tmp_path)) == ["image", "image_128.webp", "image_512.webp"]
+
+
+def test_non_image_file_is_counted_as_failed(tmp_path):
+    # given
+    source = tmp_path / "not_image"
+    source.write_bytes(b"not an image")
+    pool = ThumbnailPool(max_workers=1, max_pending=1)
+
+    # when
+    pool.submit(str(source), (128,))
+    pool.shutdown()
+
+    # then
+    assert pool.stats()["failed"] == 1
+    assert not os.path.exists(thumbnail_path(str(source), 128))
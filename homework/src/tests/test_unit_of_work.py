@@ -0,0 +1,59 @@
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session
+
+from core.database.unit_of_work import after_commit, after_rollback
+
+
+def test_after_commit_callbacks_wait_for_outer_commit():
+    # given
+    session = Session(create_engine("sqlite://"))
+    session.execute(text("SELECT 1"))
+    called = []
+
+    # when
+    after_commit(session, lambda: called.append("outer"))
+    with session.begin_nested():
+        after_commit(session, lambda: called.append("savepoint"))
+    called_before_commit = list(called)
+    session.commit()
+
+    # then
+    assert called_before_commit == []
+    assert called == ["outer", "savepoint"]
+
+
+def test_after_commit_callbacks_are_dropped_on_rollback():
+    # given
+    session = Session(create_engine("sqlite://"))
+    session.execute(text("SELECT 1"))
+    called = []
+
+    # when
+    after_commit(session, lambda: called.append("rolled back"))
+    session.rollback()
+    session.execute(text("SELECT 1"))
+    session.commit()
+
+    # then
+    assert called == []
+
+
+def test_after_rollback_callbacks_run_only_on_rollback():
+    # given
+    session = Session(create_engine("sqlite://"))
+    called = []
+
+    # when
+    session.execute(text("SELECT 1"))
+    after_rollback(session, lambda: called.append("committed"))
+    session.commit()
+    session.execute(text("SELECT 1"))
+    after_rollback(session, lambda: called.append("outer"))
+    with session.begin_nested() as savepoint:
+        savepoint.rollback()
+    called_after_savepoint = list(called)
+    session.rollback()
+
+    # then: savepoint 롤백은 바깥 트랜잭션의 작업을 실행하지 않는다
+    assert called_after_savepoint == []
+    assert called == ["outer"]
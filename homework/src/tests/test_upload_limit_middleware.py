@@ -0,0 +1,86 @@
+import asyncio
+
+from fastapi import FastAPI, UploadFile
+from fastapi.testclient import TestClient
+
+from core.middlewares.middlewares.upload_limit_middleware import (
+    UploadLimitMiddleware,
+)
+
+
+def build_app(calls: list) -> FastAPI:
+    app = FastAPI()
+
+    @app.post("/upload")
+    def upload_handler(file: UploadFile):
+        calls.append(file.filename)
+        return {"size": len(file.file.read())}
+
+    @app.post("/other")
+    def other_handler(file: UploadFile):
+        return {"size": len(file.file.read())}
+
+    app.add_middleware(UploadLimitMiddleware, limits={"/upload": 1024})
+    return app
+
+
+def test_upload_over_limit_is_rejected_before_form_parsing():
+    # given
+    calls = []
+    client = TestClient(build_app(calls))
+
+    # when
+    small = client.post("/upload", files={"file": ("a.png", b"x" * 100)})
+    large = client.post("/upload", files={"file": ("b.png", b"x" * 2048)})
+    other = client.post("/other", files={"file": ("c.png", b"x" * 2048)})
+
+    # then: Content-Length 로 거절하므로 handler(form 파싱)까지 가지 않는다
+    assert small.status_code == 200
+    assert large.status_code == 413
+    assert calls == ["a.png"]
+    assert other.json() == {"size": 2048}  # 제한 대상이 아닌 경로
+
+
+def test_chunked_upload_stops_reading_at_limit():
+    # given: Content-Length 없이 256 bytes 씩 100 번 나눠 오는 body
+    calls = []
+    app = build_app(calls)
+    boundary = "boundary"
+    header = (
+        f"--{boundary}\r\n"
+        'Content-Disposition: form-data; name="file"; filename="a.png"\r\n\r\n'
+    ).encode()
+    chunks = [header] + [b"x" * 256] * 100 + [f"\r\n--{boundary}--\r\n".encode()]
+    received, sent = [], []
+
+    async def receive():
+        received.append(1)
+        body = chunks[len(received) - 1]
+        return {
+            "type": "http.request",
+            "body": body,
+            "more_body": len(received) < len(chunks),
+        }
+
+    async def send(message):
+        sent.append(message)
+
+    scope = {
+        "type": "http",
+        "method": "POST",
+        "path": "/upload",
+        "raw_path": b"/upload",
+        "query_string": b"",
+        "root_path": "",
+        "headers": [
+            (b"content-type", f"multipart/form-data; boundary={boundary}".encode())
+        ],
+    }
+
+    # when
+    asyncio.run(app(scope, receive, send))
+
+    # then: 제한을 넘은 chunk 까지만 읽고 413
+    assert sent[0]["status"] == 413
+    assert calls == []
+    assert len(received) <= 6
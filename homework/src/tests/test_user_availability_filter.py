@@ -0,0 +1,53 @@
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from core.database.orm import Base
+from users.domains.user import User
+from users.repositorys.user_repository import UserRepository
+from users.repositorys.user_availability_filter import UserAvailabilityFilter
+
+
+def test_filter_matches_case_variants_like_mysql_collation():
+    # given
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine, tables=[User.__table__])
+    session_factory = sessionmaker(bind=engine)
+    with session_factory() as session:
+        session.add(User(username="test_user", password="x", email="Test@Email.com"))
+        session.commit()
+    availability = UserAvailabilityFilter(capacity=1_000, error_rate=0.001)
+
+    # when
+    availability.rebuild(session_factory)
+    availability.add("Café_User")
+
+    # then: 대소문자 / 악센트만 다른 값은 "있을 수도 있음" 으로 DB 에 넘긴다
+    assert availability.might_have_username("Test_User")
+    assert availability.might_have_username("TEST_USER")
+    assert availability.might_have_username("cafe_user")
+    assert availability.might_have_email("test@email.com")
+
+
+def test_bulk_import_duplicate_check_does_not_trust_stale_filter():
+    # given: 다른 워커가 rebuild 뒤에 만든 유저라서 filter 에 없다
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine, tables=[User.__table__])
+    session_factory = sessionmaker(bind=engine)
+    availability = UserAvailabilityFilter(capacity=1_000, error_rate=0.001)
+    availability.rebuild(session_factory)
+    with session_factory() as session:
+        session.add(User(username="new_user", password="x", email="new@email.com"))
+        session.commit()
+
+    # when
+    with session_factory() as session:
+        repo = UserRepository(
+            db=session, cache=None, availability=availability, response_cache=None
+        )
+        taken = repo.get_taken_usernames_and_emails(
+            usernames=["new_user", "free_user"], emails=["new@email.com"]
+        )
+
+    # then
+    assert not availability.might_have_username("new_user")
+    assert taken == ({"new_user"}, {"new@email.com"})
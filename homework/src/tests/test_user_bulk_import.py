@@ -0,0 +1,69 @@
+from contextlib import nullcontext
+
+from users.dtos.responses import UserBulkImportStatus
+from users.services.user_bulk_import_service import UserBulkImportService
+
+
+class FakeUserRepository:
+    # MySQL 처럼 대소문자를 구분하지 않고 이미 있는 username / email 을 찾는다
+    def __init__(self, usernames: list[str]):
+        self.usernames = usernames
+        self.saved = []
+
+    def get_taken_usernames_and_emails(self, usernames, emails):
+        requested = {username.casefold() for username in usernames}
+        return {u for u in self.usernames if u.casefold() in requested}, set()
+
+    def savepoint(self):
+        return nullcontext()
+
+    def bulk_save(self, users):
+        self.saved.extend(user.username for user in users)
+
+    def commit(self):
+        pass
+
+
+class FakeAuthenticateService:
+    def hash_passwords(self, passwords):
+        return ["$2b$12$" + "x" * 53 for _ in passwords]
+
+
+def test_bulk_import_compares_usernames_case_insensitively():
+    # given
+    repo = FakeUserRepository(usernames=["Existing"])
+    service = UserBulkImportService(repo=repo, auth_service=FakeAuthenticateService())
+    rows = [
+        {"username": "new_user", "password": "pw"},
+        {"username": "NEW_USER", "password": "pw"},
+        {"username": "existing", "password": "pw"},
+    ]
+
+    # when
+    response = service.import_users(items=service.parse_items(rows), batch_size=10)
+
+    # then
+    assert [r.status for r in response.results] == [
+        UserBulkImportStatus.CREATED,
+        UserBulkImportStatus.DUPLICATE,
+        UserBulkImportStatus.DUPLICATE,
+    ]
+    assert repo.saved == ["new_user"]
+
+
+def test_bulk_import_reports_invalid_rows_individually():
+    # given
+    repo = FakeUserRepository(usernames=[])
+    service = UserBulkImportService(repo=repo, auth_service=FakeAuthenticateService())
+    rows = [{"username": "ok", "password": "pw"}, {"username": "no_password"}, "x"]
+
+    # when
+    response = service.import_users(items=service.parse_items(rows), batch_size=10)
+
+    # then
+    assert response.created == 1
+    assert [r.status for r in response.results] == [
+        UserBulkImportStatus.CREATED,
+        UserBulkImportStatus.INVALID,
+        UserBulkImportStatus.INVALID,
+    ]
@@ -0,0 +1,64 @@
+import json
+import tracemalloc
+
+from sqlalchemy import insert
+from sqlalchemy.orm import sessionmaker
+
+from core.database.connection import get_session_factory
+from main import app
+from users.domains.user import User
+from users.repositorys.user_export_repository import UserExportRepository
+from users.services.user_export_service import UserExportService
+
+EXPORT_ROWS = 50_000
+
+
+def _insert_synthetic_users(test_session, count: int) -> None:
+    test_session.execute(
+        insert(User),
+        [{"username": f"export_{i}", "password": "x"} for i in range(count)],
+    )
+    test_session.flush()
+
+
+def test_export_users_ndjson(client, test_session):
+    # given
+    _insert_synthetic_users(test_session, count=10)
+    app.dependency_overrides[get_session_factory] = lambda: sessionmaker(
+        bind=test_session.connection()
+    )
+
+    # when
+    try:
+        response = client.get("/users/export")
+    finally:
+        app.dependency_overrides.pop(get_session_factory)
+
+    # then
+    lines = response.text.splitlines()
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert len(lines) == 11  # test_user fixture 포함
+    assert set(json.loads(lines[0])) == {"id", "username", "created_at"}
+
+
+def test_export_users_memory_is_bounded(test_session):
+    # given
+    _insert_synthetic_users(test_session, count=EXPORT_ROWS)
+    repo = UserExportRepository(
+        session_factory=sessionmaker(bind=test_session.connection())
+    )
+    export_service = UserExportService(repo=repo)
+
+    # when
+    tracemalloc.start()
+    exported = 0
+    for chunk in export_service.iter_users_ndjson(batch_size=500):
+        exported += chunk.count(b"\n")
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    # then
+    # 5만 행 전체를 ORM 객체 + DTO 로 올리면 수십 MB 가 필요하다
+    assert exported == EXPORT_ROWS + 1
+    assert peak < 5 * 1024 * 1024
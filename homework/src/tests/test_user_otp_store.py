@@ -0,0 +1,172 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from core.cache.backends import InMemoryCacheBackend
+from users.exceptions.custom_exceptions import (
+    InvalidOtpException,
+    OtpAttemptLimitException,
+    OtpRequestLimitException,
+)
+from users.repositorys.user_otp_store import UserOtpStore
+from users.services.user_service import UserService
+
+
+def create_store(
+    resend_cooldown_seconds: float = 0.0,
+    max_sends: int = 5,
+    maxsize: int = 100,
+    send_window_seconds: float = 3600,
+) -> UserOtpStore:
+    return UserOtpStore(
+        backend=InMemoryCacheBackend(maxsize=maxsize),
+        secret="test-secret",
+        ttl_seconds=300,
+        max_attempts=3,
+        resend_cooldown_seconds=resend_cooldown_seconds,
+        max_sends=max_sends,
+        send_window_seconds=send_window_seconds,
+    )
+
+
+def test_issued_otp_verifies_once():
+    # given
+    store = create_store()
+    otp = store.issue(email="Test@email.com")
+
+    # when
+    store.verify(email="test@email.com", otp=int(otp))
+
+    # then
+    assert 100_000 <= int(otp) <= 999_999
+    # 한 번 쓴 코드는 다시 쓸 수 없다
+    with pytest.raises(InvalidOtpException):
+        store.verify(email="test@email.com", otp=int(otp))
+    # 코드 원문은 저장하지 않는다
+    assert otp.encode() not in b"".join(v for _, v in store.backend._entries.values())
+
+
+def test_wrong_otp_is_rejected_until_attempt_limit():
+    # given
+    store = create_store()
+    otp = int(store.issue(email="test@email.com"))
+    wrong = 100_000 if otp != 100_000 else 100_001
+
+    # when
+    for _ in range(3):
+        with pytest.raises(InvalidOtpException):
+            store.verify(email="test@email.com", otp=wrong)
+
+    # then: 시도 횟수를 넘으면 맞는 코드도 거절하고 코드를 버린다
+    with pytest.raises(OtpAttemptLimitException):
+        store.verify(email="test@email.com", otp=otp)
+    assert store.stats()["rejected"] == 4
+
+    # 새로 발급하면 시도 횟수가 초기화된다
+    store.verify(email="test@email.com", otp=int(store.issue(email="test@email.com")))
+
+
+def test_resend_is_limited_by_cooldown_and_send_cap():
+    # given
+    cooldown_store = create_store(resend_cooldown_seconds=60)
+    capped_store = create_store(max_sends=2)
+    cooldown_store.issue(email="test@email.com")
+
+    # when
+    with pytest.raises(OtpRequestLimitException) as cooldown:
+        cooldown_store.issue(email="test@email.com")
+    capped_store.issue(email="test@email.com")
+    capped_store.issue(email="test@email.com")
+
+    # then
+    assert 0 < cooldown.value.retry_after <= 60
+    with pytest.raises(OtpRequestLimitException):
+        capped_store.issue(email="test@email.com")
+    # 다른 이메일에는 영향이 없다
+    capped_store.issue(email="other@email.com")
+
+
+def test_released_otp_does_not_count():
+    # given
+    store = create_store(resend_cooldown_seconds=60, max_sends=1)
+
+    # when: 메일을 넣는 트랜잭션이 롤백되어 release 했다
+    abandoned = store.prepare(email="test@email.com")
+    store.release(abandoned)
+    issued = store.prepare(email="test@email.com")
+    store.activate(issued)
+
+    # then: 버려진 코드는 쓸 수 없고, 재발급 제한은 release 한 것을 세지 않는다
+    with pytest.raises(InvalidOtpException):
+        store.verify(email="test@email.com", otp=int(abandoned.code))
+    store.verify(email="test@email.com", otp=int(issued.code))
+    assert store.stats()["issued"] == 1
+
+
+def test_concurrent_sends_enqueue_one_mail():
+    # given
+    class FakeUserRepository:
+        def exist_user_email(self, email: str) -> bool:
+            return False
+
+    class FakeEmailOutboxRepository:
+        def __init__(self):
+            self.enqueued = []
+
+        def enqueue(self, recipient, subject, body, on_commit=None, on_rollback=None):
+            self.enqueued.append(recipient)
+
+    outbox = FakeEmailOutboxRepository()
+    service = UserService(
+        repo=FakeUserRepository(),
+        auth_service=None,
+        email_outbox_repo=outbox,
+        otp_store=create_store(resend_cooldown_seconds=60),
+    )
+    barrier = threading.Barrier(8)
+
+    def send() -> bool:
+        barrier.wait()
+        try:
+            service.send_email_otp(email="test@email.com")
+            return True
+        except OtpRequestLimitException:
+            return False
+
+    # when: 아직 커밋(activate)되지 않은 요청들이 동시에 들어온다
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(lambda _: send(), range(8)))
+
+    # then
+    assert results.count(True) == 1
+    assert outbox.enqueued == ["test@email.com"]
+
+
+def test_send_cap_retry_after_is_remaining_window():
+    # given
+    store = create_store(max_sends=1, send_window_seconds=0.5)
+    store.issue(email="test@email.com")
+    time.sleep(0.2)
+
+    # when
+    with pytest.raises(OtpRequestLimitException) as capped:
+        store.issue(email="test@email.com")
+
+    # then: window 전체가 아니라 첫 발급부터 남은 시간
+    assert 0 < capped.value.retry_after <= 0.3
+
+
+def test_memory_backend_keeps_bounded_number_of_keys():
+    # given
+    store = create_store(maxsize=10)
+
+    # when
+    for i in range(100):
+        store.issue(email=f"user{i}@email.com")
+
+    # then: 오래된 코드부터 버린다
+    assert len(store.backend._entries) == 10
+    with pytest.raises(InvalidOtpException):
+        store.verify(email="user0@email.com", otp=123_456)
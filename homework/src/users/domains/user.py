@@ -1,10 +1,14 @@
 import re
 from datetime import datetime
+from typing import Iterable, NamedTuple
 
 from sqlalchemy import Column, Integer, String, DateTime, UniqueConstraint, Index
 
 from core.database.orm import Base
 
+# 유저 목록 응답의 surrogate key (유저가 바뀌면 purge)
+USERS_SURROGATE_KEY = "users"
+
 
 class User(Base):
     __tablename__ = "service_users"
@@ -12,7 +16,7 @@ class User(Base):
     __table_args__ = (
         UniqueConstraint("username", name="uix_service_user_username"),
         UniqueConstraint("email", name="uix_service_user_email"),
-        Index("ix_service_user_created_at", "created_at"),
+        Index("ix_service_user_created_at_id", "created_at", "id"),
     )
 
     id = Column(Integer, primary_key=True)
@@ -27,10 +31,54 @@ class User(Base):
         assert re.match(bcrypt_pattern, password_hash) is not None
 
     @classmethod
-    def create(cls, username: str, password: str):
+    def create(cls, username: str, password: str, email: str | None = None):
         cls._validate_passowrd(password_hash=password)
-        return cls(username=username, password=password)
+        return cls(username=username, password=password, email=email)
 
     def update_password(self, new_password: str) -> None:
         self._validate_passowrd(password_hash=new_password)
         self.password = new_password
+
+
+# 읽기 전용 조회에서 사용하는 컬럼 (password 제외, ORM 엔티티로 만들지 않는다)
+USER_READ_COLUMNS = (User.id, User.username, User.created_at)
+
+
+class UserReadRow(NamedTuple):
+    id: int
+    username: str
+    created_at: datetime
+
+
+def match_user_rows_by_username(
+    rows: Iterable[UserReadRow], usernames: Iterable[str]
+) -> dict[str, UserReadRow]:
+    # MySQL 기본 collation 은 대소문자를 구분하지 않으므로 IN 조회 결과를
+    # = 조회와 같은 기준으로 요청한 username 에 다시 연결한다
+    rows = list(rows)
+    by_username = {row.username: row for row in rows}
+    by_folded = {row.username.casefold(): row for row in rows}
+    matched = {}
+    for username in usernames:
+        row = by_username.get(username) or by_folded.get(username.casefold())
+        if row is not None:
+            matched[username] = row
+    return matched
+
+
+def merge_user_batch(
+    user_ids: list[int],
+    by_id: dict[int, UserReadRow],
+    usernames: list[str],
+    by_username: dict[str, UserReadRow],
+) -> tuple[list[UserReadRow], list[int], list[str]]:
+    # id / username 조회 결과를 요청 순서대로 합치고 없는 key 는 따로 모은다
+    users = {}
+    for row in [*map(by_id.get, user_ids), *map(by_username.get, usernames)]:
+        if row is not None:
+            # id 와 username 으로 같은 유저를 요청한 경우 한 번만 담는다
+            users.setdefault(row.id, row)
+
+    missing_ids = [user_id for user_id in user_ids if user_id not in by_id]
+    missing_usernames = [name for name in usernames if name not in by_username]
+    return list(users.values()), missing_ids, missing_usernames
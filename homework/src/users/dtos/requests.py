@@ -1,9 +1,13 @@
 from pydantic import BaseModel, constr, Field
 
+EMAIL_PATTERN = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
+
 
 class UserCreateRequestDto(BaseModel):
     username: str
     password: str
+    # 입력하면 가입 축하 메일을 보낸다
+    email: constr(pattern=EMAIL_PATTERN, max_length=30) | None = None
 
 
 class UserSignInRequestDto(BaseModel):
@@ -15,13 +19,16 @@ class UserUpdateRequestDto(BaseModel):
     password: str | None
 
 
-EMAIL_PATTERN = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
-
-
 class UserOtpRequestDto(BaseModel):
     email: constr(pattern=EMAIL_PATTERN) = Field(examples=["examples@email.com"])
 
 
+class UserBulkImportItemDto(BaseModel):
+    username: constr(min_length=1, max_length=16)
+    password: constr(min_length=1)
+    email: constr(pattern=EMAIL_PATTERN, max_length=30) | None = None
+
+
 class UserOtpVerifyRequestDto(BaseModel):
     email: constr(pattern=EMAIL_PATTERN) = Field(examples=["examples@email.com"])
-    otp: Field(..., ge=100_000, le=999_999)
+    otp: int = Field(..., ge=100_000, le=999_999)
@@ -1,8 +1,13 @@
 from datetime import datetime
 
+from enum import StrEnum
+from typing import Sequence
+
 from pydantic import BaseModel
+from sqlalchemy import Row
 
-from users.domains.user import User
+from core.http.conditional import make_etag
+from users.domains.user import User, UserReadRow
 
 
 class UserResponseDto(BaseModel):
@@ -11,5 +16,78 @@ class UserResponseDto(BaseModel):
     created_at: datetime
 
     @classmethod
-    def build(cls, user: User):
+    def build(cls, user: User | Row | UserReadRow):
         return cls(id=user.id, username=user.username, created_at=user.created_at)
+
+    # build 와 같은 값으로 만든다 (응답 내용이 바뀌면 ETag 도 바뀐다)
+    @staticmethod
+    def etag(user: User | Row | UserReadRow) -> str:
+        return make_etag(user.id, user.username, user.created_at)
+
+
+class UserPageResponseDto(BaseModel):
+    users: list[UserResponseDto]
+    next_cursor: str | None
+
+    @classmethod
+    def build(cls, users: Sequence[User | Row], next_cursor: str | None):
+        return cls(
+            users=[UserResponseDto.build(user=user) for user in users],
+            next_cursor=next_cursor,
+        )
+
+
+class UserBatchResponseDto(BaseModel):
+    users: list[UserResponseDto]
+    missing_ids: list[int]
+    missing_usernames: list[str]
+
+    @classmethod
+    def build(
+        cls,
+        users: Sequence[UserReadRow],
+        missing_ids: list[int],
+        missing_usernames: list[str],
+    ):
+        return cls(
+            users=[UserResponseDto.build(user=user) for user in users],
+            missing_ids=missing_ids,
+            missing_usernames=missing_usernames,
+        )
+
+
+class UserAvailabilityResponseDto(BaseModel):
+    username: str
+    available: bool
+
+    @classmethod
+    def build(cls, username: str, available: bool):
+        return cls(username=username, available=available)
+
+
+class UserBulkImportStatus(StrEnum):
+    CREATED = "created"
+    DUPLICATE = "duplicate"  # 이미 존재하거나 요청 안에서 중복된 username / email
+    INVALID = "invalid"
+    CONFLICT = "conflict"  # 동시에 가입한 유저와 unique 제약이 충돌하여 배치가 롤백됨
+
+
+class UserBulkImportResultDto(BaseModel):
+    index: int
+    username: str | None
+    status: UserBulkImportStatus
+    detail: str | None = None
+
+
+class UserBulkImportResponseDto(BaseModel):
+    created: int
+    failed: int
+    results: list[UserBulkImportResultDto]
+
+    @classmethod
+    def build(cls, results: list[UserBulkImportResultDto]):
+        results = sorted(results, key=lambda result: result.index)
+        created = sum(
+            result.status == UserBulkImportStatus.CREATED for result in results
+        )
+        return cls(created=created, failed=len(results) - created, results=results)
@@ -6,3 +6,19 @@ class UserNotFoundException(Exception):
 class InvalidPasswordException(Exception):
     def __init__(self):
         super().__init__("Invalid password.")
+
+
+class InvalidOtpException(Exception):
+    def __init__(self):
+        super().__init__("Invalid or expired OTP.")
+
+
+class OtpAttemptLimitException(Exception):
+    def __init__(self):
+        super().__init__("Too many OTP attempts. Request a new OTP.")
+
+
+class OtpRequestLimitException(Exception):
+    def __init__(self, retry_after: float):
+        super().__init__("Too many OTP requests.")
+        self.retry_after = retry_after
@@ -0,0 +1,30 @@
+from typing import AsyncIterator, Sequence
+
+from fastapi import Depends
+from sqlalchemy import Row, select
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from core.database.connection_async import get_async_session_factory
+from core.database.routing import READ_REPLICA
+from users.domains.user import USER_READ_COLUMNS, User
+
+
+class UserAsyncExportRepository:
+    # StreamingResponse 는 요청 의존성이 정리된 뒤에도 읽히므로 세션을 직접 연다
+    def __init__(
+        self,
+        session_factory: async_sessionmaker = Depends(get_async_session_factory),
+    ):
+        self.session_factory = session_factory
+
+    async def iter_user_rows(self, batch_size: int) -> AsyncIterator[Sequence[Row]]:
+        query = (
+            select(*USER_READ_COLUMNS)
+            .order_by(User.id)
+            .execution_options(yield_per=batch_size)
+        )
+        async with self.session_factory() as session:
+            # server-side cursor
+            result = await session.stream(query, bind_arguments=READ_REPLICA)
+            async for partition in result.partitions():
+                yield partition
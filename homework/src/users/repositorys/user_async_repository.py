@@ -1,22 +1,103 @@
+from datetime import datetime
+from typing import Sequence
+
 from fastapi import Depends
-from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import Row, and_, exists, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession, AsyncSessionTransaction
 
+from core.cache.read_through_cache import ReadThroughCache
+from core.cache.response_cache import ResponseCache, get_response_cache
 from core.database.connection_async import get_async_db
-from users.domains.user import User
+from core.database.routing import READ_REPLICA
+from core.database.unit_of_work import after_commit_async, release_connection_async
+from users.domains.user import (
+    USER_READ_COLUMNS,
+    USERS_SURROGATE_KEY,
+    User,
+    UserReadRow,
+    match_user_rows_by_username,
+)
+from users.repositorys.user_availability_filter import (
+    UserAvailabilityFilter,
+    get_user_availability_filter,
+)
+from users.repositorys.user_cache import get_user_cache, user_cache_keys
+from users.repositorys.user_loader import UserRowLoader, get_user_row_loader
 
 
 class UserAsyncRepository:
-    def __init__(self, db: AsyncSession = Depends(get_async_db)):
+    def __init__(
+        self,
+        db: AsyncSession = Depends(get_async_db),
+        cache: ReadThroughCache = Depends(get_user_cache),
+        availability: UserAvailabilityFilter = Depends(get_user_availability_filter),
+        loader: UserRowLoader = Depends(get_user_row_loader),
+        response_cache: ResponseCache = Depends(get_response_cache),
+    ):
         self.db = db
+        self.cache = cache
+        self.availability = availability
+        self.loader = loader
+        self.response_cache = response_cache
 
+    # 커밋은 요청이 끝날 때 get_async_db 가 한 번만 한다 (여기서는 flush 까지만)
     async def save(self, user: User) -> None:
         self.db.add(user)
-        await self.db.commit()
+        await self.db.flush()
+        self.availability.add(user.username, user.email)
+        self._invalidate_after_commit(*user_cache_keys(self.cache, user))
+
+    # 읽기 전용 조회: 엔티티 대신 필요한 컬럼만 Row 로 가져온다 (identity map 미사용)
+    async def get_user_rows_page(
+        self, limit: int, after: tuple[datetime, int] | None = None
+    ) -> Sequence[Row]:
+        # ix_service_user_created_at_id (created_at, id) 를 타는 keyset 조회
+        query = select(*USER_READ_COLUMNS)
+        if after is not None:
+            created_at, user_id = after
+            query = query.filter(
+                or_(
+                    User.created_at > created_at,
+                    and_(User.created_at == created_at, User.id > user_id),
+                )
+            )
+        result = await self.db.execute(
+            query.order_by(User.created_at, User.id).limit(limit),
+            bind_arguments=READ_REPLICA,
+        )
+        return result.all()
+
+    # 단건 조회: 캐시 -> (miss 시) loader 가 동시 요청들과 묶어서 IN 쿼리로 조회
+    # 캐시를 채우는 조회는 primary 로 보낸다 (replica 지연으로 쓰기 직후의 값을 놓치면
+    # 그 결과가 TTL 동안 캐시에 남기 때문)
+    async def get_user_row_by_id(self, user_id: int) -> UserReadRow | None:
+        return await self.cache.aget_or_load(
+            self.cache.key("id", user_id),
+            lambda: self.loader.by_id.load(user_id),
+        )
+
+    async def get_user_row_by_username(self, username: str) -> UserReadRow | None:
+        return await self.cache.aget_or_load(
+            self.cache.key("username", username),
+            lambda: self.loader.by_username.load(username),
+        )
+
+    # 여러 건을 한 번의 IN 쿼리로 조회한다 (요청한 key -> row, 없는 key 는 빠진다)
+    async def get_user_rows_by_ids(self, user_ids: list[int]) -> dict[int, UserReadRow]:
+        rows = await self._select_user_rows(User.id.in_(user_ids))
+        return {row.id: row for row in rows}
+
+    async def get_user_rows_by_usernames(
+        self, usernames: list[str]
+    ) -> dict[str, UserReadRow]:
+        rows = await self._select_user_rows(User.username.in_(usernames))
+        return match_user_rows_by_username(rows, usernames)
 
-    async def get_users(self) -> User | None:
-        result = await self.db.execute(select(User))
-        return result.scalars().all()
+    async def _select_user_rows(self, condition) -> list[UserReadRow]:
+        result = await self.db.execute(
+            select(*USER_READ_COLUMNS).where(condition), bind_arguments=READ_REPLICA
+        )
+        return [UserReadRow(*row) for row in result]
 
     async def get_user_by_username(self, username: str) -> User | None:
         result = await self.db.execute(
@@ -32,4 +113,33 @@ class UserAsyncRepository:
 
     async def delete(self, user: User) -> None:
         await self.db.delete(user)
-        await self.db.commit()
+        await self.db.flush()
+        self._invalidate_after_commit(*user_cache_keys(self.cache, user))
+
+    # Bloom filter 가 "확실히 없음" 이라고 하면 DB 를 조회하지 않는다
+    async def exist_username(self, username: str) -> bool:
+        if not self.availability.might_have_username(username):
+            return False
+        result = await self.db.execute(
+            select(exists().where(User.username == username)),
+            bind_arguments=READ_REPLICA,
+        )
+        return result.scalar()
+
+    def savepoint(self) -> AsyncSessionTransaction:
+        # async with repo.savepoint(): ... -> 예외가 나면 그 안의 변경만 롤백된다
+        return self.db.begin_nested()
+
+    async def release(self) -> None:
+        await release_connection_async(self.db)
+
+    async def rollback(self) -> None:
+        await self.db.rollback()
+
+    def _invalidate_after_commit(self, *keys: str) -> None:
+        # 커밋 전에 지우면 그 사이에 다른 요청이 이전 값을 다시 캐시할 수 있다
+        after_commit_async(self.db, lambda: self.cache.ainvalidate(*keys))
+        # 유저 목록 응답 캐시도 같은 시점에 지운다
+        after_commit_async(
+            self.db, lambda: self.response_cache.apurge(USERS_SURROGATE_KEY)
+        )
@@ -0,0 +1,93 @@
+import threading
+import unicodedata
+
+from sqlalchemy import select
+from sqlalchemy.orm import sessionmaker
+
+from core.cache.bloom_filter import BloomFilter
+from core.config import settings
+from core.database.routing import READ_REPLICA
+from users.domains.user import User
+
+
+class UserAvailabilityFilter:
+    """
+    username / email 사용 여부를 DB 없이 판단하기 위한 Bloom filter
+     - False: 확실히 사용 중이 아니다 -> DB 조회 생략
+     - True : 사용 중일 수도 있다 -> DB 로 확인
+    rebuild 전(ready=False)에는 항상 True 를 반환해서 DB 로 넘긴다.
+    삭제는 반영할 수 없고 다른 워커의 쓰기는 다음 rebuild 때 반영된다.
+    """
+
+    def __init__(self, capacity: int, error_rate: float):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.ready = False
+        self._usernames = BloomFilter(capacity=capacity, error_rate=error_rate)
+        self._emails = BloomFilter(capacity=capacity, error_rate=error_rate)
+        self._lock = threading.Lock()
+        # rebuild 도중 들어온 쓰기 (새 필터에 다시 반영한다)
+        self._pending: list[tuple[str | None, str | None]] | None = None
+
+    def rebuild(self, session_factory: sessionmaker, batch_size: int = 10_000) -> None:
+        with self._lock:
+            self._pending = []
+
+        usernames = BloomFilter(capacity=self.capacity, error_rate=self.error_rate)
+        emails = BloomFilter(capacity=self.capacity, error_rate=self.error_rate)
+
+        query = select(User.username, User.email).execution_options(
+            yield_per=batch_size
+        )
+        with session_factory() as session:
+            for username, email in session.execute(query, bind_arguments=READ_REPLICA):
+                self._add(usernames, emails, username, email)
+
+        with self._lock:
+            for username, email in self._pending:
+                self._add(usernames, emails, username, email)
+            self._pending = None
+            self._usernames, self._emails = usernames, emails
+            self.ready = True
+
+    def add(self, username: str | None, email: str | None = None) -> None:
+        with self._lock:
+            self._add(self._usernames, self._emails, username, email)
+            if self._pending is not None:
+                self._pending.append((username, email))
+
+    @staticmethod
+    def _add(
+        usernames: BloomFilter,
+        emails: BloomFilter,
+        username: str | None,
+        email: str | None,
+    ) -> None:
+        if username is not None:
+            usernames.add(_fold(username))
+        if email is not None:
+            emails.add(_fold(email))
+
+    def might_have_username(self, username: str) -> bool:
+        return not self.ready or self._usernames.might_contain(_fold(username))
+
+    def might_have_email(self, email: str) -> bool:
+        return not self.ready or self._emails.might_contain(_fold(email))
+
+
+def _fold(value: str) -> str:
+    # MySQL 기본 collation(utf8mb4_0900_ai_ci) 은 대소문자 / 악센트를 구분하지 않으므로 같이 접는다
+    # (더 많이 접으면 오탐만 늘어 DB 로 넘어갈 뿐이고, 덜 접으면 "확실히 없음" 이 틀린다)
+    decomposed = unicodedata.normalize("NFKD", value)
+    return "".join(c for c in decomposed if not unicodedata.combining(c)).casefold()
+
+
+user_availability_filter = UserAvailabilityFilter(
+    capacity=settings.user_bloom_capacity,
+    error_rate=settings.user_bloom_error_rate,
+)
+
+
+# 의존성 주입을 위한 함수
+def get_user_availability_filter() -> UserAvailabilityFilter:
+    return user_availability_filter
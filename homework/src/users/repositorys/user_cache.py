@@ -0,0 +1,45 @@
+import json
+from datetime import datetime
+
+from core.cache.backends import CacheBackend, create_cache_backend
+from core.cache.read_through_cache import ReadThroughCache
+from core.config import settings
+from users.domains.user import User, UserReadRow
+
+
+def _dumps(row: UserReadRow) -> bytes:
+    created_at = row.created_at.isoformat() if row.created_at else None
+    return json.dumps([row.id, row.username, created_at]).encode("UTF-8")
+
+
+def _loads(raw: bytes) -> UserReadRow:
+    user_id, username, created_at = json.loads(raw)
+    return UserReadRow(
+        id=user_id,
+        username=username,
+        created_at=datetime.fromisoformat(created_at) if created_at else None,
+    )
+
+
+# id / username 으로 조회한 UserReadRow 를 캐시한다 (password 는 캐시하지 않는다)
+def create_user_cache(backend: CacheBackend) -> ReadThroughCache:
+    return ReadThroughCache(
+        backend=backend,
+        namespace="user",
+        ttl_seconds=settings.user_cache_ttl_seconds,
+        negative_ttl_seconds=settings.user_cache_negative_ttl_seconds,
+        dumps=_dumps,
+        loads=_loads,
+    )
+
+
+user_cache = create_user_cache(backend=create_cache_backend())
+
+
+# 의존성 주입을 위한 함수
+def get_user_cache() -> ReadThroughCache:
+    return user_cache
+
+
+def user_cache_keys(cache: ReadThroughCache, user: User) -> list[str]:
+    return [cache.key("id", user.id), cache.key("username", user.username)]
@@ -0,0 +1,25 @@
+from typing import Iterator, Sequence
+
+from fastapi import Depends
+from sqlalchemy import Row, select
+from sqlalchemy.orm import sessionmaker
+
+from core.database.connection import get_session_factory
+from core.database.routing import READ_REPLICA
+from users.domains.user import USER_READ_COLUMNS, User
+
+
+class UserExportRepository:
+    # StreamingResponse 는 요청 의존성이 정리된 뒤에도 읽히므로 세션을 직접 연다
+    def __init__(self, session_factory: sessionmaker = Depends(get_session_factory)):
+        self.session_factory = session_factory
+
+    def iter_user_rows(self, batch_size: int) -> Iterator[Sequence[Row]]:
+        query = (
+            select(*USER_READ_COLUMNS)
+            .order_by(User.id)
+            .execution_options(yield_per=batch_size)  # server-side cursor
+        )
+        with self.session_factory() as session:
+            result = session.execute(query, bind_arguments=READ_REPLICA)
+            yield from result.partitions()
@@ -0,0 +1,66 @@
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from core.config import settings
+from core.database.connection_async import AsyncSessionFactory
+from core.database.data_loader import DataLoader
+from core.metrics.registry import metrics_registry
+from users.domains.user import (
+    USER_READ_COLUMNS,
+    User,
+    UserReadRow,
+    match_user_rows_by_username,
+)
+
+
+class UserRowLoader:
+    """
+    여러 요청의 id / username 단건 조회를 모아서 IN 쿼리 한 번으로 처리한다
+    요청들이 결과를 나눠 가지므로 요청 세션이 아닌 별도 세션에서 UserReadRow 만 조회한다
+    (엔티티는 요청 세션에 묶여야 하므로 get_user_by_id / get_user_by_username 은 대상이 아니다)
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker,
+        max_batch_size: int,
+        window_seconds: float,
+    ):
+        self.session_factory = session_factory
+        self.by_id: DataLoader[int, UserReadRow] = DataLoader(
+            batch_fn=self._load_by_ids,
+            max_batch_size=max_batch_size,
+            window_seconds=window_seconds,
+        )
+        self.by_username: DataLoader[str, UserReadRow] = DataLoader(
+            batch_fn=self._load_by_usernames,
+            max_batch_size=max_batch_size,
+            window_seconds=window_seconds,
+        )
+
+    async def _select_rows(self, condition) -> list[UserReadRow]:
+        async with self.session_factory() as session:
+            result = await session.execute(select(*USER_READ_COLUMNS).where(condition))
+            return [UserReadRow(*row) for row in result]
+
+    async def _load_by_ids(self, user_ids: list[int]) -> dict[int, UserReadRow]:
+        rows = await self._select_rows(User.id.in_(user_ids))
+        return {row.id: row for row in rows}
+
+    async def _load_by_usernames(self, usernames: list[str]) -> dict[str, UserReadRow]:
+        rows = await self._select_rows(User.username.in_(usernames))
+        return match_user_rows_by_username(rows, usernames)
+
+
+user_row_loader = UserRowLoader(
+    session_factory=AsyncSessionFactory,
+    max_batch_size=settings.user_loader_max_batch_size,
+    window_seconds=settings.user_loader_window_seconds,
+)
+metrics_registry.register("user.loader.by_id", user_row_loader.by_id.stats)
+metrics_registry.register("user.loader.by_username", user_row_loader.by_username.stats)
+
+
+# 의존성 주입을 위한 함수
+def get_user_row_loader() -> UserRowLoader:
+    return user_row_loader
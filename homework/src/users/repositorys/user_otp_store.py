@@ -0,0 +1,167 @@
+import hashlib
+import hmac
+import secrets
+import struct
+import threading
+import time
+from typing import NamedTuple
+
+from core.cache.backends import CacheBackend, create_cache_backend
+from core.config import settings
+from core.metrics.registry import metrics_registry
+from users.exceptions.custom_exceptions import (
+    InvalidOtpException,
+    OtpAttemptLimitException,
+    OtpRequestLimitException,
+)
+
+# code key 값: 발급 시각(epoch ms, 8 bytes) + HMAC 앞 16 bytes
+_ISSUED_AT = struct.Struct(">Q")
+_DIGEST_BYTES = 16
+
+
+class IssuedOtp(NamedTuple):
+    email: str
+    code: str
+
+
+class UserOtpStore:
+    """
+    이메일 OTP 발급 / 검증 (CacheBackend 의 TTL key 를 사용한다)
+     - otp:code:{email}     코드의 HMAC 과 발급 시각 (코드 원문은 저장하지 않는다)
+     - otp:attempts:{email} 현재 코드에 대한 검증 시도 횟수 (새로 발급하면 초기화)
+     - otp:cooldown:{email} 재발급 대기 시간 동안 있는 key
+     - otp:sends:{email}    send_window 동안의 발급 횟수
+    prepare() 가 대기 시간 / 발급 횟수를 원자적으로 잡고 코드를 만든다 (동시 요청도 하나만 통과한다)
+    메일을 outbox 에 넣는 트랜잭션이 커밋되면 activate() 가 코드를 저장하고,
+    롤백되면 release() 가 잡은 것을 돌려놓는다 (실패한 요청은 재발급 제한에 걸리지 않는다)
+    만료는 backend 가 key 단위로 처리한다 (redis TTL / memory 는 조회 시 확인) -> 전체 scan 이 없다
+    memory backend 는 maxsize 를 넘으면 오래된 key 부터 버리므로 메모리가 일정 이상 늘지 않는다
+    (버려진 코드는 만료된 것과 같다: 다시 발급받아야 하고, 시도 횟수 제한은 코드와 함께 사라진다)
+    """
+
+    def __init__(
+        self,
+        backend: CacheBackend,
+        secret: str,
+        ttl_seconds: float,
+        max_attempts: int,
+        resend_cooldown_seconds: float,
+        max_sends: int,
+        send_window_seconds: float,
+    ):
+        self.backend = backend
+        self._secret = secret.encode("UTF-8")
+        self.ttl_seconds = ttl_seconds
+        self.max_attempts = max_attempts
+        self.resend_cooldown_seconds = resend_cooldown_seconds
+        self.max_sends = max_sends
+        self.send_window_seconds = send_window_seconds
+        self._stats_lock = threading.Lock()
+        self._stats = dict.fromkeys(("issued", "verified", "rejected", "throttled"), 0)
+
+    def issue(self, email: str) -> str:
+        issued = self.prepare(email=email)
+        self.activate(issued)
+        return issued.code
+
+    def prepare(self, email: str) -> IssuedOtp:
+        email = email.lower()
+        cooldown_key = self._key("cooldown", email)
+        sends_key = self._key("sends", email)
+
+        # 확인과 기록을 한 번에 한다 (SET NX / INCR) -> 동시에 들어온 요청 중 하나만 통과한다
+        if self.resend_cooldown_seconds > 0 and not self.backend.add(
+            cooldown_key, b"1", ttl_seconds=self.resend_cooldown_seconds
+        ):
+            self._record("throttled")
+            raise OtpRequestLimitException(
+                retry_after=self.backend.ttl(cooldown_key)
+                or self.resend_cooldown_seconds
+            )
+
+        sends = self.backend.incr(sends_key, ttl_seconds=self.send_window_seconds)
+        if sends > self.max_sends:
+            # 넘친 횟수는 window 가 끝날 때 카운터와 함께 사라진다
+            self.backend.delete(cooldown_key)
+            self._record("throttled")
+            # window 는 첫 발급부터 시작하므로 남은 시간은 카운터의 ttl 이다
+            raise OtpRequestLimitException(
+                retry_after=self.backend.ttl(sends_key) or 1.0
+            )
+
+        return IssuedOtp(email, f"{secrets.randbelow(900_000) + 100_000}")
+
+    def activate(self, issued: IssuedOtp) -> None:
+        email, code = issued
+        self.backend.set(
+            self._key("code", email),
+            _ISSUED_AT.pack(int(time.time() * 1000)) + self._digest(email, code),
+            ttl_seconds=self.ttl_seconds,
+        )
+        self.backend.delete(self._key("attempts", email))
+        self._record("issued")
+
+    # 메일을 넣는 트랜잭션이 롤백되면 prepare 에서 잡은 대기 시간 / 발급 횟수를 돌려놓는다
+    def release(self, issued: IssuedOtp) -> None:
+        self.backend.delete(self._key("cooldown", issued.email))
+        self.backend.decr(self._key("sends", issued.email))
+
+    def verify(self, email: str, otp: int) -> None:
+        email = email.lower()
+        code_key = self._key("code", email)
+        attempts_key = self._key("attempts", email)
+
+        # 코드가 없어도 시도 횟수를 센다 (코드 유무에 따라 응답이 달라지지 않도록)
+        attempts = self.backend.incr(attempts_key, ttl_seconds=self.ttl_seconds)
+        if attempts > self.max_attempts:
+            self.backend.delete(code_key)
+            self._record("rejected")
+            raise OtpAttemptLimitException()
+
+        stored = self.backend.get(code_key)
+        digest = self._digest(email, str(otp))
+        # 길이가 같은 digest 끼리 상수 시간으로 비교한다
+        expected = (
+            stored[_ISSUED_AT.size :] if stored is not None else bytes(len(digest))
+        )
+        if not hmac.compare_digest(digest, expected) or stored is None:
+            self._record("rejected")
+            raise InvalidOtpException()
+
+        # 한 번 쓴 코드는 다시 쓸 수 없다
+        self.backend.delete(code_key, attempts_key)
+        self._record("verified")
+
+    def stats(self) -> dict:
+        with self._stats_lock:
+            return dict(self._stats)
+
+    def _record(self, name: str) -> None:
+        with self._stats_lock:
+            self._stats[name] += 1
+
+    def _digest(self, email: str, code: str) -> bytes:
+        message = f"{email}:{code}".encode("UTF-8")
+        return hmac.new(self._secret, message, hashlib.sha256).digest()[:_DIGEST_BYTES]
+
+    @staticmethod
+    def _key(kind: str, email: str) -> str:
+        return f"otp:{kind}:{email}"
+
+
+user_otp_store = UserOtpStore(
+    backend=create_cache_backend(maxsize=settings.otp_store_maxsize),
+    secret=settings.jwt_secret_key,
+    ttl_seconds=settings.otp_ttl_seconds,
+    max_attempts=settings.otp_max_attempts,
+    resend_cooldown_seconds=settings.otp_resend_cooldown_seconds,
+    max_sends=settings.otp_max_sends,
+    send_window_seconds=settings.otp_send_window_seconds,
+)
+metrics_registry.register("users.otp", user_otp_store.stats)
+
+
+# 의존성 주입을 위한 함수
+def get_user_otp_store() -> UserOtpStore:
+    return user_otp_store
@@ -1,21 +1,103 @@
+from datetime import datetime
+from typing import Sequence
+
 from fastapi import Depends
-from sqlalchemy import exists
-from sqlalchemy.orm import Session
+from sqlalchemy import Row, and_, exists, insert, or_, select
+from sqlalchemy.orm import Session, SessionTransaction
 
+from core.cache.read_through_cache import ReadThroughCache
+from core.cache.response_cache import ResponseCache, get_response_cache
 from core.database.connection import get_db
-from users.domains.user import User
+from core.database.routing import READ_REPLICA
+from core.database.unit_of_work import after_commit, release_connection
+from users.domains.user import (
+    USER_READ_COLUMNS,
+    USERS_SURROGATE_KEY,
+    User,
+    UserReadRow,
+    match_user_rows_by_username,
+)
+from users.repositorys.user_availability_filter import (
+    UserAvailabilityFilter,
+    get_user_availability_filter,
+)
+from users.repositorys.user_cache import get_user_cache, user_cache_keys
 
 
 class UserRepository:
-    def __init__(self, db: Session = Depends(get_db)):
+    def __init__(
+        self,
+        db: Session = Depends(get_db),
+        cache: ReadThroughCache = Depends(get_user_cache),
+        availability: UserAvailabilityFilter = Depends(get_user_availability_filter),
+        response_cache: ResponseCache = Depends(get_response_cache),
+    ):
         self.db = db
+        self.cache = cache
+        self.availability = availability
+        self.response_cache = response_cache
 
+    # 커밋은 요청이 끝날 때 get_db 가 한 번만 한다 (여기서는 flush 까지만)
     def save(self, user: User):
         self.db.add(user)
-        self.db.commit()
+        self.db.flush()
+        self.availability.add(user.username, user.email)
+        self._invalidate_after_commit(*user_cache_keys(self.cache, user))
+
+    # 읽기 전용 조회: 엔티티 대신 필요한 컬럼만 Row 로 가져온다 (identity map 미사용)
+    def get_user_rows_page(
+        self, limit: int, after: tuple[datetime, int] | None = None
+    ) -> Sequence[Row]:
+        # ix_service_user_created_at_id (created_at, id) 를 타는 keyset 조회
+        query = select(*USER_READ_COLUMNS)
+        if after is not None:
+            created_at, user_id = after
+            query = query.filter(
+                or_(
+                    User.created_at > created_at,
+                    and_(User.created_at == created_at, User.id > user_id),
+                )
+            )
+        return self.db.execute(
+            query.order_by(User.created_at, User.id).limit(limit),
+            bind_arguments=READ_REPLICA,
+        ).all()
+
+    # 단건 조회는 read-through 캐시를 먼저 확인한다
+    # 캐시를 채우는 조회는 primary 로 보낸다 (replica 지연으로 쓰기 직후의 값을 놓치면
+    # 그 결과가 TTL 동안 캐시에 남기 때문)
+    def get_user_row_by_id(self, user_id: int) -> UserReadRow | None:
+        return self.cache.get_or_load(
+            self.cache.key("id", user_id),
+            lambda: self._select_user_row(User.id == user_id),
+        )
+
+    def get_user_row_by_username(self, username: str) -> UserReadRow | None:
+        return self.cache.get_or_load(
+            self.cache.key("username", username),
+            lambda: self._select_user_row(User.username == username),
+        )
 
-    def get_users(self) -> User | None:
-        return self.db.query(User).all()
+    # 여러 건을 한 번의 IN 쿼리로 조회한다 (요청한 key -> row, 없는 key 는 빠진다)
+    def get_user_rows_by_ids(self, user_ids: list[int]) -> dict[int, UserReadRow]:
+        rows = self._select_user_rows(User.id.in_(user_ids))
+        return {row.id: row for row in rows}
+
+    def get_user_rows_by_usernames(
+        self, usernames: list[str]
+    ) -> dict[str, UserReadRow]:
+        rows = self._select_user_rows(User.username.in_(usernames))
+        return match_user_rows_by_username(rows, usernames)
+
+    def _select_user_rows(self, condition) -> list[UserReadRow]:
+        result = self.db.execute(
+            select(*USER_READ_COLUMNS).where(condition), bind_arguments=READ_REPLICA
+        )
+        return [UserReadRow(*row) for row in result]
+
+    def _select_user_row(self, condition) -> UserReadRow | None:
+        row = self.db.execute(select(*USER_READ_COLUMNS).where(condition)).first()
+        return None if row is None else UserReadRow(*row)
 
     def get_user_by_username(self, username: str) -> User | None:
         return self.db.query(User).filter(User.username == username).first()
@@ -25,10 +107,74 @@ class UserRepository:
 
     def delete(self, user: User):
         self.db.delete(user)
-        self.db.commit()
+        self.db.flush()
+        self._invalidate_after_commit(*user_cache_keys(self.cache, user))
 
+    # Bloom filter 가 "확실히 없음" 이라고 하면 DB 를 조회하지 않는다
     def exist_username(self, username: str) -> bool:
-        return self.db.query(exists().where(User.username == username)).scalar()
+        if not self.availability.might_have_username(username):
+            return False
+        return self.db.execute(
+            select(exists().where(User.username == username)),
+            bind_arguments=READ_REPLICA,
+        ).scalar()
 
     def exist_user_email(self, email: str) -> bool:
-        return self.db.query(exists().where(User.email == email)).scalar()
+        if not self.availability.might_have_email(email):
+            return False
+        return self.db.execute(
+            select(exists().where(User.email == email)),
+            bind_arguments=READ_REPLICA,
+        ).scalar()
+
+    def get_taken_usernames_and_emails(
+        self, usernames: list[str], emails: list[str]
+    ) -> tuple[set[str], set[str]]:
+        # 배치 전체의 중복 여부를 한 번의 쿼리로 확인한다
+        # (Bloom filter 로 거르지 않는다: 다른 워커의 쓰기는 다음 rebuild 전까지 모르므로
+        #  "확실히 없음" 으로 잘못 통과시키면 INSERT 가 실패해 배치 전체가 CONFLICT 가 된다)
+        rows = self.db.execute(
+            select(User.username, User.email).where(
+                or_(User.username.in_(usernames), User.email.in_(emails))
+            )
+        ).all()
+        return {row.username for row in rows}, {row.email for row in rows}
+
+    def bulk_save(self, users: list[User]) -> None:
+        # ORM unit of work 대신 executemany -> 드라이버가 multi-row INSERT 로 보낸다
+        self.db.execute(
+            insert(User),
+            [
+                {
+                    "username": user.username,
+                    "email": user.email,
+                    "password": user.password,
+                }
+                for user in users
+            ],
+        )
+        for user in users:
+            self.availability.add(user.username, user.email)
+        # 새 유저의 username 으로 남아 있을 수 있는 negative cache 를 지운다
+        self._invalidate_after_commit(
+            *(self.cache.key("username", user.username) for user in users)
+        )
+
+    def savepoint(self) -> SessionTransaction:
+        # with repo.savepoint(): ... -> 예외가 나면 그 안의 변경만 롤백된다
+        return self.db.begin_nested()
+
+    def release(self) -> None:
+        release_connection(self.db)
+
+    def commit(self) -> None:
+        self.db.commit()
+
+    def rollback(self) -> None:
+        self.db.rollback()
+
+    def _invalidate_after_commit(self, *keys: str) -> None:
+        # 커밋 전에 지우면 그 사이에 다른 요청이 이전 값을 다시 캐시할 수 있다
+        after_commit(self.db, lambda: self.cache.invalidate(*keys))
+        # 유저 목록 응답 캐시도 같은 시점에 지운다
+        after_commit(self.db, lambda: self.response_cache.purge(USERS_SURROGATE_KEY))
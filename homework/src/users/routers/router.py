@@ -1,16 +1,40 @@
-from fastapi import APIRouter, Path, status, Depends
+from typing import Any
+
+from fastapi import (
+    APIRouter,
+    Path,
+    Query,
+    Request,
+    Response,
+    UploadFile,
+    status,
+    Depends,
+)
+from fastapi.responses import StreamingResponse
 
 from core.authenticate.dtos.responses import JwtTokenResponseDto
-from users.dtos.responses import UserResponseDto
+from core.cache.response_cache import set_surrogate_keys
+from core.config import settings
+from core.http.conditional import evaluate_conditional
+from users.dtos.responses import (
+    UserAvailabilityResponseDto,
+    UserBatchResponseDto,
+    UserBulkImportResponseDto,
+    UserPageResponseDto,
+    UserResponseDto,
+)
 from users.dtos.requests import (
     UserCreateRequestDto,
     UserUpdateRequestDto,
     UserSignInRequestDto,
     UserOtpRequestDto,
+    UserOtpVerifyRequestDto,
 )
-from users.domains.user import User
+from users.domains.user import USERS_SURROGATE_KEY, User, UserReadRow
 from core.authenticate.services.authenticate_service import AuthenticateService
 from users.services.user_service import UserService
+from users.services.user_bulk_import_service import UserBulkImportService
+from users.services.user_export_service import UserExportService
 
 router = APIRouter(prefix="/users", tags=["Users"])
 
@@ -19,15 +43,72 @@ router = APIRouter(prefix="/users", tags=["Users"])
 
 @router.get(
     "/",
-    response_model=list[UserResponseDto],
-    description="유저 리스트를 반환하는 API입니다",
+    response_model=UserPageResponseDto,
+    description="유저 리스트를 cursor 기반으로 페이지 단위로 반환하는 API입니다",
     status_code=status.HTTP_200_OK,
 )
 def get_users_handler(
+    response: Response,
+    limit: int = Query(default=20, ge=1, le=100),
+    cursor: str | None = Query(default=None),
+    user_service: UserService = Depends(),
+):
+    users, next_cursor = user_service.get_users_page(limit=limit, cursor=cursor)
+
+    # 익명 요청이면 응답 캐시에 저장되고 유저가 바뀌면 purge 된다
+    set_surrogate_keys(response, USERS_SURROGATE_KEY)
+    return UserPageResponseDto.build(users=users, next_cursor=next_cursor)
+
+
+@router.get(
+    "/export",
+    response_class=StreamingResponse,
+    description="전체 유저를 NDJSON 으로 스트리밍하는 API입니다",
+    status_code=status.HTTP_200_OK,
+)
+def export_users_handler(
+    export_service: UserExportService = Depends(),
+):
+    return StreamingResponse(
+        export_service.iter_users_ndjson(),
+        media_type="application/x-ndjson",
+    )
+
+
+@router.get(
+    "/batch",
+    response_model=UserBatchResponseDto,
+    description="여러 유저를 id 또는 username 으로 한 번에 조회하는 API입니다",
+    status_code=status.HTTP_200_OK,
+)
+def get_users_batch_handler(
+    ids: list[int] = Query(default=[], max_length=settings.user_batch_max_size),
+    usernames: list[str] = Query(default=[], max_length=settings.user_batch_max_size),
+    _: str = Depends(AuthenticateService.get_username),
+    user_service: UserService = Depends(),
+):
+    users, missing_ids, missing_usernames = user_service.get_users_batch(
+        user_ids=ids, usernames=usernames
+    )
+
+    return UserBatchResponseDto.build(
+        users=users, missing_ids=missing_ids, missing_usernames=missing_usernames
+    )
+
+
+@router.get(
+    "/availability",
+    response_model=UserAvailabilityResponseDto,
+    description="username 사용 가능 여부를 반환하는 API입니다",
+    status_code=status.HTTP_200_OK,
+)
+def check_username_availability_handler(
+    username: str = Query(default=..., min_length=1, max_length=16),
     user_service: UserService = Depends(),
 ):
-    users: User | None = user_service.get_all_users()
-    return [UserResponseDto.build(user=user) for user in users]
+    available = user_service.is_username_available(username=username)
+
+    return UserAvailabilityResponseDto.build(username=username, available=available)
 
 
 @router.get(
@@ -37,11 +118,24 @@ def get_users_handler(
     status_code=status.HTTP_200_OK,
 )
 def get_user_handler(
+    request: Request,
+    response: Response,
     user_id: int = Path(default=..., ge=1),
     _: str = Depends(AuthenticateService.get_username),
     user_service: UserService = Depends(),
 ):
-    user: User | None = user_service.get_user_or_404_by_user_id(user_id=user_id)
+    # 유저 캐시에 있으면 DB 조회 없이 304 까지 처리된다
+    user: UserReadRow = user_service.get_user_or_404_by_user_id(user_id=user_id)
+
+    not_modified = evaluate_conditional(
+        request,
+        response,
+        etag=UserResponseDto.etag(user=user),
+        last_modified=user.created_at,
+        cache_control="private, no-cache",
+    )
+    if not_modified:
+        return not_modified
 
     return UserResponseDto.build(user=user)
 
@@ -56,7 +150,7 @@ def get_me_handler(
     username: str = Depends(AuthenticateService.get_username),
     user_service: UserService = Depends(),
 ):
-    user: User | None = user_service.get_user_or_404_by_username(username=username)
+    user: UserReadRow = user_service.get_user_or_404_by_username(username=username)
 
     return UserResponseDto.build(user=user)
 
@@ -102,11 +196,57 @@ def user_sign_up_handler(
     body: UserCreateRequestDto,
     user_service: UserService = Depends(),
 ):
-    new_user = user_service.create_user(username=body.username, password=body.password)
+    new_user = user_service.create_user(
+        username=body.username, password=body.password, email=body.email
+    )
 
     return UserResponseDto.build(user=new_user)
 
 
+@router.post(
+    "/bulk",
+    response_model=UserBulkImportResponseDto,
+    description="유저 대량 등록 API입니다 (JSON 배열)",
+    status_code=status.HTTP_200_OK,
+)
+def bulk_import_users_handler(
+    # 행마다 검증해서 잘못된 행은 invalid 결과로 돌려준다 (스키마: UserBulkImportItemDto)
+    body: list[Any],
+    batch_size: int = Query(
+        default=settings.user_bulk_import_batch_size,
+        ge=1,
+        le=settings.user_bulk_import_max_batch_size,
+    ),
+    _: str = Depends(AuthenticateService.get_username),
+    bulk_import_service: UserBulkImportService = Depends(),
+):
+    return bulk_import_service.import_users(
+        items=bulk_import_service.parse_items(body), batch_size=batch_size
+    )
+
+
+@router.post(
+    "/bulk/ndjson",
+    response_model=UserBulkImportResponseDto,
+    description="유저 대량 등록 API입니다 (NDJSON 파일 업로드)",
+    status_code=status.HTTP_200_OK,
+)
+def bulk_import_users_ndjson_handler(
+    file: UploadFile,
+    batch_size: int = Query(
+        default=settings.user_bulk_import_batch_size,
+        ge=1,
+        le=settings.user_bulk_import_max_batch_size,
+    ),
+    _: str = Depends(AuthenticateService.get_username),
+    bulk_import_service: UserBulkImportService = Depends(),
+):
+    return bulk_import_service.import_users(
+        items=bulk_import_service.parse_ndjson(file.file),
+        batch_size=batch_size,
+    )
+
+
 @router.post(
     "/sign-in",
     response_model=JwtTokenResponseDto,
@@ -134,5 +274,18 @@ def send_otp_handler(
     body: UserOtpRequestDto,
     user_service: UserService = Depends(),
 ) -> None:
-    user_service.validate_user_email_or_404(email=body.email)
+    user_service.send_email_otp(email=body.email)
+    return
+
+
+@router.post(
+    "/email/otp/verify",
+    status_code=status.HTTP_200_OK,
+    response_model=None,
+)
+def verify_otp_handler(
+    body: UserOtpVerifyRequestDto,
+    user_service: UserService = Depends(),
+) -> None:
+    user_service.verify_email_otp(email=body.email, otp=body.otp)
     return
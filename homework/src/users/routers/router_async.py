@@ -1,17 +1,33 @@
-from fastapi import APIRouter, Path, status, Depends, BackgroundTasks
-
+from fastapi import (
+    APIRouter,
+    Path,
+    Query,
+    Request,
+    Response,
+    status,
+    Depends,
+)
+from fastapi.responses import StreamingResponse
 
 from core.authenticate.dtos.responses import JwtTokenResponseDto
-from core.email import send_email
-from users.dtos.responses import UserResponseDto
+from core.cache.response_cache import set_surrogate_keys
+from core.config import settings
+from core.http.conditional import evaluate_conditional
+from users.dtos.responses import (
+    UserAvailabilityResponseDto,
+    UserBatchResponseDto,
+    UserPageResponseDto,
+    UserResponseDto,
+)
 from users.dtos.requests import (
     UserCreateRequestDto,
     UserUpdateRequestDto,
     UserSignInRequestDto,
 )
-from users.domains.user import User
+from users.domains.user import USERS_SURROGATE_KEY, User, UserReadRow
 from core.authenticate.services.authenticate_service import AuthenticateService
 from users.services.user_async_service import UserAsyncService
+from users.services.user_export_service import UserAsyncExportService
 
 router = APIRouter(prefix="/async/users", tags=["Async Users"])
 
@@ -20,16 +36,72 @@ router = APIRouter(prefix="/async/users", tags=["Async Users"])
 
 @router.get(
     "/",
-    response_model=list[UserResponseDto],
-    description="유저 리스트를 반환하는 API입니다",
+    response_model=UserPageResponseDto,
+    description="유저 리스트를 cursor 기반으로 페이지 단위로 반환하는 API입니다",
     status_code=status.HTTP_200_OK,
 )
 async def get_users_handler(
+    response: Response,
+    limit: int = Query(default=20, ge=1, le=100),
+    cursor: str | None = Query(default=None),
+    user_service: UserAsyncService = Depends(),
+):
+    users, next_cursor = await user_service.get_users_page(limit=limit, cursor=cursor)
+
+    # 익명 요청이면 응답 캐시에 저장되고 유저가 바뀌면 purge 된다
+    set_surrogate_keys(response, USERS_SURROGATE_KEY)
+    return UserPageResponseDto.build(users=users, next_cursor=next_cursor)
+
+
+@router.get(
+    "/export",
+    response_class=StreamingResponse,
+    description="전체 유저를 NDJSON 으로 스트리밍하는 API입니다",
+    status_code=status.HTTP_200_OK,
+)
+async def export_users_handler(
+    export_service: UserAsyncExportService = Depends(),
+):
+    return StreamingResponse(
+        export_service.iter_users_ndjson(),
+        media_type="application/x-ndjson",
+    )
+
+
+@router.get(
+    "/batch",
+    response_model=UserBatchResponseDto,
+    description="여러 유저를 id 또는 username 으로 한 번에 조회하는 API입니다",
+    status_code=status.HTTP_200_OK,
+)
+async def get_users_batch_handler(
+    ids: list[int] = Query(default=[], max_length=settings.user_batch_max_size),
+    usernames: list[str] = Query(default=[], max_length=settings.user_batch_max_size),
+    _: str = Depends(AuthenticateService.get_username),
+    user_service: UserAsyncService = Depends(),
+):
+    users, missing_ids, missing_usernames = await user_service.get_users_batch(
+        user_ids=ids, usernames=usernames
+    )
+
+    return UserBatchResponseDto.build(
+        users=users, missing_ids=missing_ids, missing_usernames=missing_usernames
+    )
+
+
+@router.get(
+    "/availability",
+    response_model=UserAvailabilityResponseDto,
+    description="username 사용 가능 여부를 반환하는 API입니다",
+    status_code=status.HTTP_200_OK,
+)
+async def check_username_availability_handler(
+    username: str = Query(default=..., min_length=1, max_length=16),
     user_service: UserAsyncService = Depends(),
 ):
-    users: User | None = await user_service.get_all_users()
+    available = await user_service.is_username_available(username=username)
 
-    return [UserResponseDto.build(user=user) for user in users]
+    return UserAvailabilityResponseDto.build(username=username, available=available)
 
 
 @router.get(
@@ -39,11 +111,24 @@ async def get_users_handler(
     status_code=status.HTTP_200_OK,
 )
 async def get_user_handler(
+    request: Request,
+    response: Response,
     user_id: int = Path(default=..., ge=1),
     _: str = Depends(AuthenticateService.get_username),
     user_service: UserAsyncService = Depends(),
 ):
-    user: User | None = await user_service.get_user_or_404_by_user_id(user_id=user_id)
+    # 유저 캐시에 있으면 DB 조회 없이 304 까지 처리된다
+    user: UserReadRow = await user_service.get_user_or_404_by_user_id(user_id=user_id)
+
+    not_modified = evaluate_conditional(
+        request,
+        response,
+        etag=UserResponseDto.etag(user=user),
+        last_modified=user.created_at,
+        cache_control="private, no-cache",
+    )
+    if not_modified:
+        return not_modified
 
     return UserResponseDto.build(user=user)
 
@@ -59,7 +144,7 @@ async def get_me_handler(
     username: str = Depends(AuthenticateService.get_username),
     user_service: UserAsyncService = Depends(),
 ):
-    user: User | None = await user_service.get_user_or_404_by_username(
+    user: UserReadRow = await user_service.get_user_or_404_by_username(
         username=username
     )
 
@@ -104,15 +189,12 @@ async def delete_me_handler(
 )
 async def user_sign_up_handler(
     body: UserCreateRequestDto,
-    background_task: BackgroundTasks,
     user_service: UserAsyncService = Depends(),
 ):
     new_user = await user_service.create_user(
-        username=body.username, password=body.password
+        username=body.username, password=body.password, email=body.email
     )
 
-    background_task.add_task(send_email, "회원가입을 축하합니다!")
-
     return UserResponseDto.build(user=new_user)
 
 
@@ -1,7 +1,15 @@
-from fastapi import Depends
+from typing import Sequence
+
+from fastapi import Depends, HTTPException
+from sqlalchemy import Row
+from sqlalchemy.exc import IntegrityError
 
 from core.authenticate.services.authenticate_service import AuthenticateService
-from users.domains.user import User
+from core.email.repositorys.email_outbox_async_repository import (
+    EmailOutboxAsyncRepository,
+)
+from users.domains.user import User, UserReadRow, merge_user_batch
+from users.services.user_cursor import decode_user_cursor, encode_user_cursor
 from users.exceptions.custom_exceptions import (
     InvalidPasswordException,
     UserNotFoundException,
@@ -14,36 +22,89 @@ class UserAsyncService:
         self,
         repo: UserAsyncRepository = Depends(),
         auth_service: AuthenticateService = Depends(),
+        email_outbox_repo: EmailOutboxAsyncRepository = Depends(),
     ):
         self.user_repo = repo
         self.auth_service = auth_service
+        self.email_outbox_repo = email_outbox_repo
 
-    async def create_user(self, username: str, password: str) -> User:
+    async def create_user(
+        self, username: str, password: str, email: str | None = None
+    ) -> User:
         new_user = User.create(
             username=username,
-            password=self.auth_service.hash_password(plain_password=password),
+            email=email,
+            password=await self.auth_service.hash_password_async(
+                plain_password=password
+            ),
         )
 
-        await self.user_repo.save(user=new_user)
+        # 중복 확인은 unique 제약(uix_service_user_username)에 맡긴다 -> 왕복 1회
+        try:
+            await self.user_repo.save(user=new_user)
+        except IntegrityError:
+            await self.user_repo.rollback()
+            raise HTTPException(status_code=409, detail="이미 존재하는 유저이다")
+
+        # 유저와 같은 트랜잭션에 쓴다 -> 가입이 커밋되어야만 메일이 나간다
+        if email is not None:
+            self.email_outbox_repo.enqueue(
+                recipient=email,
+                subject="회원가입을 축하합니다!",
+                body=f"{username} 님, 회원가입을 축하합니다!",
+            )
 
         return new_user
 
-    async def get_all_users(self) -> User | None:
-        users = await self.user_repo.get_users()
-
-        self._validate_user_or_raise(user=users)
+    async def is_username_available(self, username: str) -> bool:
+        return not await self.user_repo.exist_username(username=username)
+
+    async def get_users_page(
+        self, limit: int, cursor: str | None = None
+    ) -> tuple[Sequence[Row], str | None]:
+        after = decode_user_cursor(cursor) if cursor else None
+
+        # 다음 페이지 존재 여부를 알기 위해 한 건 더 조회한다
+        users = await self.user_repo.get_user_rows_page(limit=limit + 1, after=after)
+
+        if len(users) <= limit:
+            return users, None
+
+        users = users[:limit]
+        return users, encode_user_cursor(users[-1])
+
+    async def get_users_batch(
+        self, user_ids: list[int], usernames: list[str]
+    ) -> tuple[list[UserReadRow], list[int], list[str]]:
+        # 요청 순서대로 (id 먼저, 그다음 username) 반환하고 없는 key 는 따로 모은다
+        user_ids = list(dict.fromkeys(user_ids))
+        usernames = list(dict.fromkeys(usernames))
+        by_id = (
+            await self.user_repo.get_user_rows_by_ids(user_ids=user_ids)
+            if user_ids
+            else {}
+        )
+        by_username = (
+            await self.user_repo.get_user_rows_by_usernames(usernames=usernames)
+            if usernames
+            else {}
+        )
 
-        return users
+        return merge_user_batch(user_ids, by_id, usernames, by_username)
 
-    async def get_user_or_404_by_user_id(self, user_id: int) -> User:
-        user: User | None = await self.user_repo.get_user_by_id(user_id=user_id)
+    async def get_user_or_404_by_user_id(self, user_id: int) -> UserReadRow:
+        user: UserReadRow | None = await self.user_repo.get_user_row_by_id(
+            user_id=user_id
+        )
 
         self._validate_user_or_raise(user)
 
         return user
 
-    async def get_user_or_404_by_username(self, username: str) -> User:
-        user: User | None = await self.user_repo.get_user_by_username(username=username)
+    async def get_user_or_404_by_username(self, username: str) -> UserReadRow:
+        user: UserReadRow | None = await self.user_repo.get_user_row_by_username(
+            username=username
+        )
 
         self._validate_user_or_raise(user)
 
@@ -53,8 +114,12 @@ class UserAsyncService:
         user: User | None = await self.user_repo.get_user_by_username(username=username)
 
         self._validate_user_or_raise(user)
+        # 해싱하는 동안 커넥션을 붙잡지 않는다 (UPDATE 는 새 트랜잭션에서 실행된다)
+        await self.user_repo.release()
 
-        new_password = self.auth_service.hash_password(plain_password=password)
+        new_password = await self.auth_service.hash_password_async(
+            plain_password=password
+        )
         user.update_password(new_password=new_password)
         await self.user_repo.save(user)
 
@@ -71,8 +136,10 @@ class UserAsyncService:
         user: User | None = await self.user_repo.get_user_by_username(username=username)
 
         self._validate_user_or_raise(user)
+        # 비밀번호를 검증하는 동안 커넥션을 풀에 돌려준다
+        await self.user_repo.release()
 
-        if not self.auth_service.check_password(
+        if not await self.auth_service.check_password_async(
             input_password=password, hashed_password=user.password
         ):
             raise InvalidPasswordException()
@@ -83,6 +150,6 @@ class UserAsyncService:
         return access_token, refresh_token
 
     @staticmethod
-    def _validate_user_or_raise(user: User | None) -> None:
+    def _validate_user_or_raise(user: User | Row | UserReadRow | None) -> None:
         if user is None:
             raise UserNotFoundException()
@@ -0,0 +1,157 @@
+from typing import IO, Any, Iterable, Iterator
+
+from fastapi import Depends
+from pydantic import ValidationError
+from sqlalchemy.exc import IntegrityError
+
+from core.authenticate.services.authenticate_service import AuthenticateService
+from users.domains.user import User
+from users.dtos.requests import UserBulkImportItemDto
+from users.dtos.responses import (
+    UserBulkImportResponseDto,
+    UserBulkImportResultDto,
+    UserBulkImportStatus,
+)
+from users.repositorys.user_repository import UserRepository
+
+
+class UserBulkImportService:
+    def __init__(
+        self,
+        repo: UserRepository = Depends(),
+        auth_service: AuthenticateService = Depends(),
+    ):
+        self.user_repo = repo
+        self.auth_service = auth_service
+
+    def import_users(
+        self,
+        items: Iterable[UserBulkImportItemDto | ValidationError],
+        batch_size: int,
+    ) -> UserBulkImportResponseDto:
+        results: list[UserBulkImportResultDto] = []
+        seen_usernames: set[str] = set()
+        seen_emails: set[str] = set()
+        batch: list[tuple[int, UserBulkImportItemDto]] = []
+
+        for index, item in enumerate(items):
+            if isinstance(item, ValidationError):
+                results.append(
+                    UserBulkImportResultDto(
+                        index=index,
+                        username=None,
+                        status=UserBulkImportStatus.INVALID,
+                        detail=str(item),
+                    )
+                )
+                continue
+
+            # MySQL 기본 collation 과 같이 대소문자를 구분하지 않고 비교한다
+            username, email = _fold(item.username), _fold(item.email)
+            if username in seen_usernames or email in seen_emails:
+                results.append(
+                    UserBulkImportResultDto(
+                        index=index,
+                        username=item.username,
+                        status=UserBulkImportStatus.DUPLICATE,
+                        detail="요청 안에서 중복된 유저이다",
+                    )
+                )
+                continue
+
+            seen_usernames.add(username)
+            if email is not None:
+                seen_emails.add(email)
+
+            batch.append((index, item))
+            if len(batch) >= batch_size:
+                results.extend(self._import_batch(batch))
+                batch = []
+
+        if batch:
+            results.extend(self._import_batch(batch))
+
+        return UserBulkImportResponseDto.build(results=results)
+
+    # JSON 배열도 NDJSON 처럼 행마다 검증한다 (잘못된 행 하나 때문에 요청 전체를 거절하지 않는다)
+    @staticmethod
+    def parse_items(
+        rows: Iterable[Any],
+    ) -> Iterator[UserBulkImportItemDto | ValidationError]:
+        for row in rows:
+            try:
+                yield UserBulkImportItemDto.model_validate(row)
+            except ValidationError as exc:
+                yield exc
+
+    @staticmethod
+    def parse_ndjson(
+        lines: IO[bytes],
+    ) -> Iterator[UserBulkImportItemDto | ValidationError]:
+        for line in lines:
+            if not line.strip():
+                continue
+            try:
+                yield UserBulkImportItemDto.model_validate_json(line)
+            except ValidationError as exc:
+                yield exc
+
+    def _import_batch(
+        self, batch: list[tuple[int, UserBulkImportItemDto]]
+    ) -> list[UserBulkImportResultDto]:
+        taken_usernames, taken_emails = self.user_repo.get_taken_usernames_and_emails(
+            usernames=[item.username for _, item in batch],
+            emails=[item.email for _, item in batch if item.email is not None],
+        )
+        taken_usernames = {_fold(username) for username in taken_usernames}
+        taken_emails = {_fold(email) for email in taken_emails}
+
+        results: list[UserBulkImportResultDto] = []
+        pending: list[tuple[int, UserBulkImportItemDto]] = []
+        for index, item in batch:
+            if _fold(item.username) in taken_usernames or (
+                item.email is not None and _fold(item.email) in taken_emails
+            ):
+                results.append(
+                    UserBulkImportResultDto(
+                        index=index,
+                        username=item.username,
+                        status=UserBulkImportStatus.DUPLICATE,
+                        detail="이미 존재하는 유저이다",
+                    )
+                )
+            else:
+                pending.append((index, item))
+
+        if not pending:
+            return results
+
+        # 배치의 비밀번호를 모든 해싱 워커에 나눠서 처리한다
+        hashed_passwords = self.auth_service.hash_passwords(
+            [item.password for _, item in pending]
+        )
+        users = [
+            User.create(username=item.username, password=hashed, email=item.email)
+            for (_, item), hashed in zip(pending, hashed_passwords)
+        ]
+
+        # 충돌한 배치만 되돌리고, 큰 import 가 하나의 긴 트랜잭션이 되지 않도록 배치마다 커밋한다
+        try:
+            with self.user_repo.savepoint():
+                self.user_repo.bulk_save(users=users)
+            status, detail = UserBulkImportStatus.CREATED, None
+        except IntegrityError:
+            status, detail = UserBulkImportStatus.CONFLICT, "다시 시도해 주세요"
+        self.user_repo.commit()
+
+        results.extend(
+            UserBulkImportResultDto(
+                index=index, username=item.username, status=status, detail=detail
+            )
+            for index, item in pending
+        )
+        return results
+
+
+def _fold(value: str | None) -> str | None:
+    return value.casefold() if value is not None else None
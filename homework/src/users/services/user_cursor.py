@@ -0,0 +1,20 @@
+from datetime import datetime
+
+from sqlalchemy import Row
+
+from core.database.exceptions.custom_exceptions import InvalidCursorException
+from core.database.pagination import decode_cursor, encode_cursor
+from users.domains.user import User
+
+
+# 유저 목록 cursor = (created_at, id)
+def encode_user_cursor(user: User | Row) -> str:
+    return encode_cursor(user.created_at.isoformat(), user.id)
+
+
+def decode_user_cursor(cursor: str) -> tuple[datetime, int]:
+    created_at, user_id = decode_cursor(cursor, size=2)
+    try:
+        return datetime.fromisoformat(created_at), int(user_id)
+    except (TypeError, ValueError):
+        raise InvalidCursorException()
@@ -0,0 +1,47 @@
+import json
+from typing import AsyncIterator, Iterator, Sequence
+
+from fastapi import Depends
+from sqlalchemy import Row
+
+from core.config import settings
+from users.repositorys.user_async_export_repository import UserAsyncExportRepository
+from users.repositorys.user_export_repository import UserExportRepository
+
+
+def _to_ndjson_chunk(rows: Sequence[Row]) -> bytes:
+    # 한 partition(batch) 을 하나의 chunk 로 직렬화한다
+    return "".join(
+        json.dumps(
+            {
+                "id": row.id,
+                "username": row.username,
+                "created_at": row.created_at.isoformat() if row.created_at else None,
+            },
+            ensure_ascii=False,
+        )
+        + "\n"
+        for row in rows
+    ).encode("UTF-8")
+
+
+class UserExportService:
+    def __init__(self, repo: UserExportRepository = Depends()):
+        self.user_export_repo = repo
+
+    def iter_users_ndjson(
+        self, batch_size: int = settings.user_export_batch_size
+    ) -> Iterator[bytes]:
+        for rows in self.user_export_repo.iter_user_rows(batch_size=batch_size):
+            yield _to_ndjson_chunk(rows)
+
+
+class UserAsyncExportService:
+    def __init__(self, repo: UserAsyncExportRepository = Depends()):
+        self.user_export_repo = repo
+
+    async def iter_users_ndjson(
+        self, batch_size: int = settings.user_export_batch_size
+    ) -> AsyncIterator[bytes]:
+        async for rows in self.user_export_repo.iter_user_rows(batch_size=batch_size):
+            yield _to_ndjson_chunk(rows)
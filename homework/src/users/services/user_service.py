@@ -1,17 +1,27 @@
+from typing import Sequence
+
 from fastapi import Depends, HTTPException
+from sqlalchemy import Row
+from sqlalchemy.exc import IntegrityError
 
 from core.authenticate.services.authenticate_service import AuthenticateService
-from users.domains.user import User
+from core.config import settings
+from core.email.repositorys.email_outbox_repository import EmailOutboxRepository
+from users.domains.user import User, UserReadRow, merge_user_batch
+from users.services.user_cursor import decode_user_cursor, encode_user_cursor
 from users.exceptions.custom_exceptions import (
     InvalidPasswordException,
     UserNotFoundException,
 )
+from users.repositorys.user_otp_store import UserOtpStore, get_user_otp_store
 from users.repositorys.user_repository import UserRepository
 
 
 # 의존 관계
 # UserService <- UserRepository
 # UserService <- AuthenticateService
+# UserService <- EmailOutboxRepository
+# UserService <- UserOtpStore
 
 
 class UserService:
@@ -19,39 +29,87 @@ class UserService:
         self,
         repo: UserRepository = Depends(),
         auth_service: AuthenticateService = Depends(),
+        email_outbox_repo: EmailOutboxRepository = Depends(),
+        otp_store: UserOtpStore = Depends(get_user_otp_store),
     ):
         self.user_repo = repo
         self.auth_service = auth_service
+        self.email_outbox_repo = email_outbox_repo
+        self.otp_store = otp_store
 
-    def create_user(self, username: str, password: str) -> User:
-        if self.user_repo.exist_username(username=username):
-            raise HTTPException(status_code=409, detail="이미 존재하는 유저이다")
-
+    def create_user(
+        self, username: str, password: str, email: str | None = None
+    ) -> User:
         new_user = User.create(
             username=username,
+            email=email,
             password=self.auth_service.hash_password(plain_password=password),
         )
 
-        self.user_repo.save(user=new_user)
+        # 중복 확인은 unique 제약(uix_service_user_username)에 맡긴다 -> 왕복 1회
+        try:
+            self.user_repo.save(user=new_user)
+        except IntegrityError:
+            self.user_repo.rollback()
+            raise HTTPException(status_code=409, detail="이미 존재하는 유저이다")
 
-        return new_user
+        # 유저와 같은 트랜잭션에 쓴다 -> 가입이 커밋되어야만 메일이 나간다
+        if email is not None:
+            self.email_outbox_repo.enqueue(
+                recipient=email,
+                subject="회원가입을 축하합니다!",
+                body=f"{username} 님, 회원가입을 축하합니다!",
+            )
 
-    def get_all_users(self) -> User | None:
-        users = self.user_repo.get_users()
+        return new_user
 
-        self._validate_user_or_raise(user=users)
+    def is_username_available(self, username: str) -> bool:
+        return not self.user_repo.exist_username(username=username)
+
+    def get_users_page(
+        self, limit: int, cursor: str | None = None
+    ) -> tuple[Sequence[Row], str | None]:
+        after = decode_user_cursor(cursor) if cursor else None
+
+        # 다음 페이지 존재 여부를 알기 위해 한 건 더 조회한다
+        users = self.user_repo.get_user_rows_page(limit=limit + 1, after=after)
+
+        if len(users) <= limit:
+            return users, None
+
+        users = users[:limit]
+        return users, encode_user_cursor(users[-1])
+
+    def get_users_batch(
+        self, user_ids: list[int], usernames: list[str]
+    ) -> tuple[list[UserReadRow], list[int], list[str]]:
+        # 요청 순서대로 (id 먼저, 그다음 username) 반환하고 없는 key 는 따로 모은다
+        user_ids = list(dict.fromkeys(user_ids))
+        usernames = list(dict.fromkeys(usernames))
+        by_id = (
+            self.user_repo.get_user_rows_by_ids(user_ids=user_ids)
+            if user_ids
+            else {}
+        )
+        by_username = (
+            self.user_repo.get_user_rows_by_usernames(usernames=usernames)
+            if usernames
+            else {}
+        )
 
-        return users
+        return merge_user_batch(user_ids, by_id, usernames, by_username)
 
-    def get_user_or_404_by_user_id(self, user_id: int) -> User:
-        user: User | None = self.user_repo.get_user_by_id(user_id=user_id)
+    def get_user_or_404_by_user_id(self, user_id: int) -> UserReadRow:
+        user: UserReadRow | None = self.user_repo.get_user_row_by_id(user_id=user_id)
 
         self._validate_user_or_raise(user)
 
         return user
 
-    def get_user_or_404_by_username(self, username: str) -> User:
-        user: User | None = self.user_repo.get_user_by_username(username=username)
+    def get_user_or_404_by_username(self, username: str) -> UserReadRow:
+        user: UserReadRow | None = self.user_repo.get_user_row_by_username(
+            username=username
+        )
 
         self._validate_user_or_raise(user)
 
@@ -61,6 +119,8 @@ class UserService:
         user: User | None = self.user_repo.get_user_by_username(username=username)
 
         self._validate_user_or_raise(user)
+        # 해싱하는 동안 커넥션을 붙잡지 않는다 (UPDATE 는 새 트랜잭션에서 실행된다)
+        self.user_repo.release()
 
         new_password = self.auth_service.hash_password(plain_password=password)
         user.update_password(new_password=new_password)
@@ -79,6 +139,8 @@ class UserService:
         user: User | None = self.user_repo.get_user_by_username(username=username)
 
         self._validate_user_or_raise(user)
+        # 비밀번호를 검증하는 동안 커넥션을 풀에 돌려준다
+        self.user_repo.release()
 
         if not self.auth_service.check_password(
             input_password=password, hashed_password=user.password
@@ -94,7 +156,28 @@ class UserService:
         if self.user_repo.exist_user_email(email=email):
             raise HTTPException(status_code=409, detail="이미 존재하는 이메일이다")
 
+    def send_email_otp(self, email: str) -> None:
+        self.validate_user_email_or_404(email=email)
+
+        # 재발급 제한은 여기서 잡는다 (동시에 보낸 요청 중 하나만 메일을 넣는다)
+        otp = self.otp_store.prepare(email=email)
+        # 요청이 커밋되면 코드를 저장하고 outbox worker 가 바로 보낸다
+        # (롤백된 요청은 코드도 메일도 남지 않고 잡아 둔 재발급 제한도 돌려놓는다)
+        self.email_outbox_repo.enqueue(
+            recipient=email,
+            subject="이메일 인증 코드",
+            body=(
+                f"인증 코드: {otp.code}\n"
+                f"{int(settings.otp_ttl_seconds // 60)}분 안에 입력해 주세요."
+            ),
+            on_commit=lambda: self.otp_store.activate(otp),
+            on_rollback=lambda: self.otp_store.release(otp),
+        )
+
+    def verify_email_otp(self, email: str, otp: int) -> None:
+        self.otp_store.verify(email=email, otp=otp)
+
     @staticmethod
-    def _validate_user_or_raise(user: User | None) -> None:
+    def _validate_user_or_raise(user: User | Row | UserReadRow | None) -> None:
         if user is None:
             raise UserNotFoundException()